@@ -1,7 +1,19 @@
 import os
 import ast
+import sys
+from pathlib import Path
 from top_words import english_rank  # dicionário: palavra -> rank (1 = mais frequente)
 
+# índice de Hamming compartilhado (codigo_Artigo/indice_hamming.py)
+_PASTA_ARTIGO = str(Path(__file__).resolve().parent.parent / "codigo_Artigo")
+if _PASTA_ARTIGO not in sys.path:
+    sys.path.append(_PASTA_ARTIGO)
+
+from indice_hamming import IndiceHamming
+
+# palavras por comprimento em ordem de rank, consultadas por nº de letras diferentes
+indice_english_rank = IndiceHamming(sorted(english_rank.items(), key=lambda item: item[1]))
+
 # ---------- utilitários ----------
 def match_percent(a: str, b: str) -> float:
     """Percentual de caracteres iguais na mesma posição entre duas palavras do mesmo tamanho."""
@@ -152,17 +164,16 @@ def comparar_e_atualizar(arquivo_path="message_NEW.txt", final_path="message_NEW
         palavra = palavra_original.upper()
         tamanho = len(palavra)
 
-        candidatos = [p for p in english_rank.keys() if len(p) == tamanho]
+        # <<< comparação estrita: maior que 50%, NÃO aceita igual a 50% >>>
+        # match% > 50 e < 100  <=>  1 <= letras diferentes <= (tamanho - 1) // 2
+        max_diferencas = (tamanho - 1) // 2
 
         melhores = []
-        for cand in candidatos:
+        for cand, rank_value, _dist in indice_english_rank.vizinhos(palavra, max_diferencas, distancia_minima=1):
             if not _freq_aceitavel(palavra, cand):
                 continue
             pcent = match_percent(palavra, cand)
-            # <<< comparação estrita: maior que 50%, NÃO aceita igual a 50% >>>
-            if pcent > 50 and pcent < 100:
-                rank_value = english_rank.get(cand, 9999)
-                melhores.append((cand, pcent, rank_value))
+            melhores.append((cand, pcent, rank_value))
 
         if melhores:
             # escolhe pelo menor rank_value (mais frequente), e em empate, maior match% via key
@@ -16,10 +16,19 @@ Regras:
 - Imprime relatório completo das atualizações no dicionário.
 """
 import re
+import sys
 from collections import defaultdict
+from pathlib import Path
 from update_dictionary import update_map
 from top_words import english_rank
 
+# índice de Hamming compartilhado (codigo_Artigo/indice_hamming.py)
+_PASTA_ARTIGO = str(Path(__file__).resolve().parent.parent / "codigo_Artigo")
+if _PASTA_ARTIGO not in sys.path:
+    sys.path.append(_PASTA_ARTIGO)
+
+from indice_hamming import IndiceHamming
+
 MESSAGE_FILE = "message_NEW.txt"
 FINAL_FILE = "message_NEW_FINAL.txt"
 UPDATE_DICT_FILE = "update_dictionary.py"
@@ -36,7 +45,18 @@ def compatibility_score(a, b):
     matches = sum(1 for i in range(len(a)) if a[i] == b[i])
     return (matches / len(a)) * 100.0
 
-def choose_best_candidate_same_length(word, candidates):
+def choose_best_candidate_same_length(word, candidates, indice=None):
+    """
+    Maior compatibilidade e, no empate, menor rank. Com `indice` (IndiceHamming
+    sobre `candidates` em ordem de rank) a busca sai direto do bucket de menor
+    distância em vez de pontuar todas as candidatas.
+    """
+    if indice is not None:
+        encontrada = indice.mais_proxima(word, len(word))
+        if encontrada is None:
+            return None, -1.0, float("inf")
+        cand, rank, _dist = encontrada
+        return cand, compatibility_score(word, cand), rank
     best = None
     best_score = -1.0
     best_rank = float("inf")  # menor rank = mais frequente
@@ -88,6 +108,7 @@ def main():
     update_map_local = {k.upper(): v.upper() for k, v in update_map.items()}
     rank_dict = {k.upper(): int(v) for k, v in english_rank.items()}
     candidates = list(rank_dict.items())
+    indice = IndiceHamming(sorted(candidates, key=lambda item: item[1]))
 
     substituted_count = 0
     added_mappings = defaultdict(int)
@@ -122,7 +143,7 @@ def main():
 
         word = original.upper()
         word_after_map = apply_letter_map(word, update_map_local)
-        best_cand, best_score, best_rank = choose_best_candidate_same_length(word_after_map, candidates)
+        best_cand, best_score, best_rank = choose_best_candidate_same_length(word_after_map, candidates, indice)
 
         if best_cand and best_score >= MIN_COMPATIBILITY:
             for i in range(len(word_after_map)):
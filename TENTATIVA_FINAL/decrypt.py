@@ -145,6 +145,29 @@ def carregar_tokens_agrupados(sorted_path="encoded_message_sorted.txt", use_all=
     lengths = sorted(grupos.keys())
     return grupos, lengths
 
+def indexar_candidatos_por_tamanho(dict1, dict2, use_all):
+    """
+    Palavras de dict1 e depois dict2 (na ordem das chaves) agrupadas por
+    contar_len, calculado uma única vez por palavra. Palavras presentes nos
+    dois dicionários aparecem duas vezes, como na enumeração original.
+    """
+    por_tamanho = defaultdict(list)
+    for d in (dict1, dict2):
+        for w in d.keys():
+            por_tamanho[contar_len(w, use_all)].append(w)
+    return por_tamanho
+
+def iterar_candidatos(candidatos_por_tamanho, length, used_target_words):
+    """
+    Candidatos de um token, retomável: cada next() devolve o próximo alvo
+    de comprimento `length` ainda não usado. As palavras de um comprimento
+    só são marcadas como usadas pelo token corrente desse comprimento, então
+    o k-ésimo next() equivale à antiga enumeração com pos = k - 1.
+    """
+    for w in candidatos_por_tamanho.get(length, ()):
+        if w not in used_target_words:
+            yield w
+
 def mapping_conflicts_bidirectional(src_token, tgt_token, current_map):
     """
     src_token and tgt_token expected same length for aligned comparison.
@@ -291,9 +314,11 @@ def executar_codigo_b_silent(use_all=False):
     dict1 = carregar_dict_de_arquivo("1word_counts.py", "word_counts_english_rank")
     dict2 = carregar_dict_de_arquivo("2top_words.py", "top_words_english_rank")
 
+    candidatos_por_tamanho = indexar_candidatos_por_tamanho(dict1, dict2, use_all)
+
     mapa = OrderedDict()
     next_token_index = {l: 0 for l in lengths_order}
-    token_candidate_pos = {}
+    token_candidatos = {}
     exhausted_lengths = set()
     used_target_words = set()
 
@@ -308,27 +333,15 @@ def executar_codigo_b_silent(use_all=False):
                 exhausted_lengths.add(length)
                 continue
             token = candidates[idx]
-            pos = token_candidate_pos.get(token, 0)
-
-            # pick candidate by pos respecting used_target_words and length criterion (use_all governs length calc)
-            cand = None
-            idx_cand = 0
-            for d in (dict1, dict2):
-                for w in d.keys():
-                    if w in used_target_words:
-                        continue
-                    if contar_len(w, use_all) != length:
-                        continue
-                    if idx_cand == pos:
-                        cand = w
-                        break
-                    idx_cand += 1
-                if cand:
-                    break
+            if token not in token_candidatos:
+                token_candidatos[token] = iterar_candidatos(candidatos_por_tamanho, length, used_target_words)
+
+            # next candidate for this token (resumes after the last rejected one)
+            cand = next(token_candidatos[token], None)
 
             if not cand:
                 next_token_index[length] = idx + 1
-                token_candidate_pos.pop(token, None)
+                token_candidatos.pop(token, None)
                 if next_token_index[length] >= len(candidates):
                     exhausted_lengths.add(length)
                 continue
@@ -341,12 +354,10 @@ def executar_codigo_b_silent(use_all=False):
 
             # if lengths mismatch (possible if token cleaned removed chars), skip this candidate
             if len(src_for_check) != len(cand):
-                token_candidate_pos[token] = pos + 1
                 continue
 
             conflict, _ = mapping_conflicts_bidirectional(src_for_check, cand, mapa)
             if conflict:
-                token_candidate_pos[token] = pos + 1
                 continue
 
             # ACEITO: apply mapping over letters or all chars depending on mode
@@ -358,7 +369,7 @@ def executar_codigo_b_silent(use_all=False):
                 nova_atribuicao = True
 
             used_target_words.add(cand)
-            token_candidate_pos.pop(token, None)
+            token_candidatos.pop(token, None)
             next_token_index[length] = idx + 1
             if next_token_index[length] >= len(candidates):
                 exhausted_lengths.add(length)
@@ -421,9 +432,11 @@ def executar_codigo_b_debug(search_target=None, use_all=False):
     dict2 = carregar_dict_de_arquivo("2top_words.py", "top_words_english_rank")
     print(f"   Itens carregados (2): {len(dict2)}")
 
+    candidatos_por_tamanho = indexar_candidatos_por_tamanho(dict1, dict2, use_all)
+
     mapa = OrderedDict()
     next_token_index = {length: 0 for length in lengths_order}
-    token_candidate_pos = {}
+    token_candidatos = {}
     exhausted_lengths = set()
     used_target_words = set()
 
@@ -449,23 +462,11 @@ def executar_codigo_b_debug(search_target=None, use_all=False):
                 continue
 
             token_to_try = candidates[idx]
-            pos = token_candidate_pos.get(token_to_try, 0)
-
-            # find candidate respecting used_target_words and length criteria (use_all governs length calc)
-            cand = None
-            idx_cand = 0
-            for d in (dict1, dict2):
-                for w in d.keys():
-                    if w in used_target_words:
-                        continue
-                    if contar_len(w, use_all) != length:
-                        continue
-                    if idx_cand == pos:
-                        cand = w
-                        break
-                    idx_cand += 1
-                if cand:
-                    break
+            if token_to_try not in token_candidatos:
+                token_candidatos[token_to_try] = iterar_candidatos(candidatos_por_tamanho, length, used_target_words)
+
+            # next candidate for this token (resumes after the last rejected one)
+            cand = next(token_candidatos[token_to_try], None)
 
             fonte = None
             if cand:
@@ -477,7 +478,7 @@ def executar_codigo_b_debug(search_target=None, use_all=False):
                 detail = "todos candidatos usados/esgotados"
                 rows.append((length, token_to_try, "-", "-", "SEM CANDIDATO", detail, "-"))
                 next_token_index[length] = idx + 1
-                token_candidate_pos.pop(token_to_try, None)
+                token_candidatos.pop(token_to_try, None)
                 if next_token_index[length] >= len(candidates):
                     exhausted_lengths.add(length)
                     rows.append((length, "-", "-", "-", "ESGOTADO", "após avanço", "-"))
@@ -491,7 +492,6 @@ def executar_codigo_b_debug(search_target=None, use_all=False):
 
             # length check (if cleaning removed chars, lengths may mismatch)
             if len(src_for_check) != len(cand):
-                token_candidate_pos[token_to_try] = pos + 1
                 continue
 
             conflict, detail = mapping_conflicts_bidirectional(src_for_check, cand, mapa)
@@ -503,7 +503,6 @@ def executar_codigo_b_debug(search_target=None, use_all=False):
                     _, t_ch, existing_src, attempted_src = detail
                     reason = f"alvo {t_ch!r} já ocupado por {existing_src!r}, tentaria origem {attempted_src!r}"
                 rows.append((length, token_to_try, cand, fonte, "REJEITADO", reason, "-"))
-                token_candidate_pos[token_to_try] = pos + 1
                 continue
 
             # ACEITO
@@ -518,7 +517,7 @@ def executar_codigo_b_debug(search_target=None, use_all=False):
                 pares_adicionados_locais.append((s_ch, t_ch))
 
             used_target_words.add(cand)
-            token_candidate_pos.pop(token_to_try, None)
+            token_candidatos.pop(token_to_try, None)
             next_token_index[length] = idx + 1
 
             if added > 0:
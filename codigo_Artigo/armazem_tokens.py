@@ -0,0 +1,247 @@
+# ================================================================
+# armazem_tokens.py — armazém compacto de tokens do Passo 4
+#
+# Contém funções para:
+#  - internar o vocabulário de palavras cifradas (cada palavra distinta
+#    vira um id inteiro; tuplas de palavras_pos compartilham a mesma str)
+#  - guardar as colunas do texto em array (módulo array da stdlib):
+#      posicao, id_palavra, sufixo_inicio/sufixo_fim (offsets no texto)
+#      e o início de cada linha original
+#  - devolver palavras_pos e original_lines_by_pos (visão somente leitura
+#    sobre o texto, sem um dict de strings por linha)
+#  - guardar o estado do Passo 10 (posição -> id da palavra atual): cada
+#    mapeamento traduz uma vez cada palavra distinta do bloco, não cada posição
+#
+# As colunas usam array em vez de NumPy (não é dependência do projeto);
+# array.array expõe o buffer, então np.frombuffer funciona se necessário.
+# ================================================================
+
+import sys
+from array import array
+from collections.abc import Mapping
+from itertools import accumulate
+
+from tokenizador import limpar_token, varrer
+
+SEM_SUFIXO = -1
+
+
+class LinhasOriginais(Mapping):
+    """
+    original_lines_by_pos como visão: posicao -> linha original (antes da
+    limpeza), fatiada do texto do armazém sob demanda.
+    """
+
+    def __init__(self, armazem):
+        self._armazem = armazem
+
+    def __getitem__(self, posicao):
+        if not isinstance(posicao, int) or not 0 <= posicao < self._armazem.total_posicoes:
+            raise KeyError(posicao)
+        return self._armazem.linha(posicao)
+
+    def __iter__(self):
+        return iter(range(self._armazem.total_posicoes))
+
+    def __len__(self):
+        return self._armazem.total_posicoes
+
+    def __contains__(self, posicao):
+        return isinstance(posicao, int) and 0 <= posicao < self._armazem.total_posicoes
+
+
+class ArmazemTokens:
+    """
+    Tokens do Passo 4 em colunas:
+      texto          -> linhas originais unidas (um separador entre linhas)
+      inicio_linha   -> array('q') com o início de cada linha + sentinela final
+                        (linha p = texto[inicio_linha[p]:inicio_linha[p + 1] - 1])
+      posicoes       -> array('q') com a posição de cada palavra não vazia
+      ids            -> array('l') com o id da palavra (índice em vocabulario)
+      sufixo_inicio, sufixo_fim -> array('q') com o span do sufixo cortado
+                        ("'S", "-ING", "--Y") no texto, ou SEM_SUFIXO
+      vocabulario    -> lista de palavras distintas (id -> palavra)
+    """
+
+    def __init__(self):
+        self.texto = ""
+        self.inicio_linha = array("q", [0])
+        self.posicoes = array("q")
+        self.ids = array("l")
+        self.sufixo_inicio = array("q")
+        self.sufixo_fim = array("q")
+        self.vocabulario = []
+        self._id_por_palavra = {}
+
+    # ---------------------------
+    # Construção
+    # ---------------------------
+    @classmethod
+    def de_texto(cls, texto):
+        """Passo 4 a partir do texto decodificado (sem "\r"): colunas de tokenizador.varrer."""
+        armazem = cls()
+        armazem.texto = texto
+        colunas = varrer(texto)
+        armazem.inicio_linha = colunas.inicio_linha
+        armazem._preencher(colunas.posicoes, colunas.palavras, colunas.sufixos)
+        return armazem
+
+    @classmethod
+    def de_linhas(cls, linhas_com_posicao):
+        """
+        Passo 4 a partir de (posicao, linha_original) em ordem, como o gerado
+        por entrada_binaria.decodificar_em_fluxo. Posições puladas viram linhas vazias.
+        """
+        linhas = []
+        for posicao, linha in linhas_com_posicao:
+            if posicao > len(linhas):
+                linhas.extend([""] * (posicao - len(linhas)))
+            linhas.append(linha)
+        # um separador depois de cada linha: o último não abre linha nova
+        return cls.de_texto("".join([linha + "\n" for linha in linhas]))
+
+    @classmethod
+    def de_palavras_pos(cls, palavras_pos, linhas):
+        """
+        Monta o armazém com palavras já limpas (ex.: vindas do cache) e a lista
+        de linhas originais; só os sufixos são recalculados.
+        """
+        armazem = cls._de_lista(linhas)
+        intern = armazem.intern
+        armazem.posicoes = array("q", [pos for pos, _ in palavras_pos])
+        armazem.ids = array("l", [intern(palavra) for _, palavra in palavras_pos])
+        for pos in armazem.posicoes:
+            ini, fim = armazem._sufixo_da_linha(pos, armazem.linha(pos))
+            armazem.sufixo_inicio.append(ini)
+            armazem.sufixo_fim.append(fim)
+        return armazem
+
+    @classmethod
+    def _de_lista(cls, linhas):
+        armazem = cls()
+        armazem.texto = "\n".join(linhas)
+        armazem.inicio_linha = array("q", accumulate((len(linha) + 1 for linha in linhas), initial=0))
+        return armazem
+
+    def intern(self, palavra):
+        """Id da palavra no vocabulário (cria se for nova)."""
+        id_palavra = self._id_por_palavra.get(palavra)
+        if id_palavra is None:
+            id_palavra = len(self.vocabulario)
+            self._id_por_palavra[palavra] = id_palavra
+            self.vocabulario.append(palavra)
+        return id_palavra
+
+    def _preencher(self, posicoes, palavras, sufixos):
+        """Colunas de palavras: posições, ids (internação em lote) e spans [(índice, (ini, fim))] dos sufixos."""
+        # dict.fromkeys preserva a ordem da primeira ocorrência
+        for palavra in dict.fromkeys(palavras):
+            if palavra not in self._id_por_palavra:
+                self.intern(palavra)
+        base = len(self.posicoes)
+        self.posicoes.extend(posicoes)
+        self.ids.extend(map(self._id_por_palavra.__getitem__, palavras))
+        self.sufixo_inicio.extend(array("q", [SEM_SUFIXO]) * len(palavras))
+        self.sufixo_fim.extend(array("q", [SEM_SUFIXO]) * len(palavras))
+        for indice, (ini, fim) in sufixos:
+            self.sufixo_inicio[base + indice] = ini
+            self.sufixo_fim[base + indice] = fim
+
+    def _sufixo_da_linha(self, posicao, linha):
+        """Span absoluto do sufixo cortado por limpar_token, ou (SEM_SUFIXO, SEM_SUFIXO)."""
+        if linha.isalpha() and linha.isascii():
+            return SEM_SUFIXO, SEM_SUFIXO
+        _, sufixo = limpar_token(linha)
+        if not sufixo:
+            return SEM_SUFIXO, SEM_SUFIXO
+        # o sufixo termina onde termina a linha sem whitespace final
+        fim = self.inicio_linha[posicao] + len(linha.rstrip())
+        return fim - len(sufixo), fim
+
+    # ---------------------------
+    # Consulta
+    # ---------------------------
+    @property
+    def total_posicoes(self):
+        return len(self.inicio_linha) - 1
+
+    def __len__(self):
+        """Quantidade de palavras não vazias (tamanho de palavras_pos)."""
+        return len(self.posicoes)
+
+    def linha(self, posicao):
+        return self.texto[self.inicio_linha[posicao]:self.inicio_linha[posicao + 1] - 1]
+
+    def palavra(self, indice):
+        return self.vocabulario[self.ids[indice]]
+
+    def palavras_pos(self):
+        """[(posicao, palavra), ...] como no Passo 4; palavras iguais compartilham a str."""
+        return list(zip(self.posicoes, map(self.vocabulario.__getitem__, self.ids)))
+
+    def linhas_originais(self):
+        """original_lines_by_pos como Mapping somente leitura."""
+        return LinhasOriginais(self)
+
+    def memoria_aproximada(self):
+        """Bytes ocupados pelo texto, colunas e vocabulário (sem o overhead do dict de ids)."""
+        colunas = (self.inicio_linha, self.posicoes, self.ids, self.sufixo_inicio, self.sufixo_fim)
+        return (
+            sys.getsizeof(self.texto)
+            + sum(c.buffer_info()[1] * c.itemsize for c in colunas)
+            + sum(sys.getsizeof(p) for p in self.vocabulario)
+        )
+
+
+class EstadoPorId(Mapping):
+    """
+    Estado do Passo 10 como Mapping posicao -> palavra atual, guardado por id.
+    O vocabulário começa como cópia do vocabulário do armazém e cresce com as
+    palavras traduzidas; aplicar() traduz cada id distinto do bloco uma única
+    vez e só troca o id das posições.
+    """
+
+    def __init__(self, armazem, palavras_pos):
+        self.vocabulario = list(armazem.vocabulario)
+        self._id_por_palavra = dict(armazem._id_por_palavra)
+        intern = self._intern
+        self._id_por_pos = {pos: intern(palavra) for pos, palavra in palavras_pos}
+
+    def _intern(self, palavra):
+        id_palavra = self._id_por_palavra.get(palavra)
+        if id_palavra is None:
+            id_palavra = len(self.vocabulario)
+            self._id_por_palavra[palavra] = id_palavra
+            self.vocabulario.append(palavra)
+        return id_palavra
+
+    def __getitem__(self, posicao):
+        return self.vocabulario[self._id_por_pos[posicao]]
+
+    def __iter__(self):
+        return iter(self._id_por_pos)
+
+    def __len__(self):
+        return len(self._id_por_pos)
+
+    def __contains__(self, posicao):
+        return posicao in self._id_por_pos
+
+    def aplicar(self, mapeamentos, bloco):
+        """
+        Aplica os pares (cifrado, claro) às posições de `bloco` ([(pos, palavra), ...]),
+        como aplicar_mapeamentos_em_posicoes, com uma tradução por id distinto.
+        """
+        tabela = str.maketrans({c: v for c, v in mapeamentos if len(c) == 1})
+        if not tabela:
+            return
+        id_por_pos, vocabulario = self._id_por_pos, self.vocabulario
+        traduzidos = {}
+        for pos, _ in bloco:
+            id_atual = id_por_pos.get(pos)
+            if id_atual is None:
+                continue
+            novo = traduzidos.get(id_atual)
+            if novo is None:
+                novo = traduzidos[id_atual] = self._intern(vocabulario[id_atual].translate(tabela))
+            id_por_pos[pos] = novo
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+benchmark_armazem_tokens.py
+Compara a memória do estado do Passo 4 antes e depois do ArmazemTokens:
+  - anterior: palavras_pos (lista de tuplas, uma str por palavra) +
+    original_lines_by_pos (dict com uma str por linha)
+  - armazém: colunas em array + vocabulário internado; palavras_pos com
+    strs compartilhadas e original_lines_by_pos como visão sobre o texto
+e o tempo de aplicar_mapeamentos_em_posicoes (sem reconstruir o dict do flat).
+
+Uso:
+    python benchmark_armazem_tokens.py            -> ~10 MB de texto
+    python benchmark_armazem_tokens.py 32         -> ~32 MB de texto
+"""
+
+import gc
+import sys
+import time
+import tracemalloc
+
+from caracteres_printaveis import caracteres_printaveis
+from entrada_binaria import decodificar_mmap
+from armazem_tokens import ArmazemTokens
+from funcoes_decodificador import aplicar_mapeamentos_em_posicoes
+from tokenizador import limpar_token
+
+arquivo_base = "encoded.txt"
+
+
+# --- cópia da versão anterior ---------------------------------------------------
+def _aplicar_mapeamentos_legado(flat, mapeamentos, pos_targets):
+    parcial = {c: v for c, v in mapeamentos}
+    pos_to_word = {pos: pw for pos, pw in flat}
+    for pos in pos_targets:
+        palavra = pos_to_word.get(pos, "")
+        if not palavra:
+            continue
+        pos_to_word[pos] = "".join(parcial.get(ch, ch) for ch in palavra)
+    return [(pos, pos_to_word.get(pos, "")) for pos, _ in flat]
+# ------------------------------------------------------------------------------
+
+
+def _medir(func, *args):
+    """(resultado, bytes alocados que continuam vivos, segundos)."""
+    gc.collect()
+    tracemalloc.start()
+    inicio = time.perf_counter()
+    resultado = func(*args)
+    tempo = time.perf_counter() - inicio
+    atual, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return resultado, atual, tempo
+
+
+def _estado_legado(texto):
+    # Passo 4 anterior: dict com uma str por linha + limpeza linha a linha
+    original_lines_by_pos = dict(enumerate(texto.replace(" ", "\n").splitlines()))
+    palavras_pos = []
+    for posicao, linha in original_lines_by_pos.items():
+        palavra, _ = limpar_token(linha)
+        if palavra:
+            palavras_pos.append((posicao, palavra))
+    return palavras_pos, original_lines_by_pos
+
+
+def _estado_armazem(texto):
+    armazem = ArmazemTokens.de_texto(texto)
+    return armazem, armazem.palavras_pos(), armazem.linhas_originais()
+
+
+def main():
+    megabytes = float(sys.argv[1]) if len(sys.argv) > 1 else 10.0
+
+    base = decodificar_mmap(arquivo_base, caracteres_printaveis).replace("\r", "")
+    repeticoes = max(1, int(megabytes * 1024 * 1024 / (len(base) + 1)))
+    texto = " ".join([base] * repeticoes)
+    print(f"[RESULT] Texto: {len(texto) / 1024 / 1024:.1f} MB ({repeticoes} cópias de {arquivo_base} decodificado)")
+
+    (palavras_legado, linhas_legado), mem_legado, t_legado = _medir(_estado_legado, texto)
+    (armazem, palavras_pos, linhas), mem_armazem, t_armazem = _medir(_estado_armazem, texto)
+
+    if palavras_pos != palavras_legado or dict(linhas) != linhas_legado:
+        print("[RESULT] ERRO: armazém diverge do Passo 4 anterior!")
+        sys.exit(1)
+
+    mb = 1024 * 1024
+    print(f"[RESULT] Palavras: {len(armazem)} ({len(armazem.vocabulario)} distintas), "
+          f"posições: {armazem.total_posicoes}")
+    print(f"[RESULT] Memória anterior (lista + dict de linhas): {mem_legado / mb:.1f} MB em {t_legado:.2f}s")
+    print(f"[RESULT] Memória armazém (colunas + palavras_pos):  {mem_armazem / mb:.1f} MB em {t_armazem:.2f}s "
+          f"({mem_legado / mem_armazem:.1f}x menor)")
+    del palavras_legado, linhas_legado
+
+    # aplicar mapeamentos em um bloco pequeno (como no Passo 10)
+    alvo = {pos for pos, _ in palavras_pos[:500]}
+    mapeamentos = [(c, c.lower()) for c in "ETAOINSHR"]
+    ref, _, t_ref = _medir(_aplicar_mapeamentos_legado, palavras_pos, mapeamentos, alvo)
+    novo, _, t_novo = _medir(aplicar_mapeamentos_em_posicoes, palavras_pos, mapeamentos, alvo)
+    if novo != ref:
+        print("[RESULT] ERRO: aplicar_mapeamentos_em_posicoes diverge da versão anterior!")
+        sys.exit(1)
+    print(f"[RESULT] aplicar_mapeamentos_em_posicoes (bloco de {len(alvo)}): "
+          f"anterior {t_ref:.3f}s, atual {t_novo:.3f}s ({t_ref / t_novo:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+benchmark_busca_retrocesso.py
+Busca com retrocesso (busca_retrocesso.BuscaRetrocesso) sobre as palavras de
+uma entrada, com orçamentos de nós crescentes:
+  - nós visitados, tempo e nós/s (para calibrar limite_nos_retrocesso e
+    limite_segundos_retrocesso do decrypt.py)
+  - cobertura da melhor solução (letras do texto em palavras do dicionário)
+    e quantas vezes ela melhorou; a 1ª solução é a escolha gulosa em ordem de rank
+  - se a árvore foi esgotada (solução ótima) e quantas letras o mapa decide
+
+Uso:
+    python benchmark_busca_retrocesso.py                          -> encoded.txt
+    python benchmark_busca_retrocesso.py encoded_EXIST.txt 10 100 1000 0   (0 = sem limite)
+"""
+
+import re
+import string
+import sys
+
+from busca_retrocesso import BuscaRetrocesso
+from caracteres_printaveis import caracteres_printaveis
+from funcoes_decodificador import armazem_de_sequencias, decodificar_em_lote
+from indice_isomorfos import IndiceIsomorfos
+from top_words import top_words
+
+ORCAMENTOS_PADRAO = (10, 100, 1000, 0)
+
+
+def main():
+    arquivo = sys.argv[1] if len(sys.argv) > 1 else "encoded.txt"
+    orcamentos = [int(n) for n in sys.argv[2:]] or list(ORCAMENTOS_PADRAO)
+
+    with open(arquivo, "r", encoding="utf-8") as f:
+        sequencias = re.findall(f"[{re.escape(string.printable.strip())}]+", f.read())
+    palavras_pos = armazem_de_sequencias(decodificar_em_lote(sequencias, caracteres_printaveis)).palavras_pos()
+    indice = IndiceIsomorfos(sorted(top_words.items(), key=lambda item: item[1]))
+
+    for orcamento in orcamentos:
+        busca = BuscaRetrocesso(palavras_pos, indice, limite_nos=orcamento or None, limite_segundos=None)
+        busca.resolver()
+        e = busca.estatisticas()
+        if orcamento == orcamentos[0]:
+            print(f"[RESULT] {arquivo}: {len(palavras_pos)} palavras, {e['palavras']} distintas, "
+                  f"{e['com_candidatas']} com candidatas no dicionário "
+                  f"(cobertura máxima {e['cobertura_maxima']} letras)")
+        rotulo = f"{orcamento} nós" if orcamento else "sem limite"
+        print(f"[RESULT]   {rotulo:>12s}: {e['nos']:7d} nós em {e['segundos']:6.3f}s "
+              f"({e['nos_por_segundo']:8.0f} nós/s), cobertura {e['cobertura']:5d} "
+              f"({e['solucoes']} melhoria(s)), {e['letras_decididas']:2d} letras, "
+              f"{'ótima (árvore esgotada)' if e['completa'] else 'orçamento esgotado'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+benchmark_consistencia_arco.py
+Passo 10 do decrypt.py com cada motor (motor_passo10), na mesma entrada:
+  - "limiares": varredura por thresholds (limiares x blocos x palavras)
+  - "arco":     restrições + consistência de arco (consistencia_arco.py)
+O decrypt.py roda inteiro numa pasta temporária (checkpoints, cache e saídas
+não tocam esta pasta). Por motor: tempo total, palavras avaliadas (ocorrências
+varridas pelos thresholds / revisões de restrição), candidatas vindas do
+índice, testes candidata x domínios, letras no mapa final e se o texto
+reconstruído é o mesmo.
+
+Uso:
+    python benchmark_consistencia_arco.py                      -> encoded.txt
+    python benchmark_consistencia_arco.py encoded_EXIST.txt 20   (entrada repetida 20x)
+"""
+
+import contextlib
+import io
+import os
+import re
+import sys
+import tempfile
+import time
+
+import indice_isomorfos
+
+PASTA_ARTIGO = os.path.dirname(os.path.abspath(__file__))
+SCRIPT_DECRYPT = os.path.join(PASTA_ARTIGO, "decrypt.py")
+MOTORES = ("limiares", "arco")
+
+
+def _contar_candidatas(contador):
+    """Troca IndiceIsomorfos.candidatas por uma versão que conta o que o índice devolve."""
+    original = indice_isomorfos.IndiceIsomorfos.candidatas
+
+    def candidatas(self, palavra_atual):
+        for item in original(self, palavra_atual):
+            contador[0] += 1
+            yield item
+
+    indice_isomorfos.IndiceIsomorfos.candidatas = candidatas
+    return original
+
+
+def rodar_decrypt(motor, entrada, pasta):
+    """Executa decrypt.py com motor_passo10 = `motor` dentro de `pasta`; devolve (globais, segundos, candidatas)."""
+    with open(SCRIPT_DECRYPT, "r", encoding="utf-8") as f:
+        codigo, trocas = re.subn(r'^motor_passo10 = "\w+"', f'motor_passo10 = "{motor}"', f.read(), count=1, flags=re.M)
+    if not trocas:
+        raise RuntimeError("motor_passo10 não encontrado em decrypt.py")
+
+    contador = [0]
+    original = _contar_candidatas(contador)
+    argv, cwd, caminho = sys.argv, os.getcwd(), list(sys.path)
+    # checkpoints (final_map.py / candidatas_encolhidas.py) são importados da pasta de trabalho
+    for modulo in ("final_map", "candidatas_encolhidas"):
+        sys.modules.pop(modulo, None)
+    globais = {"__name__": "__main__", "__file__": SCRIPT_DECRYPT}
+    try:
+        os.chdir(pasta)
+        sys.path.insert(0, pasta)
+        sys.argv = [SCRIPT_DECRYPT, entrada]
+        inicio = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            exec(compile(codigo, SCRIPT_DECRYPT, "exec"), globais)
+        tempo = time.perf_counter() - inicio
+        with open("final_reconstructed.txt", "r", encoding="utf-8") as f:
+            globais["_texto_final"] = f.read()
+    finally:
+        indice_isomorfos.IndiceIsomorfos.candidatas = original
+        sys.argv = argv
+        sys.path[:] = caminho
+        os.chdir(cwd)
+    return globais, tempo, contador[0]
+
+
+def main():
+    arquivo = sys.argv[1] if len(sys.argv) > 1 else "encoded.txt"
+    repeticoes = int(sys.argv[2]) if len(sys.argv) > 2 else 1
+    with open(os.path.join(PASTA_ARTIGO, arquivo), "r", encoding="utf-8") as f:
+        base = f.read()
+
+    resultados = {}
+    for motor in MOTORES:
+        with tempfile.TemporaryDirectory() as pasta:
+            entrada = os.path.join(pasta, "entrada.txt")
+            with open(entrada, "w", encoding="utf-8") as f:
+                f.write(" ".join([base] * repeticoes))
+            resultados[motor] = rodar_decrypt(motor, entrada, pasta)
+
+    g_ref = resultados["limiares"][0]
+    print(f"[RESULT] {arquivo} x{repeticoes}: {len(g_ref['palavras_pos'])} palavras, "
+          f"{len(g_ref['armazem_tokens'].vocabulario)} distintas, {len(g_ref['blocos'])} blocos, "
+          f"{len(g_ref['thresholds'])} thresholds")
+    for motor, (g, tempo, candidatas) in resultados.items():
+        if motor == "arco":
+            estatisticas = g["estatisticas_arco"]
+            avaliadas = estatisticas["propagacoes"]
+            testes = estatisticas["verificacoes"]
+        else:
+            avaliadas = g["buscas_candidatas"] + g["buscas_evitadas"]
+            testes = candidatas  # encontrar_candidata_compatível testa cada candidata devolvida
+        print(f"[RESULT]   {motor:9s}: {tempo:6.2f}s, {avaliadas:6d} palavras avaliadas, "
+              f"{candidatas:5d} candidatas do índice, {testes:5d} testes de candidata, "
+              f"{len(g['mapa_substituicao'])} letras no mapa")
+    mesmo_texto = resultados["arco"][0]["_texto_final"] == g_ref["_texto_final"]
+    print(f"[RESULT] Texto reconstruído {'igual' if mesmo_texto else 'diferente'} entre os motores")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+benchmark_decodificacao.py
+Compara o caminho original dos Passos 2/3 (padronizar_para_8bits com while +
+buscar_e_substituir_por_dicionario) com o caminho em lote (decodificar_em_lote).
+
+Uso:
+    python benchmark_decodificacao.py            -> ~8 MB de entrada
+    python benchmark_decodificacao.py 32         -> ~32 MB de entrada
+
+A entrada é gerada repetindo encoded.txt até o tamanho pedido (em memória).
+"""
+
+import re
+import string
+import sys
+import time
+
+from caracteres_printaveis import caracteres_printaveis
+from funcoes_decodificador import (
+    padronizar_para_8bits,
+    buscar_e_substituir_por_dicionario,
+    decodificar_em_lote,
+)
+
+arquivo_base = "encoded.txt"
+
+
+def _padronizar_legado(sequencias):
+    # cópia da versão anterior de padronizar_para_8bits (um "0" por iteração)
+    sequencias_padronizadas = []
+    for seq in sequencias:
+        seq = seq.strip()
+        seq = seq.replace(" ", "")
+        while len(seq) % 8 != 0:
+            seq = "0" + seq
+        sequencias_padronizadas.append(seq)
+    return sequencias_padronizadas
+
+
+def _cronometrar(func, *args):
+    inicio = time.perf_counter()
+    resultado = func(*args)
+    return resultado, time.perf_counter() - inicio
+
+
+def main():
+    megabytes = float(sys.argv[1]) if len(sys.argv) > 1 else 8.0
+
+    with open(arquivo_base, "r", encoding="utf-8") as f:
+        base = f.read()
+    repeticoes = max(1, int(megabytes * 1024 * 1024 / max(1, len(base))))
+    data = " ".join([base] * repeticoes)
+
+    chars_regex = re.escape(string.printable.strip())
+    sequencias = re.findall(f"[{chars_regex}]+", data)
+    print(f"[RESULT] Entrada: {len(data) / 1024 / 1024:.1f} MB, {len(sequencias)} sequências")
+
+    pad_legado, t_pad_legado = _cronometrar(_padronizar_legado, sequencias)
+    dec_legado, t_dec_legado = _cronometrar(buscar_e_substituir_por_dicionario, pad_legado, caracteres_printaveis)
+    pad_novo, t_pad_novo = _cronometrar(padronizar_para_8bits, sequencias)
+    dec_lote, t_lote = _cronometrar(decodificar_em_lote, sequencias, caracteres_printaveis)
+
+    if pad_novo != pad_legado or dec_lote != dec_legado:
+        print("[RESULT] ERRO: caminho em lote diverge do caminho original!")
+        sys.exit(1)
+
+    t_original = t_pad_legado + t_dec_legado
+    print(f"[RESULT] Original (while + dicionário): {t_original:.3f}s "
+          f"(padronizar {t_pad_legado:.3f}s, dicionário {t_dec_legado:.3f}s)")
+    print(f"[RESULT] padronizar_para_8bits (rjust): {t_pad_novo:.3f}s")
+    print(f"[RESULT] decodificar_em_lote:           {t_lote:.3f}s")
+    print(f"[RESULT] Speedup Passos 2+3: {t_original / t_lote:.1f}x (saídas idênticas)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+benchmark_dicionario.py
+Compara a busca da "primeira candidata não usada de comprimento n" feita
+antes em aplicar_substitucoes_por_bloco / gerar_mapeamentos_por_bloco /
+gerar_mapeamentos_para_primeira_palavra (sorted(top_words) a cada chamada +
+varredura) com a classe Dicionario (ordenação única + cursor por comprimento),
+consumindo o dicionário sintético palavra a palavra.
+
+Uso:
+    python benchmark_dicionario.py               -> 100 mil palavras, 2000 blocos
+    python benchmark_dicionario.py 1000000 500
+"""
+
+import random
+import sys
+import time
+
+from benchmark_indice_posicional import gerar_dicionario
+from funcoes_decodificador import Dicionario, gerar_mapeamentos_por_bloco
+
+
+def _primeira_candidata_varredura(top_words, tamanho, usadas):
+    """Caminho anterior: ordena top_words e varre até achar a palavra."""
+    top_sorted = sorted(top_words.items(), key=lambda item: item[1])
+    for w, _rank in top_sorted:
+        if len(w) == tamanho and w not in usadas:
+            return w
+    return None
+
+
+def _gerar_blocos(total, semente=5):
+    """Blocos como os do Passo 5: uma palavra cifrada de cada comprimento."""
+    rng = random.Random(semente)
+    letras = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+    return [
+        [(i * 16 + t, "".join(rng.choices(letras, k=t))) for t in range(2, 13)]
+        for i in range(total)
+    ]
+
+
+def main():
+    total_palavras = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    total_blocos = int(sys.argv[2]) if len(sys.argv) > 2 else 2000
+
+    top_words = dict(gerar_dicionario(total_palavras))
+    blocos = _gerar_blocos(total_blocos)
+    print(f"[RESULT] Dicionário: {len(top_words)} palavras; {len(blocos)} blocos de {len(blocos[0])} palavras")
+
+    # caminho anterior (amostra: o custo por bloco não depende de quantos blocos vieram antes)
+    amostra = blocos[: max(1, min(len(blocos), 20))]
+    usadas = set()
+    inicio = time.perf_counter()
+    ref = []
+    for bloco in amostra:
+        escolhidas = []
+        for _pos, palavra in bloco:
+            w = _primeira_candidata_varredura(top_words, len(palavra), usadas)
+            if w:
+                usadas.add(w)
+                escolhidas.append(w)
+        ref.append(escolhidas)
+    t_antes = (time.perf_counter() - inicio) / len(amostra)
+
+    dicionario = Dicionario(top_words)
+    inicio = time.perf_counter()
+    novo = []
+    for bloco in blocos:
+        escolhidas = []
+        for _pos, palavra in bloco:
+            w = dicionario.proxima_disponivel(len(palavra))
+            if w:
+                dicionario.marcar_usada(w)
+                escolhidas.append(w)
+        novo.append(escolhidas)
+    t_depois = (time.perf_counter() - inicio) / len(blocos)
+
+    if novo[: len(ref)] != ref:
+        print("[RESULT] ERRO: Dicionario diverge da varredura!")
+        sys.exit(1)
+    print(f"[RESULT] sorted + varredura: {t_antes * 1e3:.3f} ms/bloco")
+    print(f"[RESULT] Dicionario:         {t_depois * 1e3:.4f} ms/bloco ({t_antes / t_depois:.0f}x)")
+
+    # helper completo, com o mesmo Dicionario reaproveitado entre blocos
+    dicionario = Dicionario(top_words)
+    inicio = time.perf_counter()
+    for bloco in blocos:
+        gerar_mapeamentos_por_bloco(bloco, dicionario)
+    t_helper = (time.perf_counter() - inicio) / len(blocos)
+    print(f"[RESULT] gerar_mapeamentos_por_bloco com Dicionario: {t_helper * 1e3:.4f} ms/bloco")
+
+
+if __name__ == "__main__":
+    main()
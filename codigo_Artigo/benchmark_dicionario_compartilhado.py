@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+benchmark_dicionario_compartilhado.py
+Início de N processos trabalhadores que precisam do dicionário:
+  - cada um executa o módulo .py e monta top_sorted, top_set_normalized,
+    IndiceIsomorfos e Dicionario (o que decrypt.py faz sozinho)
+  - cada um só anexa o bloco publicado uma vez em memória compartilhada
+    (dicionario_compartilhado.py)
+Mede, por processo, o tempo até estar pronto e a memória residente privada
+(RssAnon de /proc/self/status, Linux; o bloco compartilhado não entra), e
+confere que as candidatas são as mesmas.
+
+Uso:
+    python benchmark_dicionario_compartilhado.py              -> 200 mil palavras, 4 processos
+    python benchmark_dicionario_compartilhado.py 500000 8
+"""
+
+import importlib.util
+import os
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
+from benchmark_indice_posicional import gerar_consultas, gerar_dicionario
+from dicionario_compartilhado import DicionarioCompartilhado, DicionarioPublicado
+from funcoes_decodificador import Dicionario
+from indice_isomorfos import IndiceIsomorfos
+
+
+def _normalizar_token(t):
+    return t.strip().lower()
+
+
+def _montar_do_modulo(caminho_py):
+    spec = importlib.util.spec_from_file_location("top_words_mod", caminho_py)
+    mod = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(mod)
+    top_words = mod.top_words
+    top_set_normalized = {_normalizar_token(w) for w in top_words}
+    top_sorted = sorted(top_words.items(), key=lambda item: item[1])
+    return top_set_normalized, IndiceIsomorfos(top_sorted), Dicionario(top_sorted)
+
+
+def _anexar(nome):
+    dicionario = DicionarioCompartilhado(nome)
+    return dicionario.normalizadas, dicionario, dicionario
+
+
+def _memoria_privada_mb():
+    """RssAnon do processo em MB (nan fora do Linux)."""
+    try:
+        with open("/proc/self/status", encoding="ascii") as f:
+            for linha in f:
+                if linha.startswith("RssAnon:"):
+                    return int(linha.split()[1]) / 1024
+    except OSError:
+        pass
+    return float("nan")
+
+
+def trabalhador(modo, origem, consultas):
+    """(segundos até estar pronto, MB privados, candidatas das consultas) em um processo novo."""
+    inicio = time.perf_counter()
+    _normalizadas, indice, ranqueado = _montar_do_modulo(origem) if modo == "modulo" else _anexar(origem)
+    ranqueado.proxima_disponivel(5)
+    tempo = time.perf_counter() - inicio
+    candidatas = [list(islice(indice.palavras(c), 3)) for c in consultas]
+    return tempo, _memoria_privada_mb(), candidatas
+
+
+def _rodar(modo, origem, consultas, processos):
+    inicio = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=processos, max_tasks_per_child=1) as executor:
+        resultados = list(executor.map(trabalhador, [modo] * processos, [origem] * processos,
+                                       [consultas] * processos))
+    return resultados, time.perf_counter() - inicio
+
+
+def main():
+    total = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    processos = int(sys.argv[2]) if len(sys.argv) > 2 else 4
+    top_sorted = gerar_dicionario(total)
+    consultas = gerar_consultas(top_sorted, 200)
+
+    with tempfile.TemporaryDirectory() as pasta:
+        caminho_py = os.path.join(pasta, "top_words_grande.py")
+        with open(caminho_py, "w", encoding="utf-8") as f:
+            f.write("top_words = {\n")
+            f.writelines(f"'{w}': {r},\n" for w, r in top_sorted)
+            f.write("}\n")
+
+        inicio = time.perf_counter()
+        with DicionarioPublicado(dict(top_sorted)) as publicado:
+            t_publicar = time.perf_counter() - inicio
+            print(f"[RESULT] {total} palavras publicadas uma vez: {publicado.tamanho / 1024 / 1024:.1f} MB "
+                  f"em memória compartilhada ({t_publicar:.2f}s)")
+
+            ref, t_ref = _rodar("modulo", caminho_py, consultas, processos)
+            novo, t_novo = _rodar("compartilhado", publicado.nome, consultas, processos)
+
+        if any(r[2] != n[2] for r, n in zip(ref, novo)):
+            print("[RESULT] ERRO: candidatas divergem!")
+            sys.exit(1)
+        print(f"[RESULT] {processos} processos (mesmas candidatas):")
+        for rotulo, resultados, t_total in (("módulo .py + índices", ref, t_ref), ("anexar bloco", novo, t_novo)):
+            t_medio = sum(r[0] for r in resultados) / len(resultados)
+            mb_medio = sum(r[1] for r in resultados) / len(resultados)
+            print(f"[RESULT]   {rotulo:22s}: {t_medio * 1e3:9.1f} ms até pronto, {mb_medio:6.1f} MB privados "
+                  f"por processo (lote em {t_total:.2f}s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+benchmark_dicionario_compilado.py
+Compara o carregamento de um dicionário ranqueado grande pelo caminho do
+decrypt.py (até top_set_normalized, índice de candidatas e dicionário
+ranqueado estarem prontos):
+  - módulo .py executado (exec_module) + set/sorted/IndiceIsomorfos/Dicionario
+  - .dicc convertido em dict (como_dict) + as mesmas estruturas reconstruídas
+  - .dicc aberto com mmap e usado direto (dicionario_compilado.DicionarioCompilado)
+e o tempo de consultas por padrão/letras reveladas nos dois índices (mesmas candidatas).
+
+Uso:
+    python benchmark_dicionario_compilado.py           -> 1 milhão de palavras
+    python benchmark_dicionario_compilado.py 200000
+"""
+
+import importlib.util
+import os
+import sys
+import tempfile
+import time
+
+from benchmark_indice_posicional import gerar_consultas, gerar_dicionario
+from dicionario_compilado import DicionarioCompilado, compilar_dicionario, normalizar_palavra
+from funcoes_decodificador import Dicionario
+from indice_isomorfos import IndiceIsomorfos
+
+
+def _exec_modulo(caminho):
+    spec = importlib.util.spec_from_file_location("top_words_mod", caminho)
+    mod = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(mod)
+    return mod.top_words
+
+
+def _estruturas(top_words):
+    """(top_set_normalized, indice_candidatas, dicionario_ranqueado) como no decrypt.py a partir do dict."""
+    top_set_normalized = {normalizar_palavra(w) for w in top_words.keys()}
+    top_sorted = sorted(top_words.items(), key=lambda item: item[1])
+    return top_set_normalized, IndiceIsomorfos(top_sorted), Dicionario(top_sorted)
+
+
+def carregar_py(caminho):
+    return _estruturas(_exec_modulo(caminho))
+
+
+def carregar_dicc_como_dict(caminho):
+    with DicionarioCompilado(caminho) as dicionario:
+        return _estruturas(dicionario.como_dict())
+
+
+def carregar_dicc(caminho):
+    dicionario = DicionarioCompilado(caminho)
+    return dicionario.normalizadas, dicionario, dicionario
+
+
+def _medir(carregar, caminho):
+    inicio = time.perf_counter()
+    estruturas = carregar(caminho)
+    return estruturas, time.perf_counter() - inicio
+
+
+def main():
+    total = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    top_sorted = gerar_dicionario(total)
+    palavras = dict(top_sorted)
+
+    with tempfile.TemporaryDirectory() as pasta:
+        caminho_py = os.path.join(pasta, "top_words_grande.py")
+        caminho_dicc = os.path.join(pasta, "top_words_grande.dicc")
+        with open(caminho_py, "w", encoding="utf-8") as f:
+            f.write("top_words = {\n")
+            f.writelines(f"'{w}': {r},\n" for w, r in top_sorted)
+            f.write("}\n")
+
+        inicio = time.perf_counter()
+        compilar_dicionario(palavras, caminho_dicc)
+        t_compilar = time.perf_counter() - inicio
+        print(f"[RESULT] {total} palavras: .py {os.path.getsize(caminho_py) / 1024 / 1024:.1f} MB, "
+              f".dicc {os.path.getsize(caminho_dicc) / 1024 / 1024:.1f} MB (compilação: {t_compilar:.2f}s)")
+
+        (_norm, indice_py, _ranqueado), t_py = _medir(carregar_py, caminho_py)
+        del _norm, _ranqueado
+        _estruturas_dict, t_dict = _medir(carregar_dicc_como_dict, caminho_dicc)
+        del _estruturas_dict
+        (normalizadas, dicionario, ranqueado), t_dicc = _medir(carregar_dicc, caminho_dicc)
+
+        print("[RESULT] Carregamento do decrypt.py (até índice, dicionário ranqueado e normalizadas prontos):")
+        print(f"[RESULT]   .py (exec_module + estruturas):        {t_py * 1e3:10.1f} ms")
+        print(f"[RESULT]   .dicc via como_dict + estruturas:      {t_dict * 1e3:10.1f} ms")
+        print(f"[RESULT]   .dicc direto (mmap):                   {t_dicc * 1e3:10.3f} ms ({t_py / t_dicc:.0f}x)")
+
+        consultas = gerar_consultas(top_sorted, 1000)
+        for nome, indice in (("IndiceIsomorfos", indice_py), (".dicc", dicionario)):
+            inicio = time.perf_counter()
+            encontradas = sum(1 for c in consultas for _ in indice.candidatas(c))
+            t_consultas = time.perf_counter() - inicio
+            print(f"[RESULT] {len(consultas)} consultas por padrão isomorfo + letras reveladas ({nome}): "
+                  f"{t_consultas * 1e3 / len(consultas):.3f} ms/consulta ({encontradas} candidatas)")
+
+        if any(list(indice_py.palavras(c)) != list(dicionario.palavras(c)) for c in consultas[:200]):
+            print("[RESULT] ERRO: candidatas do .dicc divergem do IndiceIsomorfos!")
+            sys.exit(1)
+        if list(dicionario.itens())[:1000] != top_sorted[:1000]:
+            print("[RESULT] ERRO: ordem do .dicc diverge de top_sorted!")
+            sys.exit(1)
+        if ranqueado.proxima_disponivel(5) != next((w for w, _ in top_sorted if len(w) == 5), None):
+            print("[RESULT] ERRO: proxima_disponivel do .dicc diverge do Dicionario!")
+            sys.exit(1)
+        if not all(normalizar_palavra(w) in normalizadas for w, _ in top_sorted[:1000]):
+            print("[RESULT] ERRO: formas normalizadas do .dicc incompletas!")
+            sys.exit(1)
+        dicionario.fechar()
+
+
+if __name__ == "__main__":
+    main()
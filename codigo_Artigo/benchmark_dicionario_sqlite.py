@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+benchmark_dicionario_sqlite.py
+Vocabulário grande (sintético) em memória (dict + IndiceIsomorfos) x em
+SQLite (dicionario_sqlite.DicionarioSQLite):
+  - memória Python alocada para deixar cada um pronto para consulta
+  - encontrar_candidata_compatível nas mesmas consultas (mesmos resultados)
+  - primeira página (rank) de candidatas por padrão + letras reveladas
+
+Uso:
+    python benchmark_dicionario_sqlite.py              -> 500 mil palavras, 1000 consultas
+    python benchmark_dicionario_sqlite.py 100000 500
+"""
+
+import gc
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from benchmark_indice_posicional import gerar_consultas, gerar_dicionario
+from dicionario_sqlite import DicionarioSQLite, compilar_dicionario_sqlite
+from funcoes_decodificador import encontrar_candidata_compatível
+from indice_isomorfos import IndiceIsomorfos
+
+
+def _memoria(func):
+    """(resultado, MB alocados por func e ainda vivos)."""
+    gc.collect()
+    tracemalloc.start()
+    resultado = func()
+    atual, _pico = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return resultado, atual / 1024 / 1024
+
+
+def _buscar(consultas, top_sorted, indice):
+    inicio = time.perf_counter()
+    resultados = []
+    for c in consultas:
+        reservadas = {ch for ch in c if ch.islower()}
+        resultados.append(encontrar_candidata_compatível(c, top_sorted, {}, reservadas, set(), indice=indice))
+    return resultados, time.perf_counter() - inicio
+
+
+def main():
+    total_palavras = int(sys.argv[1]) if len(sys.argv) > 1 else 500_000
+    total_consultas = int(sys.argv[2]) if len(sys.argv) > 2 else 1000
+
+    top_sorted = gerar_dicionario(total_palavras)
+    consultas = gerar_consultas(top_sorted, total_consultas)
+
+    with tempfile.TemporaryDirectory() as pasta:
+        caminho = os.path.join(pasta, "vocabulario.sqlite")
+        inicio = time.perf_counter()
+        compilar_dicionario_sqlite(dict(top_sorted), caminho)
+        t_compilar = time.perf_counter() - inicio
+        print(f"[RESULT] {total_palavras} palavras -> SQLite {os.path.getsize(caminho) / 1024 / 1024:.1f} MB "
+              f"(compilação com índices: {t_compilar:.1f}s)")
+
+        # em memória: dict + lista ordenada + índice (o que decrypt.py monta com top_words.py)
+        itens = list(top_sorted)
+        (memoria, indice), mb_memoria = _memoria(
+            lambda: (dict(itens), IndiceIsomorfos(sorted(itens, key=lambda item: item[1])))
+        )
+        dicionario, mb_sqlite = _memoria(lambda: DicionarioSQLite(caminho))
+        print(f"[RESULT] Memória para consultar: em memória {mb_memoria:.1f} MB | SQLite {mb_sqlite:.2f} MB")
+
+        ref, t_memoria = _buscar(consultas, top_sorted, indice)
+        novo, t_sqlite = _buscar(consultas, None, dicionario)
+        if novo != ref:
+            print("[RESULT] ERRO: SQLite diverge do índice em memória!")
+            sys.exit(1)
+        print("[RESULT] encontrar_candidata_compatível (mesmos resultados):")
+        print(f"[RESULT]   IndiceIsomorfos: {1e3 * t_memoria / len(consultas):.3f} ms/consulta")
+        print(f"[RESULT]   DicionarioSQLite: {1e3 * t_sqlite / len(consultas):.3f} ms/consulta")
+
+        inicio = time.perf_counter()
+        linhas = 0
+        for c in consultas:
+            for _ in zip(range(dicionario.tamanho_pagina), dicionario.candidatas(c)):
+                linhas += 1
+        t_pagina = time.perf_counter() - inicio
+        print(f"[RESULT] Primeira página de candidatas (SQL indexado): {1e3 * t_pagina / len(consultas):.3f} ms/consulta "
+              f"({linhas / len(consultas):.1f} linhas em média)")
+        dicionario.fechar()
+        del memoria, indice
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+benchmark_indice_hamming.py
+Compara a busca "palavras ranqueadas com até k letras diferentes do token"
+feita por varredura (match_percent / compatibility_score contra todas as
+palavras do mesmo comprimento, como nos scripts da TENTATIVA_1) com o
+índice de indice_hamming.py, em tokens com ruído (letras trocadas).
+
+Uso:
+    python benchmark_indice_hamming.py              -> 100 mil palavras, 1000 tokens
+    python benchmark_indice_hamming.py 1000000 200
+"""
+
+import random
+import sys
+import time
+
+from benchmark_indice_posicional import gerar_dicionario
+from indice_hamming import IndiceHamming
+
+
+def gerar_tokens_com_ruido(top_sorted, total, semente=13):
+    """Palavras do dicionário com 1 a metade das letras trocadas."""
+    rng = random.Random(semente)
+    letras = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+    tokens = []
+    for _ in range(total):
+        palavra = list(rng.choice(top_sorted)[0])
+        for _ in range(rng.randint(1, max(1, len(palavra) // 2))):
+            palavra[rng.randrange(len(palavra))] = rng.choice(letras)
+        tokens.append("".join(palavra))
+    return tokens
+
+
+def _varredura(top_sorted, token, k):
+    """Varredura: conta as diferenças contra cada palavra do mesmo comprimento."""
+    tamanho = len(token)
+    resultado = []
+    for w, r in top_sorted:
+        if len(w) != tamanho:
+            continue
+        d = sum(1 for a, b in zip(token, w) if a != b)
+        if d <= k:
+            resultado.append((w, r, d))
+    return resultado
+
+
+def _cronometrar(func, tokens):
+    inicio = time.perf_counter()
+    resultados = [func(t) for t in tokens]
+    return resultados, time.perf_counter() - inicio
+
+
+def main():
+    total_palavras = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    total_tokens = int(sys.argv[2]) if len(sys.argv) > 2 else 1000
+
+    top_sorted = gerar_dicionario(total_palavras)
+    tokens = gerar_tokens_com_ruido(top_sorted, total_tokens)
+
+    inicio = time.perf_counter()
+    indice = IndiceHamming(top_sorted)
+    t_montagem = time.perf_counter() - inicio
+    print(f"[RESULT] Dicionário: {len(top_sorted)} palavras; {len(tokens)} tokens; montagem do índice: {t_montagem:.2f}s")
+
+    for nome, k_de in (("k = (L - 1) // 2 (2read_message)", lambda t: (len(t) - 1) // 2), ("k = 1", lambda t: 1)):
+        ref, t_scan = _cronometrar(lambda t: _varredura(top_sorted, t, k_de(t)), tokens)
+        novo, t_indice = _cronometrar(lambda t: indice.vizinhos(t, k_de(t)), tokens)
+        if novo != ref:
+            print("[RESULT] ERRO: índice diverge da varredura!")
+            sys.exit(1)
+        media = sum(len(r) for r in ref) / len(ref)
+        print(f"[RESULT] {nome}, média de {media:.1f} vizinhos por token:")
+        print(f"[RESULT]   varredura: {1e3 * t_scan / len(tokens):.3f} ms/token")
+        print(f"[RESULT]   índice:    {1e3 * t_indice / len(tokens):.3f} ms/token ({t_scan / t_indice:.0f}x)")
+
+    # melhor candidata (menor distância, depois rank), como choose_best_candidate_same_length
+    ref, t_scan = _cronometrar(
+        lambda t: min(_varredura(top_sorted, t, len(t)), key=lambda x: x[2], default=None), tokens
+    )
+    novo, t_indice = _cronometrar(lambda t: indice.mais_proxima(t, len(t)), tokens)
+    if novo != ref:
+        print("[RESULT] ERRO: mais_proxima diverge da varredura!")
+        sys.exit(1)
+    print("[RESULT] Melhor candidata (menor distância, depois rank):")
+    print(f"[RESULT]   varredura: {1e3 * t_scan / len(tokens):.3f} ms/token")
+    print(f"[RESULT]   índice:    {1e3 * t_indice / len(tokens):.3f} ms/token ({t_scan / t_indice:.0f}x)")
+
+
+if __name__ == "__main__":
+    main()
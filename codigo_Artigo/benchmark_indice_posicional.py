@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+benchmark_indice_posicional.py
+Compara a varredura de top_sorted com o índice de bitsets (posição, letra)
+de indice_posicional.py em um dicionário sintético de 100 mil palavras:
+  - consulta pura: todas as palavras de tamanho L com as letras reveladas
+  - encontrar_candidata_compatível sem índice x com IndiceIsomorfos
+    (exigir_isomorfo=False, mesmo resultado da varredura)
+
+Uso:
+    python benchmark_indice_posicional.py              -> 100 mil palavras, 2000 consultas
+    python benchmark_indice_posicional.py 1000000 500  -> 1 milhão de palavras, 500 consultas
+"""
+
+import random
+import sys
+import time
+
+from funcoes_decodificador import encontrar_candidata_compatível
+from indice_isomorfos import IndiceIsomorfos
+from indice_posicional import IndicePosicional, letras_reveladas
+
+# frequência aproximada das letras em inglês (para palavras sintéticas plausíveis)
+_FREQUENCIAS = {
+    "E": 12.7, "T": 9.1, "A": 8.2, "O": 7.5, "I": 7.0, "N": 6.7, "S": 6.3, "H": 6.1,
+    "R": 6.0, "D": 4.3, "L": 4.0, "C": 2.8, "U": 2.8, "M": 2.4, "W": 2.4, "F": 2.2,
+    "G": 2.0, "Y": 2.0, "P": 1.9, "B": 1.5, "V": 1.0, "K": 0.8, "J": 0.2, "X": 0.2,
+    "Q": 0.1, "Z": 0.1,
+}
+
+
+def gerar_dicionario(total, semente=7):
+    """top_sorted sintético: [(palavra, rank)] com palavras distintas de 2 a 12 letras."""
+    rng = random.Random(semente)
+    letras, pesos = zip(*_FREQUENCIAS.items())
+    palavras = {}
+    while len(palavras) < total:
+        tamanho = rng.choice((2, 3, 3, 4, 4, 4, 5, 5, 5, 6, 6, 7, 7, 8, 9, 10, 11, 12))
+        palavra = "".join(rng.choices(letras, pesos, k=tamanho))
+        palavras.setdefault(palavra, len(palavras) + 1)
+    return sorted(palavras.items(), key=lambda item: item[1])
+
+
+def gerar_consultas(top_sorted, total, semente=11):
+    """
+    Palavras parcialmente decifradas: parte das letras revelada (minúscula),
+    o resto trocado por letras cifradas (maiúsculas) de uma chave aleatória.
+    """
+    rng = random.Random(semente)
+    alfabeto = list(_FREQUENCIAS)
+    consultas = []
+    for _ in range(total):
+        palavra, _ = rng.choice(top_sorted)
+        cifra = dict(zip(alfabeto, rng.sample(alfabeto, len(alfabeto))))
+        reveladas = set(rng.sample(sorted(set(palavra)), k=max(1, len(set(palavra)) // 2)))
+        consultas.append("".join(ch.lower() if ch in reveladas else cifra[ch] for ch in palavra))
+    return consultas
+
+
+def _varredura(top_sorted, palavra_atual):
+    """Varredura atual: mesmo tamanho + letras reveladas na mesma posição."""
+    tamanho = len(palavra_atual)
+    reveladas = letras_reveladas(palavra_atual)
+    return [
+        (w, r) for w, r in top_sorted
+        if len(w) == tamanho and all(w[i].lower() == ch for i, ch in reveladas)
+    ]
+
+
+def _cronometrar(func, consultas):
+    inicio = time.perf_counter()
+    resultados = [func(c) for c in consultas]
+    return resultados, time.perf_counter() - inicio
+
+
+def main():
+    total_palavras = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    total_consultas = int(sys.argv[2]) if len(sys.argv) > 2 else 2000
+
+    top_sorted = gerar_dicionario(total_palavras)
+    consultas = gerar_consultas(top_sorted, total_consultas)
+
+    inicio = time.perf_counter()
+    indice = IndicePosicional(top_sorted)
+    t_montagem = time.perf_counter() - inicio
+    print(f"[RESULT] Dicionário: {len(top_sorted)} palavras; {len(consultas)} consultas; "
+          f"montagem do índice: {t_montagem:.2f}s")
+
+    ref, t_scan = _cronometrar(lambda c: _varredura(top_sorted, c), consultas)
+    novo, t_indice = _cronometrar(
+        lambda c: list(indice.consultar(len(c), letras_reveladas(c))), consultas
+    )
+    if novo != ref:
+        print("[RESULT] ERRO: índice diverge da varredura!")
+        sys.exit(1)
+    media = sum(len(r) for r in ref) / len(ref)
+    print(f"[RESULT] Consulta (todas as compatíveis, média {media:.1f} por consulta):")
+    print(f"[RESULT]   varredura: {1e3 * t_scan / len(consultas):.3f} ms/consulta")
+    print(f"[RESULT]   bitsets:   {1e3 * t_indice / len(consultas):.3f} ms/consulta "
+          f"({t_scan / t_indice:.0f}x)")
+
+    # busca completa do solver: letras reveladas já reservadas no mapa
+    indice_candidatas = IndiceIsomorfos(top_sorted, exigir_isomorfo=False)
+
+    def _buscar(c, indice_busca):
+        reservadas = {ch for ch in c if ch.islower()}
+        return encontrar_candidata_compatível(c, top_sorted, {}, reservadas, set(), indice=indice_busca)
+
+    ref, t_scan = _cronometrar(lambda c: _buscar(c, None), consultas)
+    novo, t_indice = _cronometrar(lambda c: _buscar(c, indice_candidatas), consultas)
+    if novo != ref:
+        print("[RESULT] ERRO: encontrar_candidata_compatível com índice diverge da varredura!")
+        sys.exit(1)
+    print("[RESULT] encontrar_candidata_compatível (mesmos resultados):")
+    print(f"[RESULT]   varredura de top_sorted: {1e3 * t_scan / len(consultas):.3f} ms/consulta")
+    print(f"[RESULT]   com índice:              {1e3 * t_indice / len(consultas):.3f} ms/consulta "
+          f"({t_scan / t_indice:.0f}x)")
+
+
+if __name__ == "__main__":
+    main()
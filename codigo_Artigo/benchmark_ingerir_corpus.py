@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+benchmark_ingerir_corpus.py
+Contagem de palavras de um corpus sintético (palavras de
+benchmark_indice_posicional.gerar_dicionario sorteadas com frequência Zipf)
+pelo map-reduce de ingerir_corpus.py:
+  - leitura única do arquivo inteiro (referência: read + regex + Counter)
+  - map-reduce com 1 e com N processos (mesmas contagens)
+  - pico de memória de um processo do map (VmHWM, Linux) e o tamanho do corpus
+  - tempo para derivar os n-gramas (1..4) das contagens
+
+Uso:
+    python benchmark_ingerir_corpus.py            -> corpus de 100 MB, processos = nº de CPUs
+    python benchmark_ingerir_corpus.py 300 4
+"""
+
+import multiprocessing
+import os
+import random
+import sys
+import tempfile
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+
+from benchmark_indice_posicional import gerar_dicionario
+from ingerir_corpus import _PALAVRA, contar_corpus, contar_ngramas, contar_pedaco, dividir_em_pedacos, normalizar_texto
+
+
+def gerar_corpus(caminho, megabytes, vocabulario=50_000, semente=5):
+    palavras = [w.lower() for w, _ in gerar_dicionario(vocabulario)]
+    pesos = [1 / (i + 1) for i in range(len(palavras))]
+    rng = random.Random(semente)
+    with open(caminho, "w", encoding="utf-8") as f:
+        while f.tell() < megabytes << 20:
+            f.write(" ".join(rng.choices(palavras, pesos, k=5000)) + ".\n")
+
+
+def _pico_memoria_mb():
+    """VmHWM do processo em MB (nan fora do Linux)."""
+    try:
+        with open("/proc/self/status", encoding="ascii") as f:
+            for linha in f:
+                if linha.startswith("VmHWM:"):
+                    return int(linha.split()[1]) / 1024
+    except OSError:
+        pass
+    return float("nan")
+
+
+def _contar_e_medir(pedaco):
+    return len(contar_pedaco(pedaco)), _pico_memoria_mb()
+
+
+def main():
+    megabytes = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    processos = int(sys.argv[2]) if len(sys.argv) > 2 else os.cpu_count()
+
+    with tempfile.TemporaryDirectory() as pasta:
+        caminho = os.path.join(pasta, "corpus.txt")
+        gerar_corpus(caminho, megabytes)
+        tamanho_mb = os.path.getsize(caminho) / 1024 / 1024
+        print(f"[RESULT] Corpus sintético: {tamanho_mb:.1f} MB")
+
+        inicio = time.perf_counter()
+        with open(caminho, "r", encoding="utf-8") as f:
+            referencia = Counter(_PALAVRA.findall(normalizar_texto(f.read())))
+        t_ref = time.perf_counter() - inicio
+        print(f"[RESULT] Leitura única (arquivo inteiro na memória): {t_ref:.2f}s ({tamanho_mb / t_ref:.1f} MB/s)")
+
+        tamanho_pedaco = 16 << 20
+        for n in sorted({1, processos}):
+            inicio = time.perf_counter()
+            contagens = contar_corpus([caminho], processos=n, tamanho_pedaco=tamanho_pedaco)
+            t_map = time.perf_counter() - inicio
+            if contagens != referencia:
+                print("[RESULT] ERRO: contagens do map-reduce divergem da leitura única!")
+                sys.exit(1)
+            print(f"[RESULT] Map-reduce com {n} processo(s): {t_map:.2f}s ({tamanho_mb / t_map:.1f} MB/s, "
+                  f"{len(contagens)} palavras distintas, mesmas contagens)")
+
+        pedacos = dividir_em_pedacos([caminho], tamanho_pedaco)
+        # processo novo (spawn): o pico não inclui a memória herdada deste processo
+        with ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("spawn")) as executor:
+            _distintas, pico = executor.submit(_contar_e_medir, pedacos[0]).result()
+        print(f"[RESULT] Pico de memória de um processo do map: {pico:.1f} MB "
+              f"(pedaço de {tamanho_pedaco >> 20} MB, blocos de 1 MB; corpus de {tamanho_mb:.0f} MB)")
+
+        inicio = time.perf_counter()
+        ngramas = contar_ngramas(referencia)
+        t_ngramas = time.perf_counter() - inicio
+        print(f"[RESULT] n-gramas 1..4 derivados das contagens: {t_ngramas:.2f}s "
+              f"({', '.join(f'{len(t)} {n}-gramas' for n, t in ngramas.items())})")
+
+
+if __name__ == "__main__":
+    main()
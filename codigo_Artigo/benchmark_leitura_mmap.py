@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+benchmark_leitura_mmap.py
+Compara os leitores de entrada nos Passos 1-3 (arquivo de bits -> texto decodificado):
+  - legado:  readlines + re.split + zfill(8) + dicionário por grupo (processar_encoded_file
+             de TENTATIVA_FINAL, sem gravar saídas)
+  - texto:   read + regex do Passo 1 + decodificar_em_lote (leitor_entrada = "texto")
+  - fluxo:   blocos de 1 MB + decodificar_grupos (leitor_entrada = "fluxo")
+  - mmap:    janelas do arquivo mapeado, valores por colunas de bits no layout
+             de campos fixos (leitor_entrada = "mmap")
+  - split:   as mesmas janelas com bytes.split() + um bytes por grupo (caminho
+             do mmap fora do layout de campos fixos)
+
+Uso:
+    python benchmark_leitura_mmap.py            -> arquivo de ~100 MB
+    python benchmark_leitura_mmap.py 400        -> arquivo de ~400 MB
+
+O arquivo é gerado em um diretório temporário repetindo encoded.txt até o
+tamanho pedido, e removido no final.
+"""
+
+import os
+import re
+import string
+import sys
+import tempfile
+import time
+
+from caracteres_printaveis import caracteres_printaveis
+from funcoes_decodificador import decodificar_em_lote
+from entrada_binaria import (
+    decodificar_grupos,
+    decodificar_mmap,
+    grupos_em_fluxo,
+    janelas_mmap,
+    tabela_de_dicionario,
+    valores_de_janela,
+)
+
+arquivo_base = "encoded.txt"
+
+
+def _leitor_legado(caminho):
+    # mesmo laço de processar_encoded_file (TENTATIVA_FINAL/decrypt.py)
+    partes = []
+    with open(caminho, "r", encoding="utf-8") as f:
+        for linha in f.readlines():
+            linha = linha.strip()
+            if not linha:
+                continue
+            for grupo in re.split(r"\s+", linha):
+                if not grupo:
+                    continue
+                grupo = grupo.zfill(8)
+                partes.append(caracteres_printaveis.get(grupo, "?"))
+    return "".join(partes)
+
+
+def _leitor_texto(caminho):
+    with open(caminho, "r", encoding="utf-8") as f:
+        data = f.read()
+    sequencias = re.findall(f"[{re.escape(string.printable.strip())}]+", data)
+    return "".join(decodificar_em_lote(sequencias, caracteres_printaveis))
+
+
+def _leitor_fluxo(caminho):
+    tabela = tabela_de_dicionario(caracteres_printaveis)
+    return "".join(decodificar_grupos(grupos, tabela) for grupos in grupos_em_fluxo(caminho))
+
+
+def _leitor_mmap(caminho):
+    return decodificar_mmap(caminho, caracteres_printaveis)
+
+
+def _leitor_split(caminho):
+    tabela = tabela_de_dicionario(caracteres_printaveis)
+    return "".join(valores_de_janela(janela).decode("latin-1").translate(tabela)
+                   for janela, _largura in janelas_mmap(caminho))
+
+
+def _cronometrar(func, *args):
+    inicio = time.perf_counter()
+    resultado = func(*args)
+    return resultado, time.perf_counter() - inicio
+
+
+def main():
+    megabytes = float(sys.argv[1]) if len(sys.argv) > 1 else 100.0
+
+    with open(arquivo_base, "r", encoding="utf-8") as f:
+        base = f.read()
+    # cópias emendadas sem mexer no layout de campos fixos ("%8s " por grupo) do arquivo
+    if not base[-1:].isspace():
+        base += " "
+    repeticoes = max(1, int(megabytes * 1024 * 1024 / len(base)))
+
+    with tempfile.TemporaryDirectory() as pasta:
+        caminho = os.path.join(pasta, "encoded_grande.txt")
+        with open(caminho, "w", encoding="utf-8") as f:
+            for _ in range(repeticoes):
+                f.write(base)
+        tamanho_mb = os.path.getsize(caminho) / 1024 / 1024
+        print(f"[RESULT] Entrada: {tamanho_mb:.1f} MB ({repeticoes} cópias de {arquivo_base})")
+
+        resultados = {}
+        for nome, leitor in (("legado", _leitor_legado), ("texto", _leitor_texto),
+                             ("fluxo", _leitor_fluxo), ("mmap", _leitor_mmap), ("split", _leitor_split)):
+            texto, tempo = _cronometrar(leitor, caminho)
+            resultados[nome] = (texto, tempo)
+            print(f"[RESULT] {nome:<7} {tempo:7.3f}s  ({tamanho_mb / tempo:6.1f} MB/s)")
+
+    referencia = resultados["legado"][0]
+    if any(texto != referencia for texto, _ in resultados.values()):
+        print("[RESULT] ERRO: leitores produziram textos diferentes!")
+        sys.exit(1)
+
+    t_legado = resultados["legado"][1]
+    t_texto = resultados["texto"][1]
+    t_mmap = resultados["mmap"][1]
+    print(f"[RESULT] Speedup mmap: {t_legado / t_mmap:.1f}x sobre legado, "
+          f"{t_texto / t_mmap:.1f}x sobre texto, {resultados['split'][1] / t_mmap:.1f}x sobre split "
+          f"(saídas idênticas)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+benchmark_recozimento_simulado.py
+Recozimento simulado (recozimento_simulado.RecozimentoSimulado) sobre as
+palavras de uma entrada, partindo da chave por frequência de letras, com dois
+modelos de quadrigramas:
+  - dicionário: top_words.py com peso de Zipf (o padrão do decrypt.py quando
+    arquivo_ngramas = None)
+  - corpus: tabela <saida>_ngramas_4.txt do ingerir_corpus.py, se passada; senão
+    os textos da documentação do Python (pydoc_data.topics, ~465 mil caracteres
+    de inglês na biblioteca padrão) contados com as funções do ingerir_corpus
+Para cada modelo:
+  - trocas avaliadas por segundo com o delta incremental contra a pontuação
+    completa (recalcular o índice e o log10 de todos os n-gramas a cada troca)
+  - tempo, pontuação inicial/final, % das palavras decifradas que estão no
+    dicionário e o começo do texto decifrado
+
+Uso:
+    python benchmark_recozimento_simulado.py                       -> encoded.txt
+    python benchmark_recozimento_simulado.py encoded_EXIST.txt top_words_corpus_ngramas_4.txt
+"""
+
+import random
+import re
+import string
+import sys
+import time
+from collections import Counter
+
+from caracteres_printaveis import caracteres_printaveis
+from funcoes_decodificador import armazem_de_sequencias, decodificar_em_lote
+from ingerir_corpus import _PALAVRA, normalizar_texto
+from recozimento_simulado import ModeloNgramas, RecozimentoSimulado
+from top_words import top_words
+
+TROCAS_PONTUACAO_COMPLETA = 2000
+CARACTERES_EXIBIDOS = 90
+
+
+def modelo_corpus(caminho):
+    if caminho:
+        return caminho, ModeloNgramas.de_arquivo(caminho)
+    from pydoc_data.topics import topics
+    palavras = Counter(_PALAVRA.findall(normalizar_texto(" ".join(topics.values()))))
+    return "pydoc_data.topics", ModeloNgramas.de_palavras(palavras)
+
+
+def pontuacao_completa(recozimento, trocas=TROCAS_PONTUACAO_COMPLETA):
+    """Trocas/s avaliando cada troca pela pontuação do texto inteiro (sem delta)."""
+    rng = random.Random(0)
+    chave = list(recozimento._chave_inicial)
+    variaveis, casas = len(recozimento.variaveis), len(chave)
+    inicio = time.perf_counter()
+    for _ in range(trocas):
+        x, y = rng.randrange(variaveis), rng.randrange(casas)
+        chave[x], chave[y] = chave[y], chave[x]
+        recozimento._pontuar(recozimento._indices(chave))
+    return trocas / (time.perf_counter() - inicio)
+
+
+def main():
+    arquivo = sys.argv[1] if len(sys.argv) > 1 else "encoded.txt"
+    tabela = sys.argv[2] if len(sys.argv) > 2 else None
+
+    with open(arquivo, "r", encoding="utf-8") as f:
+        sequencias = re.findall(f"[{re.escape(string.printable.strip())}]+", f.read())
+    palavras_pos = armazem_de_sequencias(decodificar_em_lote(sequencias, caracteres_printaveis)).palavras_pos()
+    ranqueadas = [palavra for palavra, _rank in sorted(top_words.items(), key=lambda item: item[1])]
+
+    inicio = time.perf_counter()
+    modelos = [("dicionário", ModeloNgramas.de_ranking(ranqueadas))]
+    print(f"[RESULT] Modelo do dicionário: {modelos[0][1].distintos} quadrigramas em {time.perf_counter() - inicio:.2f}s")
+    inicio = time.perf_counter()
+    origem, modelo = modelo_corpus(tabela)
+    modelos.append(("corpus", modelo))
+    print(f"[RESULT] Modelo do corpus ({origem}): {modelo.distintos} quadrigramas em {time.perf_counter() - inicio:.2f}s")
+
+    for nome, modelo in modelos:
+        recozimento = RecozimentoSimulado(palavras_pos, modelo, semente=0)
+        completa = pontuacao_completa(recozimento)
+        mapa = recozimento.resolver()
+        e = recozimento.estatisticas()
+        decifradas = ["".join(mapa.get(ch, ch) for ch in palavra) for _pos, palavra in palavras_pos]
+        letras = [p for p in decifradas if p.isalpha()]
+        no_dicionario = sum(p.upper() in top_words for p in letras)
+        if nome == modelos[0][0]:
+            print(f"[RESULT] {arquivo}: {len(palavras_pos)} palavras, {e['variaveis']} letras cifradas, "
+                  f"{e['ngramas']} quadrigramas cifrados distintos")
+        print(f"[RESULT] {nome:>10s}: {e['avaliacoes']} trocas em {e['segundos']:.2f}s, "
+              f"delta incremental {e['avaliacoes_por_segundo']:.0f} trocas/s contra {completa:.0f} trocas/s "
+              f"com pontuação completa ({e['avaliacoes_por_segundo'] / completa:.1f}x)")
+        print(f"[RESULT] {'':>10s}  log10 P {e['pontuacao_inicial']:.1f} -> {e['pontuacao']:.1f}, "
+              f"{e['aceitas']} trocas aceitas, {no_dicionario / len(letras) * 100:.1f}% das palavras no dicionário")
+        print(f"[RESULT] {'':>10s}  {' '.join(decifradas)[:CARACTERES_EXIBIDOS]}")
+
+
+if __name__ == "__main__":
+    main()
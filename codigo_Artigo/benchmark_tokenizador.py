@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+benchmark_tokenizador.py
+Compara o tokenizador compartilhado (tokenizador.py) com as implementações
+anteriores dos dois pipelines:
+  - Passo 4 atual: ArmazemTokens.de_texto (uma varredura de tokenizar) +
+    palavras_pos / original_lines_by_pos
+  - Passo 4 do artigo: splitlines + _limpar_token_por_regras por token
+    (re.search, re.match, unicodedata.normalize, re.sub)
+  - tratamento_palavras do NoMuque: findall + filtro de tokens vazios
+
+Uso:
+    python benchmark_tokenizador.py            -> ~10 MB de texto
+    python benchmark_tokenizador.py 32         -> ~32 MB de texto
+
+O texto é o resultado decodificado de encoded.txt repetido até o tamanho pedido.
+"""
+
+import re
+import sys
+import time
+import unicodedata
+
+from caracteres_printaveis import caracteres_printaveis
+from entrada_binaria import decodificar_mmap
+from armazem_tokens import ArmazemTokens
+from tokenizador import palavras_pontuacao, varrer
+
+arquivo_base = "encoded.txt"
+
+
+# --- cópias das versões anteriores -------------------------------------------
+def _remover_acentos_legado(s):
+    nkfd = unicodedata.normalize('NFD', s)
+    return ''.join(ch for ch in nkfd if not unicodedata.combining(ch))
+
+
+def _limpar_token_legado(token):
+    if not token:
+        return "", ""
+    suffix = ""
+    m = re.search(r"(--|[\'’`-])", token)
+    if m:
+        pos = m.start()
+        sym_len = len(m.group(1))
+        if pos + sym_len < len(token) and re.match(r"[A-Za-zÀ-ſ]", token[pos + sym_len]):
+            suffix = token[pos:]
+            token = token[:pos]
+        else:
+            token = token[:pos] + token[pos+sym_len:]
+    token_limpo = re.sub(r'[^A-Za-z]', '', _remover_acentos_legado(token))
+    return token_limpo, suffix
+
+
+def _passo4_legado(texto):
+    palavras_pos = []
+    original_lines_by_pos = {}
+    for idx, linha in enumerate(texto.replace(" ", "\n").splitlines()):
+        original_lines_by_pos[idx] = linha
+        linha = linha.strip()
+        if not linha:
+            continue
+        token_limpo, _ = _limpar_token_legado(linha)
+        if token_limpo:
+            palavras_pos.append((idx, token_limpo))
+    return palavras_pos, original_lines_by_pos
+
+
+def _tratamento_legado(texto):
+    token_pattern = re.compile(r'--|["\'&,\.\-`]|[^\s"\'&,\.\-`]+')
+    return [t for t in token_pattern.findall(texto) if t and t.strip()]
+# ------------------------------------------------------------------------------
+
+
+def _passo4_armazem(texto):
+    armazem = ArmazemTokens.de_texto(texto)
+    return armazem.palavras_pos(), armazem.linhas_originais()
+
+
+def _cronometrar(func, *args):
+    inicio = time.perf_counter()
+    resultado = func(*args)
+    return resultado, time.perf_counter() - inicio
+
+
+def main():
+    megabytes = float(sys.argv[1]) if len(sys.argv) > 1 else 10.0
+
+    base = decodificar_mmap(arquivo_base, caracteres_printaveis).replace("\r", "")
+    repeticoes = max(1, int(megabytes * 1024 * 1024 / (len(base) + 1)))
+    texto = " ".join([base] * repeticoes)
+    print(f"[RESULT] Texto: {len(texto) / 1024 / 1024:.1f} MB ({repeticoes} cópias de {arquivo_base} decodificado)")
+
+    ref_artigo, t_artigo_legado = _cronometrar(_passo4_legado, texto)
+    (novas_palavras, novas_linhas), t_artigo_novo = _cronometrar(_passo4_armazem, texto)
+    colunas, t_varredura = _cronometrar(varrer, texto)
+
+    ref_nomuque, t_nomuque_legado = _cronometrar(_tratamento_legado, texto)
+    novo_nomuque, t_nomuque_novo = _cronometrar(palavras_pontuacao, texto)
+
+    if (novas_palavras, dict(novas_linhas)) != ref_artigo or novo_nomuque != ref_nomuque:
+        print("[RESULT] ERRO: tokenizador diverge das implementações anteriores!")
+        sys.exit(1)
+
+    print(f"[RESULT] Passo 4 (artigo) legado:        {t_artigo_legado:.3f}s")
+    print(f"[RESULT] Passo 4 (artigo) armazém:       {t_artigo_novo:.3f}s "
+          f"({t_artigo_legado / t_artigo_novo:.1f}x, saídas idênticas)")
+    print(f"[RESULT]   só a varredura (varrer):      {t_varredura:.3f}s para {len(colunas.palavras)} palavras")
+    print(f"[RESULT] tratamento_palavras legado:      {t_nomuque_legado:.3f}s")
+    print(f"[RESULT] tratamento_palavras tokenizador: {t_nomuque_novo:.3f}s "
+          f"({t_nomuque_legado / t_nomuque_novo:.1f}x, saídas idênticas)")
+
+
+if __name__ == "__main__":
+    main()
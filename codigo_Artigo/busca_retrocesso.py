@@ -0,0 +1,228 @@
+# ================================================================
+# busca_retrocesso.py — Passo 10 como busca em profundidade com retrocesso
+#
+# Contém funções para:
+#  - atribuir palavras do dicionário às palavras cifradas distintas em
+#    profundidade (DFS), a palavra mais restrita primeiro (menos candidatas
+#    vivas, depois mais letras no texto), candidatas na ordem de rank e,
+#    por último, a opção "fora do dicionário"
+#  - forward checking: cada atribuição fixa as letras da candidata na chave
+#    (domínio unitário, letra clara tirada das outras letras cifradas) e
+#    refiltra as candidatas das palavras pendentes que usam essas letras;
+#    palavra pendente sem candidata viva fica fora do dicionário, e a que
+#    já tem todas as letras fixadas é aceita, as duas sem ramificar
+#  - desfazer pela trilha: chave (domínios), candidatas vivas e estado das
+#    palavras voltam ao ponto do nó ao retroceder, sem cópias do estado
+#  - ramificar e limitar (branch and bound): a solução vale as letras do
+#    texto cobertas por palavras do dicionário (ocorrências x comprimento);
+#    um ramo é cortado quando nem aceitando todas as pendentes que ainda têm
+#    candidata superaria a melhor solução já encontrada
+#  - orçamento de nós e de tempo: a busca para no que vier primeiro e devolve
+#    a melhor solução até ali (a primeira folha já é a escolha gulosa em
+#    ordem de rank, corrigida onde ela levaria a conflito); se o orçamento
+#    acabar antes da primeira folha, desce até ela sem retroceder
+#
+# O modelo (domínios em bitmask, candidatas por palavra, trilha) é o de
+# consistencia_arco.ConsistenciaArco; a diferença é que aqui nada é aceito
+# de vez: uma escolha ruim no começo (ex.: AT em vez de AS na primeira
+# palavra de duas letras) é desfeita quando outra dá cobertura maior.
+# ================================================================
+
+import time
+
+from consistencia_arco import ConsistenciaArco, Restricao
+
+LIMITE_NOS = 200_000
+LIMITE_SEGUNDOS = 10.0
+_FORA = -1
+_CHECAR_TEMPO_A_CADA = 256
+
+
+class BuscaRetrocesso(ConsistenciaArco):
+    """
+    DFS com forward checking sobre as mesmas restrições de ConsistenciaArco.
+
+      limite_nos / limite_segundos -> orçamento (None = sem limite)
+
+    resolver() devolve o mapa {cifrada maiúscula: clara minúscula} da melhor
+    solução; estatisticas() traz nós, nós/s, se a busca terminou (ótimo
+    provado) e a cobertura.
+    """
+
+    def __init__(self, palavras_pos, indice, mapa_inicial=None,
+                 limite_nos=LIMITE_NOS, limite_segundos=LIMITE_SEGUNDOS):
+        super().__init__(palavras_pos, indice, mapa_inicial)
+        self.limite_nos = limite_nos
+        self.limite_segundos = limite_segundos
+        self.nos = 0
+        self.solucoes = 0
+        self.segundos = 0.0
+        self.completa = False
+        self.cobertura = 0
+        self.melhor_cobertura = -1
+        self._melhor_mapa = {}
+        self._melhor_usadas = set()
+        self._pesos = {r: r.ocorrencias * len(r.palavra) for r in self.restricoes}
+        self._desempate = {r: (-self._pesos[r], r.primeira_pos) for r in self.restricoes}
+        self._com_candidatas = [r for r in self.restricoes if r.estado == Restricao.PENDENTE]
+        self.cobertura_maxima = sum(self._pesos[r] for r in self._com_candidatas)
+
+    # ---------------------------
+    # trilha
+    # ---------------------------
+    def _definir_estado(self, restricao, estado):
+        self._trilha.append((restricao, restricao.estado, None))
+        if estado == Restricao.ACEITA:
+            self.cobertura += self._pesos[restricao]
+        restricao.estado = estado
+
+    def _desfazer_ate(self, marca):
+        trilha = self._trilha
+        while len(trilha) > marca:
+            entrada = trilha.pop()
+            alvo, anterior = entrada[0], entrada[1]
+            if len(entrada) == 3:
+                if alvo.estado == Restricao.ACEITA:
+                    self.cobertura -= self._pesos[alvo]
+                alvo.estado = anterior
+            elif isinstance(alvo, Restricao):
+                alvo.vivas = anterior
+            else:
+                self.dominios[alvo] = anterior
+
+    # ---------------------------
+    # nó
+    # ---------------------------
+    def _escolher(self):
+        """
+        Pendente mais restrita, já refiltrada (None = folha). No caminho, sem
+        ramificar: pendente sem candidata viva vai para fora do dicionário e a
+        que já tem todas as letras fixadas pela chave é aceita.
+        """
+        # aceitar/rejeitar sem ramificar não muda domínios: uma passada na ordem basta,
+        # e uma contagem que caiu ao refiltrar continua sendo a menor das restantes
+        desempate = self._desempate
+        pendentes = sorted((r for r in self._com_candidatas if r.estado == Restricao.PENDENTE),
+                           key=lambda r: (len(r.vivas), desempate[r]))
+        dominios = self.dominios
+        for restricao in pendentes:
+            if self._filtrar(restricao) is None:
+                self._definir_estado(restricao, Restricao.REJEITADA)
+            elif len(restricao.vivas) == 1 and all(dominios[v] & (dominios[v] - 1) == 0 for v in restricao.distintas):
+                # todas as letras já fixadas pela chave: aceitar não restringe nada
+                self._definir_estado(restricao, Restricao.ACEITA)
+            else:
+                return restricao
+        return None
+
+    def _limite_superior(self):
+        return self.cobertura + sum(self._pesos[r] for r in self._com_candidatas
+                                    if r.estado == Restricao.PENDENTE and r.vivas)
+
+    def _atribuir(self, restricao, opcao):
+        """Aplica a opção (índice de candidata ou _FORA) com forward checking; False se esvaziar um domínio."""
+        if opcao == _FORA:
+            self._definir_estado(restricao, Restricao.REJEITADA)
+            return True
+        self._definir_estado(restricao, Restricao.ACEITA)
+        self._definir_vivas(restricao, [opcao])
+        dominios = self.dominios
+        fixadas = []
+        for v, bit in zip(restricao.variaveis, restricao.candidatas[opcao][1]):
+            if v < 0 or dominios[v] == bit:
+                continue
+            self._definir_dominio(v, bit)
+            fixadas.append(v)
+            for outra in self._presentes:
+                if outra != v and dominios[outra] & bit:
+                    novo = dominios[outra] & ~bit
+                    if not novo:
+                        return False
+                    self._definir_dominio(outra, novo)
+        for v in fixadas:
+            for vizinha in self._por_variavel[v]:
+                if vizinha.estado == Restricao.PENDENTE and vizinha.vivas:
+                    self._filtrar(vizinha)
+        return True
+
+    def _registrar_folha(self):
+        if self.cobertura > self.melhor_cobertura:
+            self.melhor_cobertura = self.cobertura
+            self.solucoes += 1
+            self._melhor_mapa = self.mapa()
+            self._melhor_usadas = ConsistenciaArco.palavras_usadas(self)
+
+    def _mergulhar(self):
+        """Orçamento acabou antes da 1ª folha: desce do nó atual só pela 1ª opção viável (sem retroceder)."""
+        while True:
+            restricao = self._escolher()
+            if restricao is None:
+                self._registrar_folha()
+                return
+            for opcao in restricao.vivas + [_FORA]:
+                marca = len(self._trilha)
+                if self._atribuir(restricao, opcao):
+                    break
+                self._desfazer_ate(marca)
+
+    # ---------------------------
+    # busca
+    # ---------------------------
+    def resolver(self):
+        """DFS até esgotar a árvore ou o orçamento; devolve o mapa da melhor solução."""
+        inicio = time.perf_counter()
+        self._trilha = []
+        pilha = []  # [restricao, opcoes, índice da opção atual, marca da trilha antes da opção]
+        descer = True
+        while True:
+            if descer:
+                if self.limite_nos is not None and self.nos >= self.limite_nos:
+                    break
+                self.nos += 1
+                if (self.limite_segundos is not None and self.nos % _CHECAR_TEMPO_A_CADA == 0
+                        and time.perf_counter() - inicio > self.limite_segundos):
+                    break
+                restricao = self._escolher()
+                if restricao is None:
+                    self._registrar_folha()
+                elif self._limite_superior() > self.melhor_cobertura:
+                    pilha.append([restricao, restricao.vivas + [_FORA], -1, len(self._trilha)])
+            # próxima opção do nó mais fundo que ainda tem alguma
+            descer = False
+            while pilha and not descer:
+                quadro = pilha[-1]
+                restricao, opcoes, _atual, marca = quadro
+                self._desfazer_ate(marca)
+                quadro[2] += 1
+                if quadro[2] >= len(opcoes):
+                    pilha.pop()
+                    continue
+                descer = self._atribuir(restricao, opcoes[quadro[2]])
+            if not descer:
+                self.completa = True  # árvore esgotada: a melhor solução é ótima
+                break
+        if self.melhor_cobertura < 0:
+            self._mergulhar()
+        self._desfazer_ate(0)
+        self._trilha = None
+        self.segundos = time.perf_counter() - inicio
+        return dict(self._melhor_mapa)
+
+    def palavras_usadas(self):
+        """Candidatas das palavras aceitas na melhor solução."""
+        return set(self._melhor_usadas)
+
+    def estatisticas(self):
+        return {
+            "palavras": len(self.restricoes),
+            "com_candidatas": len(self._com_candidatas),
+            "nos": self.nos,
+            "segundos": self.segundos,
+            "nos_por_segundo": self.nos / self.segundos if self.segundos > 0 else 0.0,
+            "solucoes": self.solucoes,
+            "completa": self.completa,
+            "cobertura": self.melhor_cobertura,
+            "cobertura_maxima": self.cobertura_maxima,
+            "verificacoes": self.verificacoes,
+            "letras_decididas": len(self._melhor_mapa),
+        }
@@ -0,0 +1,130 @@
+# ================================================================
+# cache_candidatas.py — memo das buscas de candidata compatível (Passo 10)
+#
+# Contém funções para:
+#  - guardar, por palavra parcialmente decifrada, o resultado de
+#    encontrar_candidata_compatível (candidata + novos mapeamentos ou "nenhuma")
+#  - invalidar só as entradas afetadas quando o estado cresce:
+#      * cifrado c mapeado        -> entradas cuja palavra contém c
+#      * letra clara v reservada  -> entradas cuja candidata usaria v
+#      * palavra marcada usada    -> entradas cuja candidata é essa palavra
+#  - limitar o número de entradas (LRU) e contar acertos/faltas
+#
+# Por que a invalidação fina basta: mapa_substituicao, letras_reservadas e
+# used_top_words só crescem. Uma candidata rejeitada continua rejeitada;
+# uma busca sem resultado só pode mudar se um cifrado da própria palavra
+# for mapeado; e a candidata encontrada só deixa de valer se ela for usada
+# ou se uma das letras claras que ela reservaria for tomada.
+# ================================================================
+
+from collections import OrderedDict, defaultdict
+
+from funcoes_decodificador import encontrar_candidata_compatível
+
+CAPACIDADE_PADRAO = 100_000
+
+
+class CacheCandidatas:
+    """
+    LRU de encontrar_candidata_compatível(palavra_atual, top_sorted, ...)
+    com chave (palavra_atual, versao_chave). `versao_chave` só muda em
+    invalidar_tudo() (ex.: estado recarregado ou trocado por inteiro); as
+    mudanças incrementais passam por registrar_mapeamentos/registrar_usada.
+    """
+
+    def __init__(self, top_sorted, indice=None, capacidade=CAPACIDADE_PADRAO):
+        self.top_sorted = top_sorted
+        self.indice = indice
+        self.capacidade = capacidade
+        self.versao_chave = 0
+        self.acertos = 0
+        self.faltas = 0
+        self.invalidadas = 0
+        self._entradas = OrderedDict()          # (palavra, versão) -> (candidata, novos)
+        self._por_cifrado = defaultdict(set)    # letra cifrada -> chaves
+        self._por_claro = defaultdict(set)      # letra clara da candidata -> chaves
+        self._por_candidata = defaultdict(set)  # candidata -> chaves
+
+    def __len__(self):
+        return len(self._entradas)
+
+    def buscar(self, palavra_atual, mapa_existente, letras_usadas, used_top_words):
+        """Mesmo retorno de encontrar_candidata_compatível, reaproveitando buscas anteriores."""
+        chave = (palavra_atual, self.versao_chave)
+        resultado = self._entradas.get(chave)
+        if resultado is not None:
+            self._entradas.move_to_end(chave)
+            self.acertos += 1
+            return resultado
+
+        self.faltas += 1
+        resultado = encontrar_candidata_compatível(
+            palavra_atual, self.top_sorted, mapa_existente, letras_usadas,
+            used_top_words=used_top_words, indice=self.indice
+        )
+        self._guardar(chave, resultado)
+        return resultado
+
+    def registrar_mapeamentos(self, pares):
+        """Novos pares (cifrado, claro) entraram no mapa (e o claro ficou reservado)."""
+        for cifrado, claro in pares:
+            self._remover(self._por_cifrado.get(cifrado, ()))
+            self._remover(self._por_claro.get(claro, ()))
+
+    def registrar_usada(self, palavra):
+        """`palavra` entrou em used_top_words."""
+        self._remover(self._por_candidata.get(palavra, ()))
+
+    def invalidar_tudo(self):
+        self.invalidadas += len(self._entradas)
+        self.versao_chave += 1
+        self._entradas.clear()
+        self._por_cifrado.clear()
+        self._por_claro.clear()
+        self._por_candidata.clear()
+
+    def estatisticas(self):
+        consultas = self.acertos + self.faltas
+        return {
+            "acertos": self.acertos,
+            "faltas": self.faltas,
+            "taxa_acerto": self.acertos / consultas if consultas else 0.0,
+            "invalidadas": self.invalidadas,
+            "entradas": len(self._entradas),
+        }
+
+    # ---------------------------
+    # internos
+    # ---------------------------
+    def _chaves_de_indice(self, chave, resultado):
+        """(índice, chave do índice) em que a entrada aparece."""
+        palavra_atual = chave[0]
+        candidata, novos = resultado
+        pares = [(self._por_cifrado, ch) for ch in set(palavra_atual) if not ch.islower()]
+        if candidata is not None:
+            pares.append((self._por_candidata, candidata))
+            pares.extend((self._por_claro, claro) for claro in {claro for _c, claro in novos})
+        return pares
+
+    def _guardar(self, chave, resultado):
+        self._entradas[chave] = resultado
+        for indice, k in self._chaves_de_indice(chave, resultado):
+            indice[k].add(chave)
+        if len(self._entradas) > self.capacidade:
+            self._desindexar(*self._entradas.popitem(last=False))
+
+    def _remover(self, chaves):
+        for chave in list(chaves):
+            resultado = self._entradas.pop(chave, None)
+            if resultado is not None:
+                self.invalidadas += 1
+                self._desindexar(chave, resultado)
+
+    def _desindexar(self, chave, resultado):
+        for indice, k in self._chaves_de_indice(chave, resultado):
+            conjunto = indice.get(k)
+            if conjunto is None:
+                continue
+            conjunto.discard(chave)
+            if not conjunto:
+                del indice[k]
@@ -0,0 +1,110 @@
+# ================================================================
+# cache_decodificacao.py — cache em disco dos Passos 1-5 de decrypt.py
+#
+# Contém funções para:
+#  - calcular a chave do cache (hash do conteúdo do arquivo de entrada +
+#    formato de entrada + caracteres_printaveis + código do decodificador)
+#  - gravar o armazém de tokens (linhas originais + palavras_pos) e os blocos
+#    em formato compacto (JSON compactado com gzip, posições em vez de tuplas
+#    repetidas)
+#  - carregar o cache (ArmazemTokens + blocos), devolvendo None quando não
+#    existe ou está corrompido
+#
+# Qualquer mudança no arquivo de entrada, nas configurações de leitura ou no
+# código dos Passos 1-5 (os módulos de _ARQUIVOS_DECODIFICADOR e o próprio
+# decrypt.py, onde ficam a extração do Passo 1, a padronização e a escolha do
+# leitor) gera outra chave: a invalidação é automática. O dicionário não entra
+# na chave porque os Passos 1-5 não dependem dele.
+# ================================================================
+
+import gzip
+import hashlib
+import json
+import os
+from pathlib import Path
+
+from armazem_tokens import ArmazemTokens
+
+PASTA_CACHE_PADRAO = ".cache_decodificacao"
+VERSAO_FORMATO = 1
+
+# arquivos cujo código define o resultado dos Passos 1-5 (decrypt.py inclusive:
+# editar as configurações dele também invalida o cache, o que é conservador)
+_ARQUIVOS_DECODIFICADOR = ("decrypt.py", "funcoes_decodificador.py", "entrada_binaria.py", "tokenizador.py",
+                           "armazem_tokens.py")
+
+_TAMANHO_LEITURA = 1 << 20
+
+
+def chave_de_cache(caminho_entrada, caracteres_printaveis, unknown_char="?",
+                   formato_entrada="bits", largura_grupo=None):
+    """
+    Hash (sha256, hex) do conteúdo de `caminho_entrada` e das configurações
+    do decodificador.
+    """
+    h = hashlib.sha256()
+    h.update(f"v{VERSAO_FORMATO}\0{unknown_char}\0{formato_entrada}\0{largura_grupo}\0".encode("utf-8"))
+    h.update(json.dumps(caracteres_printaveis, sort_keys=True).encode("utf-8"))
+
+    pasta_modulo = Path(__file__).resolve().parent
+    for nome in _ARQUIVOS_DECODIFICADOR:
+        h.update(b"\0")
+        h.update((pasta_modulo / nome).read_bytes())
+
+    h.update(b"\0")
+    with open(caminho_entrada, "rb") as f:
+        while True:
+            bloco = f.read(_TAMANHO_LEITURA)
+            if not bloco:
+                break
+            h.update(bloco)
+    return h.hexdigest()
+
+
+def _caminho_cache(pasta, chave):
+    return os.path.join(pasta, f"{chave}.json.gz")
+
+
+def salvar_cache(pasta, chave, armazem, blocos):
+    """
+    Grava o resultado dos Passos 1-5 (`armazem` é o ArmazemTokens do Passo 4). Formato:
+      - linhas: original_lines_by_pos como lista (índice = posição)
+      - palavras: [[pos, palavra], ...] (palavras_pos)
+      - blocos: listas de posições; as palavras vêm de `palavras`
+    """
+    dados = {
+        "versao": VERSAO_FORMATO,
+        "linhas": [armazem.linha(i) for i in range(armazem.total_posicoes)],
+        "palavras": [[pos, p] for pos, p in armazem.palavras_pos()],
+        "blocos": [[pos for pos, _ in bloco] for bloco in blocos],
+    }
+    os.makedirs(pasta, exist_ok=True)
+    destino = _caminho_cache(pasta, chave)
+    temporario = f"{destino}.{os.getpid()}.tmp"
+    with gzip.open(temporario, "wt", encoding="utf-8") as f:
+        json.dump(dados, f, ensure_ascii=False, separators=(",", ":"))
+    os.replace(temporario, destino)
+    return destino
+
+
+def carregar_cache(pasta, chave):
+    """
+    Retorna (armazem, blocos, flat) como nos Passos 4 e 5 (armazem é um
+    ArmazemTokens), ou None se não houver cache válido para `chave`.
+    """
+    origem = _caminho_cache(pasta, chave)
+    if not os.path.exists(origem):
+        return None
+    try:
+        with gzip.open(origem, "rt", encoding="utf-8") as f:
+            dados = json.load(f)
+        if dados.get("versao") != VERSAO_FORMATO:
+            return None
+        armazem = ArmazemTokens.de_palavras_pos(dados["palavras"], dados["linhas"])
+        palavra_por_pos = dict(armazem.palavras_pos())
+        blocos = [[(pos, palavra_por_pos[pos]) for pos in bloco] for bloco in dados["blocos"]]
+    except (OSError, EOFError, ValueError, KeyError, TypeError, IndexError):
+        return None
+
+    flat = [item for bloco in blocos for item in bloco]
+    return armazem, blocos, flat
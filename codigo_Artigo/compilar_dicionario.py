@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+compilar_dicionario.py
+Compila uma lista ranqueada de palavras (módulo .py com um dict literal ou
+.txt com "PALAVRA [valor]" por linha) para o formato binário .dicc de
+dicionario_compilado.py, aberto com mmap e sem parsing, ou (--formato sqlite)
+para um banco SQLite indexado de dicionario_sqlite.py, consultado sem carregar
+o vocabulário na memória.
+
+Uso:
+    python compilar_dicionario.py top_words.py
+    python compilar_dicionario.py ../TENTATIVA_FINAL/2top_words.py --variavel top_words_english_rank
+    python compilar_dicionario.py ../codigo_NoMuque/top_words_banco_de_palavras.py --ordem score
+    python compilar_dicionario.py lista.txt -o lista.dicc
+    python compilar_dicionario.py vocabulario.txt --formato sqlite
+
+--ordem rank  (padrão): menor valor = melhor palavra (top_sorted do decrypt.py)
+--ordem score:          maior valor = melhor palavra (buscas do codigo_NoMuque)
+"""
+
+import argparse
+import os
+import sys
+import time
+
+from dicionario_compilado import (
+    EXTENSAO,
+    ORDEM_RANK,
+    ORDEM_SCORE,
+    DicionarioCompilado,
+    compilar_dicionario,
+    ler_fonte_dicionario,
+)
+from dicionario_sqlite import EXTENSAO as EXTENSAO_SQLITE, DicionarioSQLite, compilar_dicionario_sqlite
+
+FORMATO_DICC = "dicc"
+FORMATO_SQLITE = "sqlite"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compila um dicionário ranqueado para .dicc (mmap) ou SQLite")
+    parser.add_argument("origem", help="módulo .py com um dict literal ou .txt com 'PALAVRA [valor]' por linha")
+    parser.add_argument("-o", "--saida", default=None,
+                        help=f"arquivo de saída (padrão: <origem>{EXTENSAO} ou <origem>{EXTENSAO_SQLITE})")
+    parser.add_argument("--variavel", default=None, help="nome do dict no módulo .py (padrão: o primeiro dict)")
+    parser.add_argument("--ordem", choices=(ORDEM_RANK, ORDEM_SCORE), default=ORDEM_RANK,
+                        help="como ordenar os valores (padrão: rank crescente)")
+    parser.add_argument("--formato", choices=(FORMATO_DICC, FORMATO_SQLITE), default=FORMATO_DICC,
+                        help="dicc (mmap, padrão) ou sqlite (consultas SQL indexadas)")
+    args = parser.parse_args()
+
+    extensao = EXTENSAO_SQLITE if args.formato == FORMATO_SQLITE else EXTENSAO
+    saida = args.saida or os.path.splitext(args.origem)[0] + extensao
+
+    inicio = time.perf_counter()
+    try:
+        palavras = ler_fonte_dicionario(args.origem, args.variavel)
+    except (OSError, SyntaxError, ValueError) as e:
+        print(f"[ERRO] {e}")
+        sys.exit(1)
+    compilar = compilar_dicionario_sqlite if args.formato == FORMATO_SQLITE else compilar_dicionario
+    total = compilar(palavras, saida, args.ordem)
+    tempo = time.perf_counter() - inicio
+
+    if args.formato == FORMATO_SQLITE:
+        with DicionarioSQLite(saida) as dicionario:
+            print(f"[RESULT] {len(dicionario)} palavras -> {saida} ({os.path.getsize(saida) / 1024:.1f} KB, "
+                  f"ordem {dicionario.ordem}) em {tempo:.2f}s")
+        return
+
+    with DicionarioCompilado(saida) as dicionario:
+        print(f"[RESULT] {total} palavras -> {saida} ({os.path.getsize(saida) / 1024:.1f} KB, "
+              f"{dicionario.total_tamanhos} comprimentos, {dicionario.total_padroes} padrões) em {tempo:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,335 @@
+# ================================================================
+# consistencia_arco.py — Passo 10 como problema de restrições (CSP)
+#
+# Contém funções para:
+#  - modelar cada letra cifrada (A-Z) como uma variável cujo domínio é um
+#    bitmask de 26 bits sobre as letras claras (bit 0 = 'a' ... bit 25 = 'z')
+#  - tratar cada palavra cifrada distinta como uma restrição: o texto claro
+#    dela é uma das candidatas do dicionário (mesmo comprimento/padrão,
+#    vindas de indice.candidatas(), como em encontrar_candidata_compatível)
+#  - propagar até o ponto fixo (AC-3): cada palavra descarta as candidatas
+#    incompatíveis com os domínios e restringe o domínio de cada letra à
+#    união das letras que as candidatas vivas ainda permitem; letra com
+#    domínio unitário sai do domínio das outras (substituição é bijetora)
+#  - decodificar: domínios unitários viram mapa_substituicao
+#
+# O texto tem palavras fora do dicionário (nomes, palavras raras), que como
+# restrição rígida esvaziariam domínios. Por isso as palavras entram uma a
+# uma, a mais restrita primeiro (menos candidatas vivas, depois mais
+# ocorrências, depois mais longa); uma palavra cuja entrada leva a um
+# domínio vazio (ou que fica sem candidatas) é desfeita pela trilha e
+# marcada como fora do dicionário. Palavras ainda pendentes não restringem
+# nada: as que tiveram alguma letra alterada são refiltradas uma vez antes
+# de cada escolha (forward checking), e a que ficou sem candidata compatível
+# com o que já foi aceito sai como fora do dicionário.
+# No fim, palavras aceitas que ainda têm mais de uma candidata viva são
+# fixadas na primeira candidata (ordem de rank) que propaga sem conflito.
+#
+# `verificacoes` conta os testes candidata x domínios (a mesma unidade das
+# comparações de encontrar_candidata_compatível), para comparar com a
+# varredura por thresholds.
+# ================================================================
+
+from collections import Counter
+
+_LETRAS = 26
+
+
+def _bit_claro(ch):
+    """Bit da letra clara (a-z, sem distinção de caixa) ou 0 se não for letra ASCII."""
+    codigo = ord(ch.lower()) - 97
+    return 1 << codigo if 0 <= codigo < _LETRAS else 0
+
+
+def _variavel(ch):
+    """Índice 0..25 da letra cifrada (maiúscula ASCII) ou -1 (letra já clara/literal)."""
+    codigo = ord(ch) - 65
+    return codigo if 0 <= codigo < _LETRAS else -1
+
+
+def _unitario(dominio):
+    return dominio != 0 and dominio & (dominio - 1) == 0
+
+
+def _letra_do_bit(bit):
+    return chr(97 + bit.bit_length() - 1)
+
+
+class Restricao:
+    """Uma palavra cifrada distinta e as suas candidatas (bits claros por posição)."""
+
+    __slots__ = ("palavra", "ocorrencias", "primeira_pos", "variaveis", "distintas",
+                 "candidatas", "vivas", "estado")
+
+    PENDENTE, ACEITA, REJEITADA = 0, 1, 2
+
+    def __init__(self, palavra, ocorrencias, primeira_pos, candidatas):
+        self.palavra = palavra
+        self.ocorrencias = ocorrencias
+        self.primeira_pos = primeira_pos
+        self.variaveis = tuple(_variavel(ch) for ch in palavra)
+        self.distintas = tuple(sorted({v for v in self.variaveis if v >= 0}))
+        self.candidatas = candidatas  # [(palavra_dicionario, (bit por posição))]
+        self.vivas = list(range(len(candidatas)))
+        self.estado = Restricao.PENDENTE
+
+
+def _bits_da_candidata(cifrada, variaveis, candidata):
+    """
+    Bits claros de `candidata` posição a posição, ou None se ela não for
+    compatível com a palavra cifrada: mesma letra cifrada -> mesma clara,
+    letras cifradas diferentes -> claras diferentes, letra já clara na
+    cifrada -> a mesma letra na candidata.
+    """
+    if len(candidata) != len(cifrada):
+        return None
+    bits = []
+    por_variavel = {}
+    usados = 0
+    for ch_cifrado, v, ch_claro in zip(cifrada, variaveis, candidata):
+        bit = _bit_claro(ch_claro)
+        if not bit:
+            return None
+        if v < 0:
+            if _bit_claro(ch_cifrado) != bit:
+                return None
+        else:
+            anterior = por_variavel.get(v)
+            if anterior is None:
+                if usados & bit:
+                    return None
+                por_variavel[v] = bit
+                usados |= bit
+            elif anterior != bit:
+                return None
+        bits.append(bit)
+    return tuple(bits)
+
+
+class ConsistenciaArco:
+    """
+    Resolvedor por consistência de arco sobre as palavras cifradas.
+
+      palavras_pos    -> [(pos, palavra_cifrada), ...] (ex.: palavras_ordenadas_pos)
+      indice          -> objeto com candidatas(palavra) -> (palavra, rank) em ordem de rank
+                         (IndiceIsomorfos, DicionarioCompilado/SQLite/Compartilhado)
+      mapa_inicial    -> {cifrada: clara} já decidido (ex.: checkpoint dos Passos 6-8)
+
+    resolver() propaga, decodifica e devolve o mapa {cifrada maiúscula: clara minúscula}.
+    """
+
+    def __init__(self, palavras_pos, indice, mapa_inicial=None):
+        self.verificacoes = 0
+        self.propagacoes = 0
+        self._trilha = None
+        self._sujas = set()
+
+        # mapa_inicial já decidido: aplicado às palavras (letra clara = literal, que
+        # também filtra as candidatas no índice) e as letras claras dele saem dos domínios
+        pares = {c: v for c, v in (mapa_inicial or {}).items() if len(c) == 1 and len(v) == 1}
+        tabela = str.maketrans(pares) if pares else None
+        reservadas = 0
+        for clara in pares.values():
+            reservadas |= _bit_claro(clara)
+        self.dominios = [((1 << _LETRAS) - 1) & ~reservadas] * _LETRAS
+
+        ocorrencias = Counter()
+        primeira_pos = {}
+        traduzidas = {}
+        for pos, palavra in palavras_pos:
+            if not palavra:
+                continue
+            if tabela is not None:
+                atual = traduzidas.get(palavra)
+                if atual is None:
+                    atual = traduzidas[palavra] = palavra.translate(tabela)
+                palavra = atual
+            ocorrencias[palavra] += 1
+            primeira_pos.setdefault(palavra, pos)
+
+        self.restricoes = []
+        self._por_variavel = [[] for _ in range(_LETRAS)]
+        presentes = set()
+        for palavra, contagem in ocorrencias.items():
+            variaveis = tuple(_variavel(ch) for ch in palavra)
+            if all(v < 0 for v in variaveis):
+                continue
+            presentes.update(v for v in variaveis if v >= 0)
+            candidatas = []
+            for candidata, _rank in indice.candidatas(palavra):
+                bits = _bits_da_candidata(palavra, variaveis, candidata)
+                if bits is not None and not any(v >= 0 and bit & reservadas for v, bit in zip(variaveis, bits)):
+                    candidatas.append((candidata, bits))
+            restricao = Restricao(palavra, contagem, primeira_pos[palavra], candidatas)
+            if not candidatas:
+                restricao.estado = Restricao.REJEITADA
+            self.restricoes.append(restricao)
+            for v in restricao.distintas:
+                self._por_variavel[v].append(restricao)
+        # a diferença entre letras (bijeção) só envolve as letras cifradas ainda abertas no texto
+        self._presentes = tuple(sorted(presentes))
+
+    # ---------------------------
+    # trilha (desfazer a entrada de uma palavra)
+    # ---------------------------
+    def _definir_dominio(self, v, dominio):
+        if self._trilha is not None:
+            self._trilha.append((v, self.dominios[v]))
+        self.dominios[v] = dominio
+
+    def _definir_vivas(self, restricao, vivas):
+        if self._trilha is not None:
+            self._trilha.append((restricao, restricao.vivas))
+        restricao.vivas = vivas
+
+    def _desfazer(self, trilha):
+        for alvo, anterior in reversed(trilha):
+            if isinstance(alvo, Restricao):
+                alvo.vivas = anterior
+            else:
+                self.dominios[alvo] = anterior
+
+    # ---------------------------
+    # propagação
+    # ---------------------------
+    def _filtrar(self, restricao):
+        """Candidatas vivas compatíveis com os domínios atuais (None = nenhuma)."""
+        dominios = self.dominios
+        variaveis = restricao.variaveis
+        candidatas = restricao.candidatas
+        vivas = []
+        for i in restricao.vivas:
+            bits = candidatas[i][1]
+            self.verificacoes += 1
+            for v, bit in zip(variaveis, bits):
+                if v >= 0 and not dominios[v] & bit:
+                    break
+            else:
+                vivas.append(i)
+        if len(vivas) != len(restricao.vivas):
+            self._definir_vivas(restricao, vivas)
+        return vivas or None
+
+    def _suportes(self, restricao):
+        """{variável: união dos bits claros das candidatas vivas}."""
+        suportes = dict.fromkeys(restricao.distintas, 0)
+        candidatas = restricao.candidatas
+        for i in restricao.vivas:
+            for v, bit in zip(restricao.variaveis, candidatas[i][1]):
+                if v >= 0:
+                    suportes[v] |= bit
+        return suportes
+
+    def _propagar(self, fila_palavras, fila_unitarias):
+        """
+        AC-3 até o ponto fixo sobre as palavras aceitas. fila_palavras: restrições
+        a revisar; fila_unitarias: variáveis que ficaram unitárias (diferença entre
+        letras). Devolve False se algum domínio (ou uma palavra aceita) ficou vazio.
+        """
+        pendentes = list(fila_palavras)
+        na_fila = set(map(id, pendentes))
+        while pendentes or fila_unitarias:
+            self.propagacoes += 1
+            mudadas = []
+            if fila_unitarias:
+                v = fila_unitarias.pop()
+                bit = self.dominios[v]
+                for outra in self._presentes:
+                    if outra != v and self.dominios[outra] & bit:
+                        novo = self.dominios[outra] & ~bit
+                        if not novo:
+                            return False
+                        self._definir_dominio(outra, novo)
+                        mudadas.append(outra)
+            else:
+                restricao = pendentes.pop()
+                na_fila.discard(id(restricao))
+                if self._filtrar(restricao) is None:
+                    return False
+                for v, suporte in self._suportes(restricao).items():
+                    novo = self.dominios[v] & suporte
+                    if novo != self.dominios[v]:
+                        if not novo:
+                            return False
+                        self._definir_dominio(v, novo)
+                        mudadas.append(v)
+            for v in mudadas:
+                if _unitario(self.dominios[v]):
+                    fila_unitarias.append(v)
+                for vizinha in self._por_variavel[v]:
+                    if vizinha.estado == Restricao.PENDENTE:
+                        self._sujas.add(vizinha)
+                    elif vizinha.estado == Restricao.ACEITA and id(vizinha) not in na_fila:
+                        pendentes.append(vizinha)
+                        na_fila.add(id(vizinha))
+        return True
+
+    def _tentar(self, restricao, vivas=None):
+        """Aceita `restricao` (opcionalmente só com `vivas`) e propaga; desfaz tudo se houver conflito."""
+        self._trilha = trilha = []
+        estado_anterior = restricao.estado
+        restricao.estado = Restricao.ACEITA
+        if vivas is not None:
+            self._definir_vivas(restricao, vivas)
+        ok = self._propagar([restricao], [])
+        self._trilha = None
+        if not ok:
+            self._desfazer(trilha)
+            restricao.estado = estado_anterior
+        return ok
+
+    # ---------------------------
+    # resolução
+    # ---------------------------
+    def _proxima_pendente(self):
+        """Pendente com menos candidatas vivas (refiltra antes as que tiveram letra alterada)."""
+        for restricao in self._sujas:
+            if restricao.estado == Restricao.PENDENTE and self._filtrar(restricao) is None:
+                # sem candidata compatível com o que já foi aceito: fora do dicionário
+                restricao.estado = Restricao.REJEITADA
+        self._sujas.clear()
+        pendentes = [r for r in self.restricoes if r.estado == Restricao.PENDENTE]
+        if not pendentes:
+            return None
+        return min(pendentes, key=lambda r: (len(r.vivas), -r.ocorrencias, -len(r.palavra), r.primeira_pos))
+
+    def resolver(self):
+        """Aceita as palavras (a mais restrita primeiro), fixa as ambíguas e devolve o mapa."""
+        while True:
+            restricao = self._proxima_pendente()
+            if restricao is None:
+                break
+            if not self._tentar(restricao):
+                restricao.estado = Restricao.REJEITADA
+
+        # decodificação: palavras aceitas ainda ambíguas ficam com a primeira candidata viável
+        ambiguas = sorted((r for r in self.restricoes if r.estado == Restricao.ACEITA and len(r.vivas) > 1),
+                          key=lambda r: (-r.ocorrencias, -len(r.palavra), r.primeira_pos))
+        for restricao in ambiguas:
+            if len(restricao.vivas) <= 1:
+                continue
+            for i in list(restricao.vivas):
+                if self._tentar(restricao, [i]):
+                    break
+        return self.mapa()
+
+    def mapa(self):
+        """{letra cifrada: letra clara} dos domínios unitários (só as letras fora do mapa_inicial)."""
+        return {chr(65 + v): _letra_do_bit(self.dominios[v])
+                for v in self._presentes if _unitario(self.dominios[v])}
+
+    def palavras_usadas(self):
+        """Palavras do dicionário que são a única candidata viva de uma palavra aceita."""
+        return {r.candidatas[r.vivas[0]][0] for r in self.restricoes
+                if r.estado == Restricao.ACEITA and len(r.vivas) == 1}
+
+    def estatisticas(self):
+        contagem = Counter(r.estado for r in self.restricoes)
+        return {
+            "palavras": len(self.restricoes),
+            "aceitas": contagem[Restricao.ACEITA],
+            "fora_do_dicionario": contagem[Restricao.REJEITADA],
+            "verificacoes": self.verificacoes,
+            "propagacoes": self.propagacoes,
+            "letras_decididas": len(self.mapa()),
+        }
@@ -9,6 +9,7 @@ Comentários em cada passo no formato pedido.
 import string
 import re
 import os
+import sys
 import json
 import unicodedata
 from collections import Counter
@@ -16,9 +17,11 @@ from collections import Counter
 from caracteres_printaveis import caracteres_printaveis
 from funcoes_decodificador import (
     padronizar_para_8bits,
-    buscar_e_substituir_por_dicionario,
-    associar_palavras_com_posicao,
+    decodificar_em_lote,
+    armazem_de_sequencias,
+    armazem_de_fluxo,
     ordenar_palavras_por_tamanho_em_blocos,
+    Dicionario,
     gerar_mapeamentos_para_primeira_palavra,
     aplicar_um_mapeamento_em_posicoes,
     aplicar_mapeamentos_em_posicoes,
@@ -27,7 +30,17 @@ from funcoes_decodificador import (
     restaurar_por_posicao,
     aplicar_mapeamento_em_texto,
 )
-from top_words import top_words
+from armazem_tokens import EstadoPorId
+from entrada_binaria import decodificar_em_fluxo, decodificar_mmap, decodificar_formato
+from indice_isomorfos import IndiceIsomorfos
+from cache_candidatas import CacheCandidatas
+from consistencia_arco import ConsistenciaArco
+from busca_retrocesso import BuscaRetrocesso
+from recozimento_simulado import ITERACOES, REINICIOS, ModeloNgramas, RecozimentoSimulado
+from dicionario_compilado import ORDEM_RANK, DicionarioCompilado
+from dicionario_sqlite import EXTENSAO as EXTENSAO_SQLITE, DicionarioSQLite
+from dicionario_compartilhado import VARIAVEL_AMBIENTE as VARIAVEL_DICIONARIO_COMPARTILHADO, DicionarioCompartilhado
+from cache_decodificacao import chave_de_cache, carregar_cache, salvar_cache, PASTA_CACHE_PADRAO
 
 # =====================================================================
 # Configurações principais
@@ -36,8 +49,28 @@ DEBUG = False                     # Ativar/desativar prints detalhados
 arquivo_entrada = "encoded_EXIST.txt"   # Nome do arquivo de entrada
 passo_threshold = 2               # decremento em pontos percentuais para thresholds
 limite_threshold = 34             # limite mínimo inclusivo para thresholds
+motor_passo10 = "limiares"        # "limiares" (varredura por thresholds) | "arco" (restrições + consistência de arco) | "retrocesso" (DFS) | "recozimento" (simulated annealing)
+limite_nos_retrocesso = 200_000   # orçamento da busca com retrocesso (None = sem limite)
+limite_segundos_retrocesso = 10.0
+arquivo_ngramas = None            # tabela <saida>_ngramas_4.txt do ingerir_corpus.py (None = modelo derivado do dicionário)
+iteracoes_recozimento = ITERACOES # trocas avaliadas por reinício do recozimento
+reinicios_recozimento = REINICIOS
+leitor_entrada = "texto"          # "texto" (lê tudo + regex) | "fluxo" (blocos, memória constante) | "mmap"
+tamanho_bloco_fluxo = 1 << 20     # caracteres lidos por bloco no leitor "fluxo"
+formato_entrada = "bits"          # "bits" (grupos separados) | "bruto" | "hex" | "base64" | "bits_continuos"
+largura_grupo = None              # bits por caractere em "bits_continuos" (None = inferida)
+usar_cache_decodificacao = True   # reaproveita os Passos 1-5 se entrada/dicionário não mudaram
+pasta_cache_decodificacao = PASTA_CACHE_PADRAO
+arquivo_dicionario = None         # .dicc ou .sqlite gerado por compilar_dicionario.py (None = top_words.py)
+exigir_padrao_isomorfo = True     # busca de candidatas só entre palavras com o mesmo padrão de repetição (LIYL ~ THAT)
+# nome do bloco de memória compartilhada com o dicionário (publicado por decrypt_lote.py); tem prioridade sobre arquivo_dicionario
+dicionario_compartilhado = os.environ.get(VARIAVEL_DICIONARIO_COMPARTILHADO)
 # =====================================================================
 
+# arquivo de entrada também pode vir da linha de comando: python decrypt.py <arquivo>
+if len(sys.argv) > 1:
+    arquivo_entrada = sys.argv[1]
+
 # ------------------------
 # Normalização / utilitários
 # ------------------------
@@ -49,8 +82,63 @@ def _normalizar_token(t: str) -> str:
     s = "".join(ch for ch in s if not unicodedata.combining(ch))
     return s.lower()
 
-top_set_normalized = {_normalizar_token(w) for w in top_words.keys()}
-top_sorted = sorted(top_words.items(), key=lambda item: item[1])
+if dicionario_compartilhado:
+    # dicionário e índices já montados pelo processo pai: anexados só para leitura,
+    # sem importar top_words.py nem reconstruir top_sorted/conjuntos/índices neste processo
+    try:
+        dicionario_anexado = DicionarioCompartilhado(dicionario_compartilhado, exigir_isomorfo=exigir_padrao_isomorfo,
+                                                     ordem=ORDEM_RANK)
+    except FileNotFoundError:
+        raise SystemExit(f"Bloco de memória compartilhada '{dicionario_compartilhado}' não existe: "
+                         f"{VARIAVEL_DICIONARIO_COMPARTILHADO} aponta para um dicionário já fechado "
+                         "(remova a variável ou rode pelo decrypt_lote.py)")
+    top_set_normalized = dicionario_anexado.normalizadas
+    top_sorted = None
+    indice_candidatas = dicionario_anexado
+    dicionario_ranqueado = dicionario_anexado
+elif arquivo_dicionario and arquivo_dicionario.endswith(EXTENSAO_SQLITE):
+    # vocabulário em SQLite: nada é carregado na memória; buscas de candidata,
+    # primeira palavra do Passo 6 e pertinência (usadas / Passo 12) viram consultas indexadas
+    dicionario_sqlite = DicionarioSQLite(arquivo_dicionario, exigir_isomorfo=exigir_padrao_isomorfo, ordem=ORDEM_RANK)
+    top_set_normalized = dicionario_sqlite.normalizadas
+    top_sorted = None
+    indice_candidatas = dicionario_sqlite
+    dicionario_ranqueado = dicionario_sqlite
+elif arquivo_dicionario:
+    # dicionário compilado: aberto com mmap, já na ordem de rank (mesmo top_sorted); os buckets
+    # por comprimento/padrão e as formas normalizadas do arquivo fazem o papel dos índices
+    # e de top_set_normalized, sem decodificar o vocabulário nem reconstruir nada ao carregar;
+    # um .dicc compilado com --ordem score (codigo_NoMuque) inverteria a preferência: é recusado
+    dicionario_compilado = DicionarioCompilado(arquivo_dicionario, exigir_isomorfo=exigir_padrao_isomorfo,
+                                               ordem=ORDEM_RANK)
+    top_set_normalized = dicionario_compilado.normalizadas
+    top_sorted = None
+    indice_candidatas = dicionario_compilado
+    dicionario_ranqueado = dicionario_compilado
+else:
+    from top_words import top_words
+
+    top_set_normalized = {_normalizar_token(w) for w in top_words.keys()}
+    top_sorted = sorted(top_words.items(), key=lambda item: item[1])
+    # índice por comprimento/padrão isomorfo: montado uma vez, consultado em cada busca de candidata
+    indice_candidatas = IndiceIsomorfos(top_sorted, exigir_isomorfo=exigir_padrao_isomorfo)
+    # listas por comprimento + cursor da primeira palavra não usada (Passo 6)
+    dicionario_ranqueado = Dicionario(top_sorted)
+
+### ================================================================== ###
+### Cache dos Passos 1-5                                               ###
+### ================================================================== ###
+# chave = hash do conteúdo do arquivo + caracteres_printaveis + código do decodificador
+# com cache válido, os Passos 1-5 reaproveitam armazem_tokens (palavras_pos/original_lines_by_pos) e blocos
+# (invalidação automática: qualquer mudança gera outra chave)
+dados_cache = None
+if usar_cache_decodificacao:
+    chave_cache = chave_de_cache(arquivo_entrada, caracteres_printaveis,
+                                 formato_entrada=formato_entrada, largura_grupo=largura_grupo)
+    dados_cache = carregar_cache(pasta_cache_decodificacao, chave_cache)
+    if DEBUG:
+        estado = "encontrado" if dados_cache is not None else "ausente"
+        print(f"\n[DEBUG] Cache dos Passos 1-5 {estado} (chave {chave_cache[:12]})")
 
 ### ================================================================== ###
 ### Passo 1 - Separando cada caractere por linha                       ###
@@ -62,12 +150,19 @@ top_sorted = sorted(top_words.items(), key=lambda item: item[1])
 if DEBUG:
     print("\n[DEBUG] Iniciando Passo 1: Separando caracteres printáveis...")
 
-with open(arquivo_entrada, "r", encoding="utf-8") as f:
-    data = f.read()
+if dados_cache is not None:
+    sequencias = []
+elif formato_entrada != "bits" or leitor_entrada in ("fluxo", "mmap"):
+    # leitores de entrada_binaria: "fluxo" decodifica dentro do gerador consumido no Passo 4,
+    # "mmap" e os formatos compactos (bruto/hex/base64/bits_continuos) no Passo 3
+    sequencias = []
+else:
+    with open(arquivo_entrada, "r", encoding="utf-8") as f:
+        data = f.read()
 
-# regex para caracteres printáveis (sem whitespace final)
-chars_regex = re.escape(string.printable.strip())
-sequencias = re.findall(f"[{chars_regex}]+", data)
+    # regex para caracteres printáveis (sem whitespace final)
+    chars_regex = re.escape(string.printable.strip())
+    sequencias = re.findall(f"[{chars_regex}]+", data)
 
 if DEBUG:
     print(f"[DEBUG] {len(sequencias)} sequências encontradas:")
@@ -87,7 +182,8 @@ if DEBUG:
 if DEBUG:
     print("\n[DEBUG] Iniciando Passo 2: Padronizando conteúdo para 8 bits...")
 
-sequencias_padronizadas = padronizar_para_8bits(sequencias)
+# fora do DEBUG a padronização acontece dentro de decodificar_em_lote (Passo 3)
+sequencias_padronizadas = padronizar_para_8bits(sequencias) if DEBUG else sequencias
 
 if DEBUG:
     print(f"[DEBUG] {len(sequencias_padronizadas)} sequências padronizadas:")
@@ -103,11 +199,19 @@ if DEBUG:
 ### Passo 3 - Busca e substituição no dicionário                       ###
 ### ================================================================== ###
 # converte cada byte (8 bits) em caractere usando o dicionário bin->char
+# caminho em lote: fluxo de bits inteiro -> bytes -> tabela de 256 posições
 # resultado: lista 'decodificadas' com linhas de texto decodificadas
 if DEBUG:
     print("\n[DEBUG] Iniciando Passo 3: Substituindo binário por caracteres...")
 
-decodificadas = buscar_e_substituir_por_dicionario(sequencias_padronizadas, caracteres_printaveis)
+if dados_cache is not None:
+    decodificadas = []
+elif formato_entrada != "bits":
+    decodificadas = [decodificar_formato(arquivo_entrada, formato_entrada, caracteres_printaveis, largura_grupo)]
+elif leitor_entrada == "mmap":
+    decodificadas = [decodificar_mmap(arquivo_entrada, caracteres_printaveis)]
+else:
+    decodificadas = decodificar_em_lote(sequencias_padronizadas, caracteres_printaveis)
 
 if DEBUG:
     print(f"[DEBUG] {len(decodificadas)} sequências decodificadas:")
@@ -125,13 +229,25 @@ if DEBUG:
 # limpa tokens, trata apóstrofo/traço/--, remove acentos e pontuação
 # guarda original_lines_by_pos para reconstrução posterior (passo 13)
 # retorna palavras_pos = [(pos, palavra_limpa), ...]
+# armazem_tokens: vocabulário internado (id por palavra distinta) + colunas em array
+# (posição, id, sufixo); original_lines_by_pos é uma visão sobre o texto do armazém
 if DEBUG:
     print("\n[DEBUG] Iniciando Passo 4: Associando cada linha a uma palavra e lembrando posição (limpeza: apenas letras, trata apóstrofos/traço/--)...")
 
-palavras_pos, original_lines_by_pos = associar_palavras_com_posicao(decodificadas)
+if dados_cache is not None:
+    armazem_tokens = dados_cache[0]
+elif leitor_entrada == "fluxo" and formato_entrada == "bits":
+    armazem_tokens = armazem_de_fluxo(
+        decodificar_em_fluxo(arquivo_entrada, caracteres_printaveis, tamanho_bloco_fluxo)
+    )
+else:
+    armazem_tokens = armazem_de_sequencias(decodificadas)
+palavras_pos = armazem_tokens.palavras_pos()
+original_lines_by_pos = armazem_tokens.linhas_originais()
 
 if DEBUG:
-    print(f"[DEBUG] Total de palavras com posição (após limpeza): {len(palavras_pos)}")
+    print(f"[DEBUG] Total de palavras com posição (após limpeza): {len(palavras_pos)} "
+          f"({len(armazem_tokens.vocabulario)} distintas)")
     for pos, p in palavras_pos:
         print(f"{pos}: {p}")
 
@@ -148,7 +264,12 @@ if DEBUG:
 if DEBUG:
     print("\n[DEBUG] Iniciando Passo 5: Ordenando palavras por comprimento (em blocos)...")
 
-blocos, palavras_ordenadas_pos = ordenar_palavras_por_tamanho_em_blocos(palavras_pos)
+if dados_cache is not None:
+    blocos, palavras_ordenadas_pos = dados_cache[1], dados_cache[2]
+else:
+    blocos, palavras_ordenadas_pos = ordenar_palavras_por_tamanho_em_blocos(palavras_pos)
+    if usar_cache_decodificacao:
+        salvar_cache(pasta_cache_decodificacao, chave_cache, armazem_tokens, blocos)
 
 if DEBUG:
     total = sum(len(b) for b in blocos)
@@ -192,7 +313,7 @@ else:
     bloco0 = blocos[0]
     mapeamentos_primeira, candidata_primeira = gerar_mapeamentos_para_primeira_palavra(
         bloco0,
-        top_words,
+        dicionario_ranqueado,
         used_top_words=used_top_words
     )
 
@@ -285,7 +406,8 @@ else:
         letras_usadas = set(mapa_existente.values())
 
         candidata_word, novos_mapeamentos = encontrar_candidata_compatível(
-            palavra_top_after, top_sorted, mapa_existente, letras_usadas, used_top_words=used_top_words
+            palavra_top_after, top_sorted, mapa_existente, letras_usadas, used_top_words=used_top_words,
+            indice=indice_candidatas
         )
 
         if candidata_word is None or not novos_mapeamentos:
@@ -391,10 +513,19 @@ if DEBUG:
 #  B) calcula ratio por palavra (substituídas/comprimento)
 #  C) tenta achar candidatas para palavras com ratio >= threshold
 # Atualiza mapa_substituicao e used_top_words conforme aplica mapeamentos válidos
+# O estado fica em estado_por_pos (armazem_tokens.EstadoPorId: posição -> id da
+# palavra atual); cada mapeamento traduz uma vez cada palavra distinta do bloco e
+# só as posições do bloco mudam de id; o flat é remontado no fim (Passo 11).
+# A busca de candidata passa por cache_candidatas (LRU por palavra atual): o
+# resultado de encontrar_candidata_compatível só depende da palavra atual, de
+# mapa_substituicao, letras_reservadas e used_top_words (que só crescem), e cada
+# mudança de estado invalida só as entradas que tocam o cifrado/claro mapeado
+# ou a palavra marcada como usada.
 if DEBUG:
     print("\n[DEBUG] Iniciando Passo 10: varrer blocos com múltiplos thresholds...")
 
-thresholds = list(range(100, limite_threshold - 1, -passo_threshold))
+# com motor_passo10 = "arco"/"retrocesso"/"recozimento" a varredura não roda (thresholds vazio): ver abaixo
+thresholds = list(range(100, limite_threshold - 1, -passo_threshold)) if motor_passo10 == "limiares" else []
 if DEBUG:
     print(f"[DEBUG] Thresholds gerados dinamicamente (passo={passo_threshold}, limite={limite_threshold}): {thresholds}")
 
@@ -434,10 +565,68 @@ try:
     flat_current_global = palavras_substituidas_pos.copy()
 except NameError:
     flat_current_global = palavras_ordenadas_pos.copy()
+estado_por_pos = EstadoPorId(armazem_tokens, flat_current_global)
+
+cache_candidatas = CacheCandidatas(top_sorted, indice=indice_candidatas)
 
 def _salvar_checkpoints_local(mapa_subst, used_words):
     _salvar_checkpoints(mapa_subst, used_words)
 
+estatisticas_arco = None
+estatisticas_retrocesso = None
+estatisticas_recozimento = None
+if motor_passo10 == "arco":
+    # cada letra cifrada é uma variável com domínio em bitmask (26 letras claras) e cada
+    # palavra cifrada distinta uma restrição sobre as candidatas do índice; propaga até o
+    # ponto fixo a partir do mapa dos Passos 6-8 e decodifica os domínios unitários
+    resolvedor_arco = ConsistenciaArco(palavras_ordenadas_pos, indice_candidatas, mapa_inicial=mapa_substituicao)
+    mapa_substituicao.update(resolvedor_arco.resolver())
+    used_top_words.update(resolvedor_arco.palavras_usadas())
+    estado_por_pos.aplicar(list(mapa_substituicao.items()), flat_current_global)
+    estatisticas_arco = resolvedor_arco.estatisticas()
+    if DEBUG:
+        print(f"[DEBUG] Consistência de arco: {estatisticas_arco['aceitas']} palavras aceitas, "
+              f"{estatisticas_arco['fora_do_dicionario']} fora do dicionário, "
+              f"{estatisticas_arco['verificacoes']} verificações de candidata, "
+              f"{estatisticas_arco['letras_decididas']} letras decididas")
+elif motor_passo10 == "retrocesso":
+    # DFS sobre atribuições palavra cifrada -> palavra do dicionário, com forward checking e
+    # desfazer pela trilha; parte da chave vazia para que os chutes dos Passos 6-7 também
+    # possam ser desfeitos, e fica com a solução que cobre mais letras do texto
+    busca_retrocesso = BuscaRetrocesso(palavras_ordenadas_pos, indice_candidatas,
+                                       limite_nos=limite_nos_retrocesso, limite_segundos=limite_segundos_retrocesso)
+    mapa_substituicao = busca_retrocesso.resolver()
+    used_top_words = busca_retrocesso.palavras_usadas()
+    estado_por_pos = EstadoPorId(armazem_tokens, palavras_ordenadas_pos)
+    estado_por_pos.aplicar(list(mapa_substituicao.items()), flat_current_global)
+    estatisticas_retrocesso = busca_retrocesso.estatisticas()
+    print(f"\n[RESULT] Busca com retrocesso: {estatisticas_retrocesso['nos']} nós em "
+          f"{estatisticas_retrocesso['segundos']:.2f}s ({estatisticas_retrocesso['nos_por_segundo']:.0f} nós/s), "
+          f"{'árvore esgotada' if estatisticas_retrocesso['completa'] else 'orçamento esgotado'}, "
+          f"cobertura {estatisticas_retrocesso['cobertura']}/{estatisticas_retrocesso['cobertura_maxima']} letras")
+elif motor_passo10 == "recozimento":
+    # troca letras claras da chave e pontua o texto pelos n-gramas de letras (palavras fora do
+    # dicionário também contam); parte do mapa dos Passos 6-8 e só recalcula os n-gramas que
+    # contêm as letras trocadas
+    if arquivo_ngramas:
+        modelo_ngramas = ModeloNgramas.de_arquivo(arquivo_ngramas)
+    elif top_sorted is not None:
+        modelo_ngramas = ModeloNgramas.de_ranking(palavra for palavra, _rank in top_sorted)
+    else:
+        # .dicc/.sqlite/compartilhado: vocabulário lido em ordem de preferência, sob demanda
+        modelo_ngramas = ModeloNgramas.de_ranking(palavra for palavra, _valor in indice_candidatas.itens())
+    recozimento = RecozimentoSimulado(palavras_ordenadas_pos, modelo_ngramas, mapa_inicial=mapa_substituicao,
+                                      iteracoes=iteracoes_recozimento, reinicios=reinicios_recozimento, semente=0)
+    mapa_substituicao = recozimento.resolver()
+    estado_por_pos = EstadoPorId(armazem_tokens, palavras_ordenadas_pos)
+    estado_por_pos.aplicar(list(mapa_substituicao.items()), flat_current_global)
+    used_top_words = {p.upper() for p in estado_por_pos.values() if _normalizar_token(p) in top_set_normalized}
+    estatisticas_recozimento = recozimento.estatisticas()
+    print(f"\n[RESULT] Recozimento simulado: {estatisticas_recozimento['avaliacoes']} trocas avaliadas em "
+          f"{estatisticas_recozimento['segundos']:.2f}s ({estatisticas_recozimento['avaliacoes_por_segundo']:.0f} trocas/s), "
+          f"{estatisticas_recozimento['ngramas']} {modelo_ngramas.n}-gramas cifrados distintos, "
+          f"log10 P {estatisticas_recozimento['pontuacao_inicial']:.1f} -> {estatisticas_recozimento['pontuacao']:.1f}")
+
 for ti, thr_percent in enumerate(thresholds):
     RATIO_THRESHOLD = thr_percent / 100.0
     if DEBUG:
@@ -460,23 +649,22 @@ for ti, thr_percent in enumerate(thresholds):
             if DEBUG:
                 print(f"[DEBUG] Aplicando final_map ({len(mapa_substituicao)} pares) a todas as palavras do bloco {bloco_index + 1}...")
             pares_mapa = list(mapa_substituicao.items())
-            flat_current_global = aplicar_mapeamentos_em_posicoes(flat_current_global, pares_mapa, pos_alvo)
+            estado_por_pos.aplicar(pares_mapa, bloco)
         else:
             if DEBUG:
                 print("[DEBUG] final_map vazio — nada a aplicar antes da busca para este bloco.")
 
         if DEBUG:
             print("\n[DEBUG] Estado do bloco após aplicar final_map (parcial):")
-            for p, pw in flat_current_global:
-                if p in pos_alvo:
-                    print(f"{p}: {pw}")
+            for p, _ in bloco:
+                print(f"{p}: {estado_por_pos[p]}")
 
         # B) calcular ratio e exibir
         if DEBUG:
             print("\n[DEBUG] Passo Intermediário: calculando ratio de letras substituídas por palavra no bloco...")
         ratios = []
         for p, original in bloco:
-            palavra_atual = next((pw for pp, pw in flat_current_global if pp == p), original)
+            palavra_atual = estado_por_pos.get(p, original)
             length = len(palavra_atual) if palavra_atual else 0
             if length == 0:
                 substituted = 0
@@ -499,7 +687,7 @@ for ti, thr_percent in enumerate(thresholds):
         for pos, palavra_original in bloco:
             if DEBUG:
                 print(f"\n[DEBUG] Avaliando posição {pos} | palavra atual (flat): ", end="")
-            palavra_flat_atual = next((pw for p, pw in flat_current_global if p == pos), palavra_original)
+            palavra_flat_atual = estado_por_pos.get(pos, palavra_original)
             if DEBUG:
                 print(f"'{palavra_flat_atual}'")
 
@@ -520,12 +708,11 @@ for ti, thr_percent in enumerate(thresholds):
                     print(f"[DEBUG] Ratio abaixo de {RATIO_THRESHOLD:.0%} — pulando tentativa de candidata para esta palavra.")
                 continue
 
-            candidata_word, novos_mapeamentos = encontrar_candidata_compatível(
+            candidata_word, novos_mapeamentos = cache_candidatas.buscar(
                 palavra_flat_atual,
-                top_sorted,
-                mapa_substituicao.copy(),
+                mapa_substituicao,
                 letras_reservadas,
-                used_top_words=used_top_words
+                used_top_words
             )
 
             if candidata_word is None or not novos_mapeamentos:
@@ -560,7 +747,8 @@ for ti, thr_percent in enumerate(thresholds):
 
             if DEBUG:
                 print(f"[DEBUG] Aplicando {len(mapeamentos_validos)} mapeamentos válidos ao bloco {bloco_index + 1}...")
-            flat_current_global = aplicar_mapeamentos_em_posicoes(flat_current_global, mapeamentos_validos, pos_alvo)
+            estado_por_pos.aplicar(mapeamentos_validos, bloco)
+            cache_candidatas.registrar_mapeamentos(mapeamentos_validos)
 
             for c, v in mapeamentos_validos:
                 if c not in mapa_substituicao:
@@ -573,6 +761,7 @@ for ti, thr_percent in enumerate(thresholds):
 
             if _normalizar_token(candidata_word) in top_set_normalized:
                 used_top_words.add(candidata_word)
+                cache_candidatas.registrar_usada(candidata_word)
                 if DEBUG:
                     print(f"[DEBUG] Marcada candidata como usada: {candidata_word}")
             else:
@@ -581,9 +770,8 @@ for ti, thr_percent in enumerate(thresholds):
 
             if DEBUG:
                 print("\n[DEBUG] Resultado parcial do bloco após aplicação:")
-                for p, pw in flat_current_global:
-                    if p in pos_alvo:
-                        print(f"{p}: {pw}")
+                for p, _ in bloco:
+                    print(f"{p}: {estado_por_pos[p]}")
 
             if DEBUG:
                 resp = input("\n[DEBUG] Pressione Enter para continuar para a próxima palavra, ou digite 'q' para parar: ")
@@ -617,7 +805,20 @@ for ti, thr_percent in enumerate(thresholds):
             break
 
 # fim loop thresholds
+# expande o estado de volta para o flat (mesma ordem de palavras_ordenadas_pos)
+flat_current_global = [(pos, estado_por_pos[pos]) for pos, _ in flat_current_global]
+
+# contadores do cache (também vão para o resumo.json de decrypt_lote.py)
+estatisticas_cache_candidatas = cache_candidatas.estatisticas()
+buscas_candidatas = cache_candidatas.faltas
+buscas_evitadas = cache_candidatas.acertos
+
 if DEBUG:
+    ocorrencias = buscas_candidatas + buscas_evitadas
+    print(f"\n[DEBUG] Passo 10: {buscas_candidatas} buscas de candidata para {ocorrencias} ocorrências avaliadas "
+          f"({buscas_evitadas} acertos no cache, {estatisticas_cache_candidatas['taxa_acerto']:.1%}; "
+          f"{estatisticas_cache_candidatas['invalidadas']} entradas invalidadas; "
+          f"{len(armazem_tokens.vocabulario)} palavras cifradas distintas em {len(armazem_tokens)} ocorrências no texto)")
     print("\n[DEBUG] Finalizando Passo 10: salvando arquivos finais...")
 _salvar_checkpoints(mapa_substituicao, used_top_words)
 if DEBUG:
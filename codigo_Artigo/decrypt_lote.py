@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+decrypt_lote.py
+Roda o pipeline completo de decrypt.py (Passos 1..14) para vários arquivos
+cifrados em paralelo (ProcessPoolExecutor, um processo novo por arquivo).
+
+Cada arquivo ganha uma pasta própria em <saida>/<nome_do_arquivo>/ com os
+arquivos que decrypt.py grava no diretório de trabalho (final_map.py,
+candidatas_encolhidas.py, final_reconstructed*.txt) e a saída do console
+(saida.txt). No final é gravado <saida>/resumo.json com mapeamento,
+cobertura (palavras em top_words e letras traduzidas) e tempo de cada arquivo.
+
+O dicionário (--dicionario, padrão top_words.py) é carregado uma vez aqui e
+publicado em memória compartilhada (dicionario_compartilhado.py): cada
+processo só anexa o bloco, sem importar top_words.py nem remontar
+top_sorted/top_set_normalized/índices. --sem-compartilhar volta a deixar
+cada processo carregar o próprio dicionário.
+
+Uso:
+    python decrypt_lote.py ../TENTATIVA_FINAL/encodeds
+    python decrypt_lote.py "../TENTATIVA_FINAL/encodeds/*.txt" --saida lote --processos 4
+    python decrypt_lote.py ../TENTATIVA_FINAL/encodeds --dicionario top_words.dicc
+"""
+
+import argparse
+import contextlib
+import glob
+import json
+import os
+import runpy
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+from dicionario_compartilhado import VARIAVEL_AMBIENTE, DicionarioPublicado
+from dicionario_compilado import ORDEM_RANK, carregar_dicionario
+
+PASTA_ARTIGO = Path(__file__).resolve().parent
+SCRIPT_DECRYPT = PASTA_ARTIGO / "decrypt.py"
+PASTA_SAIDA_PADRAO = "lote_saida"
+DICIONARIO_PADRAO = PASTA_ARTIGO / "top_words.py"
+
+
+def listar_entradas(origem):
+    """Arquivos de uma pasta (não recursivo) ou de um padrão glob, em ordem."""
+    if os.path.isdir(origem):
+        candidatos = [os.path.join(origem, nome) for nome in os.listdir(origem)]
+    else:
+        candidatos = glob.glob(origem)
+    return sorted(os.path.abspath(c) for c in candidatos if os.path.isfile(c))
+
+
+def _pastas_de_trabalho(entradas, pasta_saida):
+    """Uma pasta por arquivo; nomes repetidos (de pastas diferentes) ganham sufixo."""
+    usados = set()
+    pastas = []
+    for entrada in entradas:
+        nome = Path(entrada).stem
+        candidato, n = nome, 2
+        while candidato in usados:
+            candidato, n = f"{nome}_{n}", n + 1
+        usados.add(candidato)
+        pastas.append(os.path.join(pasta_saida, candidato))
+    return pastas
+
+
+def _cobertura(estado):
+    """
+    Cobertura do resultado a partir do estado final de decrypt.py:
+      - palavras: % das palavras restauradas presentes em top_words (regra do Passo 12)
+      - letras: % de letras do texto final mapeado já traduzidas (minúsculas)
+    """
+    palavras = [w for w in estado.get("restaurado", []) if w and w.strip()]
+    normalizar = estado["_normalizar_token"]
+    top_set = estado["top_set_normalized"]
+    encontradas = sum(1 for w in palavras if normalizar(w) in top_set)
+
+    letras = [ch for ch in estado.get("final_text_mapped", "") if ch.isalpha()]
+    minusculas = sum(1 for ch in letras if ch.islower())
+    return {
+        "total_palavras": len(palavras),
+        "cobertura_palavras_pct": round(100.0 * encontradas / len(palavras), 2) if palavras else 0.0,
+        "cobertura_letras_pct": round(100.0 * minusculas / len(letras), 2) if letras else 0.0,
+    }
+
+
+def executar_job(entrada, pasta_job, nome_dicionario=None):
+    """
+    Roda decrypt.py para `entrada` dentro de `pasta_job` (processo dedicado:
+    decrypt.py importa final_map/candidatas_encolhidas do diretório de trabalho
+    e guarda estado global). Com `nome_dicionario`, decrypt.py anexa o bloco
+    de memória compartilhada em vez de carregar o dicionário. Retorna o resumo
+    do arquivo.
+    """
+    if nome_dicionario:
+        os.environ[VARIAVEL_AMBIENTE] = nome_dicionario
+    os.makedirs(pasta_job, exist_ok=True)
+    os.chdir(pasta_job)
+    # checkpoints do job têm prioridade; módulos do pipeline vêm de codigo_Artigo
+    sys.path[:0] = [pasta_job, str(PASTA_ARTIGO)]
+    sys.argv = [str(SCRIPT_DECRYPT), entrada]
+
+    resumo = {"arquivo": entrada, "pasta": pasta_job}
+    inicio = time.perf_counter()
+    with open("saida.txt", "w", encoding="utf-8") as saida, contextlib.redirect_stdout(saida):
+        try:
+            estado = runpy.run_path(str(SCRIPT_DECRYPT), run_name="__main__")
+        except (Exception, SystemExit) as e:  # SystemExit/erros do pipeline viram status do job; Ctrl+C interrompe o lote
+            resumo.update(status="erro", erro=f"{type(e).__name__}: {e}",
+                          tempo_s=round(time.perf_counter() - inicio, 3))
+            return resumo
+
+    mapa = estado.get("mapa_substituicao", {})
+    resumo.update(
+        status="ok",
+        tempo_s=round(time.perf_counter() - inicio, 3),
+        mapeamentos=len(mapa),
+        mapa=mapa,
+        buscas_candidatas=estado.get("buscas_candidatas", 0),
+        buscas_evitadas=estado.get("buscas_evitadas", 0),
+        **_cobertura(estado),
+    )
+    return resumo
+
+
+def executar_lote(entradas, pasta_saida=PASTA_SAIDA_PADRAO, processos=None, dicionario=DICIONARIO_PADRAO):
+    """
+    Distribui os arquivos entre processos e devolve a lista de resumos (ordem
+    das entradas). `dicionario` (.py/.txt/.dicc) é publicado uma vez em
+    memória compartilhada; com None cada processo carrega o seu.
+    """
+    pasta_saida = os.path.abspath(pasta_saida)
+    pastas = _pastas_de_trabalho(entradas, pasta_saida)
+
+    resumos = [None] * len(entradas)
+    with contextlib.ExitStack() as pilha:
+        nome_dicionario = None
+        if dicionario:
+            publicado = pilha.enter_context(DicionarioPublicado(carregar_dicionario(dicionario, ordem=ORDEM_RANK)))
+            nome_dicionario = publicado.nome
+            print(f"[LOTE] Dicionário compartilhado: {publicado.total} palavras "
+                  f"({publicado.tamanho / 1024:.1f} KB) de {dicionario}")
+        executor = pilha.enter_context(ProcessPoolExecutor(max_workers=processos, max_tasks_per_child=1))
+        futuros = {
+            executor.submit(executar_job, entrada, pasta, nome_dicionario): i
+            for i, (entrada, pasta) in enumerate(zip(entradas, pastas))
+        }
+        for futuro in as_completed(futuros):
+            i = futuros[futuro]
+            resumos[i] = futuro.result()
+            r = resumos[i]
+            print(f"[LOTE] {Path(r['arquivo']).name}: {r['status']} em {r['tempo_s']:.2f}s")
+    return resumos
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Decifra vários arquivos em paralelo com decrypt.py")
+    parser.add_argument("origem", help="pasta com arquivos cifrados ou padrão glob")
+    parser.add_argument("--saida", default=PASTA_SAIDA_PADRAO, help="pasta de saída (uma subpasta por arquivo)")
+    parser.add_argument("--processos", type=int, default=None, help="processos paralelos (padrão: nº de CPUs)")
+    parser.add_argument("--dicionario", default=str(DICIONARIO_PADRAO),
+                        help="dicionário publicado em memória compartilhada (.py/.txt/.dicc; padrão: top_words.py)")
+    parser.add_argument("--sem-compartilhar", action="store_true",
+                        help="cada processo carrega o próprio dicionário (como decrypt.py sozinho)")
+    args = parser.parse_args()
+
+    entradas = listar_entradas(args.origem)
+    if not entradas:
+        print(f"[LOTE] Nenhum arquivo encontrado em {args.origem}")
+        sys.exit(1)
+
+    inicio = time.perf_counter()
+    dicionario = None if args.sem_compartilhar else args.dicionario
+    resumos = executar_lote(entradas, args.saida, args.processos, dicionario)
+    tempo_total = time.perf_counter() - inicio
+
+    os.makedirs(args.saida, exist_ok=True)
+    caminho_resumo = os.path.join(args.saida, "resumo.json")
+    with open(caminho_resumo, "w", encoding="utf-8") as f:
+        json.dump({"tempo_total_s": round(tempo_total, 3), "arquivos": resumos},
+                  f, ensure_ascii=False, indent=4)
+
+    print(f"\n[RESULT] {len(resumos)} arquivos em {tempo_total:.2f}s "
+          f"(soma dos jobs: {sum(r['tempo_s'] for r in resumos):.2f}s)")
+    for r in resumos:
+        nome = Path(r["arquivo"]).name
+        if r["status"] == "ok":
+            print(f"[RESULT] {nome}: {r['mapeamentos']} mapeamentos, "
+                  f"palavras em top_words {r['cobertura_palavras_pct']:.2f}%, "
+                  f"letras traduzidas {r['cobertura_letras_pct']:.2f}%, {r['tempo_s']:.2f}s")
+        else:
+            print(f"[RESULT] {nome}: ERRO {r['erro']}")
+    print(f"[RESULT] Resumo salvo em {caminho_resumo}")
+
+
+if __name__ == "__main__":
+    main()
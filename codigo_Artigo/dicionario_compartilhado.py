@@ -0,0 +1,116 @@
+# ================================================================
+# dicionario_compartilhado.py — um dicionário para vários processos
+#
+# Contém funções para:
+#  - publicar, uma vez, o dicionário ranqueado e seus índices (o conteúdo
+#    .dicc de dicionario_compilado.py: palavras, ranks, buckets por
+#    comprimento e por padrão isomorfo, formas normalizadas) em um bloco
+#    de multiprocessing.shared_memory
+#  - anexar os processos trabalhadores a esse bloco só para leitura, pelo
+#    nome: nada é copiado nem reconstruído (sem import de top_words.py,
+#    sem sorted/set/IndiceIsomorfos por processo); N processos custam uma
+#    cópia do dicionário
+#  - oferecer, sobre o bloco, as mesmas interfaces usadas pelo decrypt.py:
+#      * candidatas()/palavras() de indice_isomorfos.IndiceIsomorfos
+#      * proxima_disponivel()/marcar_usada() de funcoes_decodificador.Dicionario
+#      * `in` sobre a forma normalizada (top_set_normalized)
+#
+# Quem publica é o dono do bloco (fechar() também o remove). Filhos do
+# publicador (ProcessPoolExecutor, multiprocessing) compartilham o
+# resource_tracker dele; um processo independente (ex.: subprocess) anexa
+# sem registrar o bloco no próprio tracker, que senão o removeria quando
+# esse processo terminasse (Python < 3.13 registra todo bloco anexado).
+# O nome do bloco chega aos trabalhadores pela variável de ambiente
+# VARIAVEL_AMBIENTE (lida pelo decrypt.py).
+# ================================================================
+
+import os
+import sys
+from multiprocessing import parent_process, resource_tracker, shared_memory
+
+from dicionario_compilado import ORDEM_RANK, DicionarioCompilado, serializar_dicionario
+
+VARIAVEL_AMBIENTE = "DECRYPT_DICIONARIO_COMPARTILHADO"
+
+# blocos publicados por este processo (já registrados no tracker dele)
+_publicados = set()
+
+
+class DicionarioPublicado:
+    """
+    Bloco de memória compartilhada com o conteúdo .dicc de `palavras_valores`
+    (dict palavra -> rank/score). `nome` identifica o bloco para
+    DicionarioCompartilhado(nome).
+    """
+
+    def __init__(self, palavras_valores, ordem=ORDEM_RANK):
+        conteudo = serializar_dicionario(palavras_valores, ordem)
+        self.total = len(palavras_valores)
+        self.tamanho = len(conteudo)
+        self._shm = shared_memory.SharedMemory(create=True, size=max(1, self.tamanho))
+        self._shm.buf[:self.tamanho] = conteudo
+        self.nome = self._shm.name
+        _publicados.add(self.nome)
+
+    def fechar(self):
+        """Libera e remove o bloco (os processos anexados devem ter terminado)."""
+        if self._shm is None:
+            return
+        self._shm.close()
+        self._shm.unlink()
+        _publicados.discard(self.nome)
+        self._shm = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.fechar()
+
+
+def _anexar_bloco(nome):
+    """SharedMemory existente, sem que o fim deste processo o remova."""
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name=nome, track=False)
+    # Python < 3.13 registra o bloco anexado no resource_tracker deste processo;
+    # o publicador e seus filhos usam o tracker que já conhece o bloco, mas um
+    # processo independente sobe um tracker próprio e precisa desregistrar.
+    # O tracker registra o nome POSIX, com "/" inicial (shm.name não tem a barra).
+    tracker_do_publicador = nome in _publicados or parent_process() is not None
+    shm = shared_memory.SharedMemory(name=nome)
+    if not tracker_do_publicador and os.name == "posix":
+        resource_tracker.unregister("/" + shm.name.lstrip("/"), "shared_memory")
+    return shm
+
+
+class DicionarioCompartilhado(DicionarioCompilado):
+    """
+    DicionarioCompilado lido de um bloco publicado por DicionarioPublicado
+    (visão só de leitura, sem cópia), com as mesmas interfaces
+    (candidatas/palavras, proxima_disponivel/marcar_usada, normalizadas).
+    `usadas` e os cursores de proxima_disponivel são do processo (não compartilhados).
+    """
+
+    def __init__(self, nome, exigir_isomorfo=True, usadas=None, ordem=None):
+        self._configurar(exigir_isomorfo, usadas, maiusculas=False, ordem=ordem)
+        self.caminho = f"shared_memory:{nome}"
+        self._shm = None  # fechar()/__del__ rodam mesmo se o anexo falhar
+        self._shm = _anexar_bloco(nome)
+        try:
+            self._abrir(memoryview(self._shm.buf).toreadonly())
+        except Exception:
+            self._liberar_visoes()
+            self._shm.close()
+            raise
+
+    def fechar(self):
+        """Desanexa este processo (o bloco continua existindo até o publicador fechar)."""
+        if not self._dono or self._shm is None:
+            return
+        self._liberar_visoes()
+        self._shm.close()
+        self._shm = None
+
+    def __del__(self):
+        # as visões precisam ser liberadas antes de SharedMemory.__del__ fechar o mmap
+        self.fechar()
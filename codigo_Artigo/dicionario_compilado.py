@@ -0,0 +1,456 @@
+# ================================================================
+# dicionario_compilado.py — dicionário ranqueado em formato binário (mmap)
+#
+# Contém funções para:
+#  - ler uma lista ranqueada de palavras de um módulo .py (dict literal,
+#    como top_words.py / top_words_banco_de_palavras.py / 2top_words.py,
+#    lido com ast.literal_eval, sem executar o módulo) ou de um .txt
+#    ("PALAVRA [valor]" por linha; sem valor, o rank é o número da linha)
+#  - compilar a lista em um arquivo .dicc com palavras, valores (rank/score),
+#    buckets por comprimento e índice por padrão isomorfo
+#  - abrir o .dicc com mmap, sem parsing: as seções são lidas direto do
+#    arquivo por memoryview (o custo de abrir não depende do tamanho)
+#  - ler o mesmo conteúdo de qualquer buffer (ex.: um bloco de
+#    multiprocessing.shared_memory, em dicionario_compartilhado.py)
+#  - oferecer, direto sobre as seções, as interfaces usadas pelo decrypt.py
+#    e pelo codigo_NoMuque (sem como_dict/sorted/IndiceIsomorfos ao carregar):
+#      * candidatas()/palavras() de indice_isomorfos.IndiceIsomorfos
+#      * proxima_disponivel()/marcar_usada() de funcoes_decodificador.Dicionario
+#      * `in` sobre a forma normalizada (top_set_normalized) e sobre a palavra
+#
+# Formato (little-endian, seções alinhadas em 8 bytes):
+#   cabeçalho: "DICC", versão, ordem (0 = rank crescente, 1 = score decrescente),
+#              nº de palavras, nº de comprimentos, nº de padrões
+#              + (offset, tamanho) de cada seção
+#   palavras      -> UTF-8 concatenado, na ordem de preferência
+#   offsets       -> uint32[n + 1] (início de cada palavra no blob)
+#   valores       -> int64[n] (rank/score original)
+#   tamanhos      -> uint32[3 * n_tamanhos]: (comprimento, início, quantidade) em ids_tamanho
+#   ids_tamanho   -> uint32[n]: ids agrupados por comprimento, em ordem de preferência
+#   padroes       -> uint32[4 * n_padroes]: (offset, bytes, início, quantidade), padrões em ordem
+#   blob_padroes  -> padrões isomorfos (ASCII) concatenados
+#   ids_padrao    -> uint32[n]: ids agrupados por padrão, em ordem de preferência
+#   normalizadas  -> formas normalizadas (sem acento, minúsculas) distintas, UTF-8, em ordem de bytes
+#   offsets_norm  -> uint32[m + 1] (início de cada forma normalizada)
+#
+# Uso via linha de comando: compilar_dicionario.py.
+# ================================================================
+
+import ast
+import mmap
+import os
+import struct
+import unicodedata
+from array import array
+
+from indice_isomorfos import padrao_isomorfo
+
+MAGICO = b"DICC"
+VERSAO_FORMATO = 2
+EXTENSAO = ".dicc"
+
+ORDEM_RANK = "rank"      # menor valor = melhor (top_words do artigo: THE = 1)
+ORDEM_SCORE = "score"    # maior valor = melhor (buscas do codigo_NoMuque)
+_CODIGO_ORDEM = {ORDEM_RANK: 0, ORDEM_SCORE: 1}
+
+_SECOES = ("palavras", "offsets", "valores", "tamanhos", "ids_tamanho", "padroes", "blob_padroes", "ids_padrao",
+           "normalizadas", "offsets_norm")
+_CABECALHO = struct.Struct("<4sIIIII" + "QQ" * len(_SECOES))
+
+
+# ---------------------------
+# Leitura das fontes
+# ---------------------------
+def ler_modulo_dicionario(caminho, variavel=None):
+    """
+    Dict literal atribuído em um módulo .py (a variável `variavel` ou o
+    primeiro dict do arquivo), sem importar/executar o módulo.
+    """
+    with open(caminho, "r", encoding="utf-8") as f:
+        arvore = ast.parse(f.read(), filename=str(caminho))
+    for no in arvore.body:
+        if not isinstance(no, ast.Assign) or not isinstance(no.value, ast.Dict):
+            continue
+        nomes = [alvo.id for alvo in no.targets if isinstance(alvo, ast.Name)]
+        if variavel is None or variavel in nomes:
+            return ast.literal_eval(no.value)
+    alvo = f"'{variavel}'" if variavel else "um dict"
+    raise ValueError(f"{caminho} não contém {alvo} atribuído no nível do módulo.")
+
+
+def ler_lista_texto(caminho):
+    """'PALAVRA [valor]' por linha; sem valor o rank é a posição da linha (1, 2, ...)."""
+    itens = {}
+    with open(caminho, "r", encoding="utf-8") as f:
+        for numero, linha in enumerate(f, start=1):
+            partes = linha.split()
+            if not partes or partes[0].startswith("#"):
+                continue
+            valor = int(partes[1]) if len(partes) > 1 else numero
+            itens.setdefault(partes[0], valor)
+    return itens
+
+
+def ler_fonte_dicionario(caminho, variavel=None):
+    """Dict palavra -> valor de um .py ou .txt."""
+    if str(caminho).endswith(".py"):
+        return ler_modulo_dicionario(caminho, variavel)
+    return ler_lista_texto(caminho)
+
+
+# ---------------------------
+# Compilação
+# ---------------------------
+def normalizar_palavra(palavra):
+    """Sem acentos, sem espaços nas pontas e em minúsculas (mesmo critério de _normalizar_token do decrypt.py)."""
+    s = unicodedata.normalize("NFD", palavra.strip())
+    s = "".join(ch for ch in s if not unicodedata.combining(ch))
+    return s.lower()
+
+
+def verificar_ordem(caminho, ordem, exigida):
+    """ValueError se o dicionário `caminho` (em `ordem`) não estiver na ordem `exigida` (None = qualquer)."""
+    if exigida is not None and ordem != exigida:
+        raise ValueError(f"{caminho}: dicionário em ordem '{ordem}', mas este uso exige ordem '{exigida}' "
+                         f"(recompile com compilar_dicionario.py --ordem {exigida})")
+
+
+def _alinhar(tamanho):
+    return (tamanho + 7) & ~7
+
+
+def ordenar_por_preferencia(palavras_valores, ordem=ORDEM_RANK):
+    """
+    [(palavra, valor)] na ordem de preferência: sort estável por valor
+    (crescente em ORDEM_RANK, decrescente em ORDEM_SCORE), como top_sorted /
+    as buscas do NoMuque.
+    """
+    if ordem not in _CODIGO_ORDEM:
+        raise ValueError(f"Ordem inválida: {ordem!r} (use '{ORDEM_RANK}' ou '{ORDEM_SCORE}')")
+    sinal = 1 if ordem == ORDEM_RANK else -1
+    return sorted(palavras_valores.items(), key=lambda item: sinal * int(item[1]))
+
+
+def serializar_dicionario(palavras_valores, ordem=ORDEM_RANK):
+    """
+    Conteúdo .dicc (bytes) de `palavras_valores` (dict palavra -> rank/score),
+    na ordem de ordenar_por_preferencia.
+    """
+    ordenadas = ordenar_por_preferencia(palavras_valores, ordem)
+
+    blob = bytearray()
+    offsets = array("I", [0])
+    valores = array("q")
+    por_tamanho = {}
+    por_padrao = {}
+    for i, (palavra, valor) in enumerate(ordenadas):
+        blob += palavra.encode("utf-8")
+        offsets.append(len(blob))
+        valores.append(int(valor))
+        por_tamanho.setdefault(len(palavra), []).append(i)
+        por_padrao.setdefault(padrao_isomorfo(palavra, ignorar_caixa=True), []).append(i)
+
+    tamanhos, ids_tamanho = array("I"), array("I")
+    for tamanho in sorted(por_tamanho):
+        ids = por_tamanho[tamanho]
+        tamanhos.extend((tamanho, len(ids_tamanho), len(ids)))
+        ids_tamanho.extend(ids)
+
+    padroes, blob_padroes, ids_padrao = array("I"), bytearray(), array("I")
+    for padrao in sorted(por_padrao):
+        ids = por_padrao[padrao]
+        codificado = padrao.encode("ascii")
+        padroes.extend((len(blob_padroes), len(codificado), len(ids_padrao), len(ids)))
+        blob_padroes += codificado
+        ids_padrao.extend(ids)
+
+    normalizadas = sorted({normalizar_palavra(palavra).encode("utf-8") for palavra, _ in ordenadas})
+    offsets_norm = array("I", [0])
+    for forma in normalizadas:
+        offsets_norm.append(offsets_norm[-1] + len(forma))
+
+    conteudo = {
+        "palavras": bytes(blob), "offsets": offsets.tobytes(), "valores": valores.tobytes(),
+        "tamanhos": tamanhos.tobytes(), "ids_tamanho": ids_tamanho.tobytes(),
+        "padroes": padroes.tobytes(), "blob_padroes": bytes(blob_padroes), "ids_padrao": ids_padrao.tobytes(),
+        "normalizadas": b"".join(normalizadas), "offsets_norm": offsets_norm.tobytes(),
+    }
+    posicao = _alinhar(_CABECALHO.size)
+    localizacao = []
+    for nome in _SECOES:
+        localizacao.extend((posicao, len(conteudo[nome])))
+        posicao = _alinhar(posicao + len(conteudo[nome]))
+
+    saida = bytearray(posicao)
+    _CABECALHO.pack_into(saida, 0, MAGICO, VERSAO_FORMATO, _CODIGO_ORDEM[ordem], len(ordenadas),
+                         len(por_tamanho), len(por_padrao), *localizacao)
+    for nome, inicio in zip(_SECOES, localizacao[::2]):
+        saida[inicio:inicio + len(conteudo[nome])] = conteudo[nome]
+    return saida
+
+
+def compilar_dicionario(palavras_valores, destino, ordem=ORDEM_RANK):
+    """
+    Grava `palavras_valores` (dict palavra -> rank/score) em `destino` (.dicc),
+    na ordem de ordenar_por_preferencia. Retorna o número de palavras gravadas.
+    """
+    conteudo = serializar_dicionario(palavras_valores, ordem)
+    temporario = f"{destino}.{os.getpid()}.tmp"
+    with open(temporario, "wb") as f:
+        f.write(conteudo)
+    os.replace(temporario, destino)
+    return len(palavras_valores)
+
+
+# ---------------------------
+# Leitura (mmap)
+# ---------------------------
+class _NormalizadasCompiladas:
+    """`norm in conjunto` para formas já normalizadas (substitui o set top_set_normalized)."""
+
+    def __init__(self, dicionario):
+        self._dicionario = dicionario
+
+    def __contains__(self, normalizada):
+        return self._dicionario.contem_normalizada(normalizada)
+
+
+class DicionarioCompilado:
+    """
+    Dicionário .dicc mapeado em memória. Ids seguem a ordem de preferência
+    (id 0 = melhor palavra). Nada é decodificado ao abrir: palavras e valores
+    são lidos das seções sob demanda.
+
+      candidatas(palavra_atual)   -> (palavra, valor) compatíveis, em ordem de preferência
+      palavras(palavra_atual)     -> só as palavras de candidatas()
+      proxima_disponivel(tamanho) -> primeira palavra do comprimento fora de `usadas`
+      normalizadas                -> `in` sobre as formas normalizadas
+
+    exigir_isomorfo tem o mesmo sentido de IndiceIsomorfos; com maiusculas as
+    palavras saem em maiúsculas (como o banco do codigo_NoMuque). Com `ordem`
+    (ORDEM_RANK para o decrypt.py, ORDEM_SCORE para o codigo_NoMuque), um
+    arquivo compilado na outra ordem é recusado com ValueError.
+    """
+
+    def __init__(self, caminho, exigir_isomorfo=True, usadas=None, maiusculas=False, ordem=None):
+        self._configurar(exigir_isomorfo, usadas, maiusculas, ordem)
+        self.caminho = str(caminho)
+        with open(self.caminho, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            self._abrir(memoryview(self._mmap))
+        except Exception:
+            self._liberar_visoes()
+            self._mmap.close()
+            raise
+
+    def _configurar(self, exigir_isomorfo, usadas, maiusculas, ordem):
+        self.exigir_isomorfo = exigir_isomorfo
+        self._ordem_exigida = ordem
+        self.usadas = set() if usadas is None else usadas
+        self.maiusculas = maiusculas
+        self._cursores = {}
+        self._dono = True
+        self.normalizadas = _NormalizadasCompiladas(self)
+
+    def _abrir(self, visao):
+        """Interpreta `visao` (memoryview do conteúdo .dicc) sem copiar as seções."""
+        self._visoes = [visao]
+        if len(visao) < _CABECALHO.size:
+            raise ValueError(f"{self.caminho}: arquivo .dicc truncado")
+        campos = _CABECALHO.unpack_from(visao, 0)
+        magico, versao, ordem, self.total, self.total_tamanhos, self.total_padroes = campos[:6]
+        if magico != MAGICO or versao != VERSAO_FORMATO:
+            raise ValueError(f"{self.caminho}: não é um dicionário compilado (versão {VERSAO_FORMATO}; "
+                             "recompile com compilar_dicionario.py)")
+        self.ordem = ORDEM_RANK if ordem == 0 else ORDEM_SCORE
+        verificar_ordem(self.caminho, self.ordem, self._ordem_exigida)
+
+        secoes = {}
+        for nome, inicio, tamanho in zip(_SECOES, campos[6::2], campos[7::2]):
+            secoes[nome] = visao[inicio:inicio + tamanho]
+        self._blob = secoes["palavras"]
+        self._offsets = secoes["offsets"].cast("I")
+        self._valores = secoes["valores"].cast("q")
+        self._tamanhos = secoes["tamanhos"].cast("I")
+        self._ids_tamanho = secoes["ids_tamanho"].cast("I")
+        self._padroes = secoes["padroes"].cast("I")
+        self._blob_padroes = secoes["blob_padroes"]
+        self._ids_padrao = secoes["ids_padrao"].cast("I")
+        self._normalizadas = secoes["normalizadas"]
+        self._offsets_norm = secoes["offsets_norm"].cast("I")
+        self.total_normalizadas = len(self._offsets_norm) - 1
+        self._visoes += list(secoes.values()) + [
+            self._offsets, self._valores, self._tamanhos, self._ids_tamanho, self._padroes, self._ids_padrao,
+            self._offsets_norm,
+        ]
+
+    def _liberar_visoes(self):
+        for v in reversed(self._visoes):
+            v.release()
+        self._visoes = []
+
+    def fechar(self):
+        if not self._dono or self._mmap.closed:
+            return
+        self._liberar_visoes()
+        self._mmap.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.fechar()
+
+    def __len__(self):
+        return self.total
+
+    # ---------------------------
+    # Acesso por id
+    # ---------------------------
+    def palavra(self, i):
+        palavra = str(self._blob[self._offsets[i]:self._offsets[i + 1]], "utf-8")
+        return palavra.upper() if self.maiusculas else palavra
+
+    def valor(self, i):
+        return self._valores[i]
+
+    def itens(self):
+        """Gera (palavra, valor) em ordem de preferência (= top_sorted no modo rank)."""
+        for i in range(self.total):
+            yield self.palavra(i), self._valores[i]
+
+    def como_dict(self):
+        """{palavra: valor} na ordem de preferência."""
+        return dict(self.itens())
+
+    # ---------------------------
+    # Buckets
+    # ---------------------------
+    def ids_por_tamanho(self, tamanho):
+        """Ids de comprimento `tamanho`, em ordem de preferência (memoryview uint32)."""
+        tabela = self._tamanhos
+        baixo, alto = 0, self.total_tamanhos
+        while baixo < alto:
+            meio = (baixo + alto) // 2
+            if tabela[3 * meio] < tamanho:
+                baixo = meio + 1
+            else:
+                alto = meio
+        if baixo == self.total_tamanhos or tabela[3 * baixo] != tamanho:
+            return self._ids_tamanho[0:0]
+        inicio, quantidade = tabela[3 * baixo + 1], tabela[3 * baixo + 2]
+        return self._ids_tamanho[inicio:inicio + quantidade]
+
+    def _padrao(self, k):
+        inicio, tamanho = self._padroes[4 * k], self._padroes[4 * k + 1]
+        return bytes(self._blob_padroes[inicio:inicio + tamanho])
+
+    def ids_por_padrao(self, padrao):
+        """Ids com o padrão isomorfo `padrao` (ex.: "ABCA"), em ordem de preferência."""
+        chave = padrao.encode("ascii")
+        baixo, alto = 0, self.total_padroes
+        while baixo < alto:
+            meio = (baixo + alto) // 2
+            if self._padrao(meio) < chave:
+                baixo = meio + 1
+            else:
+                alto = meio
+        if baixo == self.total_padroes or self._padrao(baixo) != chave:
+            return self._ids_padrao[0:0]
+        inicio, quantidade = self._padroes[4 * baixo + 2], self._padroes[4 * baixo + 3]
+        return self._ids_padrao[inicio:inicio + quantidade]
+
+    def _normalizada(self, k):
+        return bytes(self._normalizadas[self._offsets_norm[k]:self._offsets_norm[k + 1]])
+
+    def contem_normalizada(self, normalizada):
+        """`normalizada` (já em normalizar_palavra) é a forma de alguma palavra? (busca binária)"""
+        chave = normalizada.encode("utf-8")
+        baixo, alto = 0, self.total_normalizadas
+        while baixo < alto:
+            meio = (baixo + alto) // 2
+            if self._normalizada(meio) < chave:
+                baixo = meio + 1
+            else:
+                alto = meio
+        return baixo < self.total_normalizadas and self._normalizada(baixo) == chave
+
+    def __contains__(self, palavra):
+        """`palavra` é uma das palavras do dicionário? (só o bucket do padrão isomorfo dela é lido)"""
+        for candidata, _ in self.candidatas(palavra.lower(), exigir_isomorfo=True):
+            if candidata == palavra:
+                return True
+        return False
+
+    # ---------------------------
+    # interface de IndiceIsomorfos
+    # ---------------------------
+    def candidatas(self, palavra_atual, exigir_isomorfo=None):
+        """
+        Gera (palavra, valor) do mesmo padrão isomorfo de `palavra_atual` (ou só
+        do mesmo comprimento) cujas letras reveladas (minúsculas) coincidem.
+        """
+        if exigir_isomorfo is None:
+            exigir_isomorfo = self.exigir_isomorfo
+        if exigir_isomorfo:
+            ids = self.ids_por_padrao(padrao_isomorfo(palavra_atual))
+        else:
+            ids = self.ids_por_tamanho(len(palavra_atual))
+        reveladas = [(i, ch) for i, ch in enumerate(palavra_atual) if ch.islower()]
+        # palavras ASCII (bytes == caracteres): compara os bytes sem decodificar
+        bytes_aceitos = [(p, {ord(ch), ord(ch.upper()[0])}) for p, ch in reveladas]
+        tamanho = len(palavra_atual)
+        blob, offsets = self._blob, self._offsets
+        for i in ids:
+            inicio = offsets[i]
+            if offsets[i + 1] - inicio == tamanho:
+                if all(blob[inicio + p] in aceitos for p, aceitos in bytes_aceitos):
+                    yield self.palavra(i), self._valores[i]
+                continue
+            palavra = self.palavra(i)
+            if all(palavra[p].lower() == ch for p, ch in reveladas):
+                yield palavra, self._valores[i]
+
+    def palavras(self, palavra_atual):
+        """Só as palavras de candidatas(palavra_atual) (gerador: os chamadores param na primeira compatível)."""
+        return (palavra for palavra, _ in self.candidatas(palavra_atual))
+
+    # ---------------------------
+    # interface de funcoes_decodificador.Dicionario
+    # ---------------------------
+    def proxima_disponivel(self, tamanho):
+        """Primeira palavra de comprimento `tamanho` fora de `usadas` (cursor por comprimento, só avança)."""
+        ids = self.ids_por_tamanho(tamanho)
+        i = self._cursores.get(tamanho, 0)
+        usadas = self.usadas
+        while i < len(ids) and self.palavra(ids[i]) in usadas:
+            i += 1
+        self._cursores[tamanho] = i
+        return self.palavra(ids[i]) if i < len(ids) else None
+
+    def marcar_usada(self, palavra):
+        self.usadas.add(palavra)
+
+    def liberar(self, palavra):
+        """Tira `palavra` de `usadas` e recua o cursor do comprimento dela."""
+        self.usadas.discard(palavra)
+        self._cursores.pop(len(palavra), None)
+
+    def com_usadas(self, usadas):
+        """Mesmas seções, outro conjunto de usadas e cursores novos (fechar() só no original)."""
+        outro = object.__new__(type(self))
+        outro.__dict__.update(self.__dict__)
+        outro._dono = False
+        outro.usadas = usadas
+        outro._cursores = {}
+        outro.normalizadas = _NormalizadasCompiladas(outro)
+        return outro
+
+
+def carregar_dicionario(caminho, variavel=None, ordem=None):
+    """dict palavra -> valor de um .dicc (mmap, recusado se não estiver em `ordem`), .py (sem executar) ou .txt."""
+    if str(caminho).endswith(EXTENSAO):
+        with DicionarioCompilado(caminho, ordem=ordem) as dicionario:
+            return dicionario.como_dict()
+    return ler_fonte_dicionario(caminho, variavel)
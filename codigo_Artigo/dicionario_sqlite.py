@@ -0,0 +1,257 @@
+# ================================================================
+# dicionario_sqlite.py — vocabulário grande ranqueado em um arquivo SQLite
+#
+# Contém funções para:
+#  - gravar um vocabulário (centenas de milhares de palavras com rank/score,
+#    lido de um .py/.txt como em dicionario_compilado.py) em uma tabela com
+#    colunas indexadas: comprimento, padrão isomorfo, forma normalizada e a
+#    letra de cada posição (p0, p1, ...)
+#  - consultar candidatas por SQL indexado (comprimento/padrão + letras já
+#    reveladas), em ordem de preferência e paginadas (keyset por id), sem
+#    carregar o vocabulário na memória
+#  - oferecer as mesmas interfaces usadas pelos solvers:
+#      * candidatas()/palavras() de indice_isomorfos.IndiceIsomorfos
+#        (encontrar_candidata_compatível, buscas do codigo_NoMuque)
+#      * proxima_disponivel()/marcar_usada() de funcoes_decodificador.Dicionario
+#        (Passo 6)
+#      * `in` sobre a forma normalizada (marcação de usadas e Passo 12)
+#
+# id = posição na ordem de preferência (0 = melhor), como no .dicc.
+# Letras são comparadas em minúsculas (como em indice_posicional.py); só as
+# primeiras MAX_POSICOES posições têm coluna — as demais são filtradas em Python.
+# As primeiras POSICOES_INDEXADAS têm índice (tamanho, pN, id) e
+# (padrao, pN, id): sem o segundo, o SQLite percorre o bucket do padrão inteiro
+# (~12 ms/consulta em 500 mil palavras, contra ~1,5 ms com ele).
+# ================================================================
+
+import os
+import sqlite3
+
+from dicionario_compilado import ORDEM_RANK, normalizar_palavra, ordenar_por_preferencia, verificar_ordem
+from indice_isomorfos import padrao_isomorfo
+from indice_posicional import letras_reveladas
+
+EXTENSAO = ".sqlite"
+VERSAO_FORMATO = 1
+MAX_POSICOES = 16
+POSICOES_INDEXADAS = 8
+TAMANHO_PAGINA = 256
+
+_COLUNAS_POSICAO = [f"p{i}" for i in range(MAX_POSICOES)]
+
+
+# ---------------------------
+# Gravação
+# ---------------------------
+def _linhas(ordenadas):
+    for i, (palavra, valor) in enumerate(ordenadas):
+        letras = palavra.lower()
+        posicoes = [letras[p] if p < len(letras) else None for p in range(MAX_POSICOES)]
+        yield (i, palavra, int(valor), len(palavra),
+               padrao_isomorfo(palavra, ignorar_caixa=True), normalizar_palavra(palavra), *posicoes)
+
+
+def compilar_dicionario_sqlite(palavras_valores, destino, ordem=ORDEM_RANK):
+    """
+    Grava `palavras_valores` (dict palavra -> rank/score) em `destino` (.sqlite),
+    na ordem de dicionario_compilado.ordenar_por_preferencia. Os índices são
+    criados depois da carga (mais rápido) e o arquivo só substitui `destino`
+    quando está completo. Retorna o número de palavras gravadas.
+    """
+    ordenadas = ordenar_por_preferencia(palavras_valores, ordem)
+    temporario = f"{destino}.{os.getpid()}.tmp"
+    if os.path.exists(temporario):
+        os.remove(temporario)
+
+    con = sqlite3.connect(temporario)
+    try:
+        con.execute("PRAGMA journal_mode = OFF")
+        con.execute("PRAGMA synchronous = OFF")
+        colunas = ", ".join(f"{c} TEXT" for c in _COLUNAS_POSICAO)
+        con.execute(
+            "CREATE TABLE palavras (id INTEGER PRIMARY KEY, palavra TEXT NOT NULL, valor INTEGER NOT NULL, "
+            f"tamanho INTEGER NOT NULL, padrao TEXT NOT NULL, normalizada TEXT NOT NULL, {colunas})"
+        )
+        con.execute("CREATE TABLE meta (chave TEXT PRIMARY KEY, valor TEXT NOT NULL)")
+        marcadores = ", ".join("?" * (6 + MAX_POSICOES))
+        con.executemany(f"INSERT INTO palavras VALUES ({marcadores})", _linhas(ordenadas))
+
+        con.execute("CREATE INDEX idx_tamanho ON palavras (tamanho, id)")
+        con.execute("CREATE INDEX idx_padrao ON palavras (padrao, id)")
+        con.execute("CREATE INDEX idx_normalizada ON palavras (normalizada)")
+        for coluna in _COLUNAS_POSICAO[:POSICOES_INDEXADAS]:
+            con.execute(f"CREATE INDEX idx_{coluna} ON palavras (tamanho, {coluna}, id)")
+            con.execute(f"CREATE INDEX idx_padrao_{coluna} ON palavras (padrao, {coluna}, id)")
+        con.executemany("INSERT INTO meta VALUES (?, ?)", [
+            ("versao", str(VERSAO_FORMATO)), ("ordem", ordem),
+            ("total", str(len(ordenadas))), ("max_posicoes", str(MAX_POSICOES)),
+        ])
+        con.execute("ANALYZE")
+        con.commit()
+    finally:
+        con.close()
+    os.replace(temporario, destino)
+    return len(ordenadas)
+
+
+# ---------------------------
+# Consulta
+# ---------------------------
+class _NormalizadasSQLite:
+    """`norm in conjunto` para formas já normalizadas (substitui o set top_set_normalized)."""
+
+    def __init__(self, dicionario):
+        self._dicionario = dicionario
+
+    def __contains__(self, normalizada):
+        return self._dicionario._existe("normalizada", normalizada)
+
+
+class DicionarioSQLite:
+    """
+    Vocabulário em SQLite, consultado sob demanda.
+
+      candidatas(palavra_atual)  -> (palavra, valor) compatíveis, em ordem de preferência
+      palavras(palavra_atual)    -> só as palavras de candidatas()
+      pagina(...)                -> uma página [(id, palavra, valor)] a partir de `apos_id`
+
+    exigir_isomorfo tem o mesmo sentido de IndiceIsomorfos. Com maiusculas=True
+    as palavras saem em maiúsculas (como _load_top_words do codigo_NoMuque).
+    `usadas` é o conjunto consultado por proxima_disponivel (interface de
+    funcoes_decodificador.Dicionario). Com `ordem`, um arquivo compilado na
+    outra ordem é recusado com ValueError (como em DicionarioCompilado).
+    """
+
+    def __init__(self, caminho, exigir_isomorfo=True, maiusculas=False, usadas=None,
+                 tamanho_pagina=TAMANHO_PAGINA, ordem=None):
+        self.caminho = str(caminho)
+        if not os.path.exists(self.caminho):
+            raise FileNotFoundError(f"Dicionário SQLite não encontrado: {self.caminho}")
+        self.exigir_isomorfo = exigir_isomorfo
+        self.maiusculas = maiusculas
+        self.tamanho_pagina = tamanho_pagina
+        self.usadas = set() if usadas is None else usadas
+        self._cursores = {}
+        self._con = sqlite3.connect(f"file:{self.caminho}?mode=ro", uri=True, check_same_thread=False)
+        meta = dict(self._con.execute("SELECT chave, valor FROM meta"))
+        if int(meta.get("versao", 0)) != VERSAO_FORMATO:
+            self._con.close()
+            raise ValueError(f"{self.caminho}: versão de formato {meta.get('versao')} não suportada")
+        self.ordem = meta["ordem"]
+        try:
+            verificar_ordem(self.caminho, self.ordem, ordem)
+        except ValueError:
+            self._con.close()
+            raise
+        self.total = int(meta["total"])
+        self.normalizadas = _NormalizadasSQLite(self)
+
+    def fechar(self):
+        self._con.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.fechar()
+
+    def __len__(self):
+        return self.total
+
+    def __contains__(self, palavra):
+        return self._existe("palavra", palavra)
+
+    def _existe(self, coluna, valor):
+        return self._con.execute(f"SELECT 1 FROM palavras WHERE {coluna} = ? LIMIT 1", (valor,)).fetchone() is not None
+
+    def _saida(self, palavra):
+        return palavra.upper() if self.maiusculas else palavra
+
+    # ---------------------------
+    # páginas em ordem de preferência
+    # ---------------------------
+    def pagina(self, tamanho=None, padrao=None, restricoes=(), apos_id=-1, limite=None):
+        """
+        Até `limite` linhas (id, palavra, valor) com id > apos_id, em ordem de id,
+        filtradas por comprimento, padrão isomorfo e (posicao, letra). Restrições
+        além de MAX_POSICOES não entram no SQL (candidatas() as filtra depois).
+        """
+        condicoes, parametros = ["id > ?"], [apos_id]
+        if tamanho is not None:
+            condicoes.append("tamanho = ?")
+            parametros.append(tamanho)
+        if padrao is not None:
+            condicoes.append("padrao = ?")
+            parametros.append(padrao)
+        for posicao, letra in restricoes:
+            if posicao < MAX_POSICOES:
+                condicoes.append(f"{_COLUNAS_POSICAO[posicao]} = ?")
+                parametros.append(letra.lower())
+        parametros.append(limite or self.tamanho_pagina)
+        sql = f"SELECT id, palavra, valor FROM palavras WHERE {' AND '.join(condicoes)} ORDER BY id LIMIT ?"
+        return self._con.execute(sql, parametros).fetchall()
+
+    def _paginas(self, tamanho=None, padrao=None, restricoes=()):
+        apos_id = -1
+        while True:
+            linhas = self.pagina(tamanho, padrao, restricoes, apos_id)
+            yield from linhas
+            if len(linhas) < self.tamanho_pagina:
+                return
+            apos_id = linhas[-1][0]
+
+    def itens(self):
+        """Gera (palavra, valor) de todo o vocabulário, em ordem de preferência."""
+        for _id, palavra, valor in self._paginas():
+            yield self._saida(palavra), valor
+
+    # ---------------------------
+    # interface de IndiceIsomorfos
+    # ---------------------------
+    def candidatas(self, palavra_atual):
+        """Gera (palavra, valor) compatíveis com `palavra_atual`, em ordem de preferência."""
+        reveladas = letras_reveladas(palavra_atual)
+        padrao = padrao_isomorfo(palavra_atual) if self.exigir_isomorfo else None
+        excedentes = [(p, ch) for p, ch in reveladas if p >= MAX_POSICOES]
+        for _id, palavra, valor in self._paginas(len(palavra_atual), padrao, reveladas):
+            if excedentes and not all(palavra[p].lower() == ch for p, ch in excedentes):
+                continue
+            yield self._saida(palavra), valor
+
+    def palavras(self, palavra_atual):
+        """Só as palavras de candidatas(palavra_atual) (gerador: páginas lidas sob demanda)."""
+        return (palavra for palavra, _ in self.candidatas(palavra_atual))
+
+    # ---------------------------
+    # interface de funcoes_decodificador.Dicionario
+    # ---------------------------
+    def proxima_disponivel(self, tamanho):
+        """Primeira palavra de comprimento `tamanho` fora de `usadas` (cursor por comprimento, só avança)."""
+        apos_id = self._cursores.get(tamanho, -1)
+        while True:
+            linhas = self.pagina(tamanho=tamanho, apos_id=apos_id)
+            for id_, palavra, _valor in linhas:
+                palavra = self._saida(palavra)
+                if palavra not in self.usadas:
+                    self._cursores[tamanho] = id_ - 1
+                    return palavra
+                apos_id = id_
+            self._cursores[tamanho] = apos_id
+            if len(linhas) < self.tamanho_pagina:
+                return None
+
+    def marcar_usada(self, palavra):
+        self.usadas.add(palavra)
+
+    def liberar(self, palavra):
+        self.usadas.discard(palavra)
+        self._cursores.pop(len(palavra), None)
+
+    def com_usadas(self, usadas):
+        """Mesma conexão, outro conjunto de usadas e cursores novos."""
+        outro = object.__new__(DicionarioSQLite)
+        outro.__dict__.update(self.__dict__)
+        outro.usadas = usadas
+        outro._cursores = {}
+        outro.normalizadas = _NormalizadasSQLite(outro)
+        return outro
@@ -0,0 +1,425 @@
+# ================================================================
+# entrada_binaria.py — camada de entrada para arquivos de bits (encoded.txt)
+#
+# Contém funções para:
+#  - montar a tabela byte -> caractere a partir de caracteres_printaveis
+#  - converter grupos de bits em bytes de uma vez (int(..., 2).to_bytes)
+#  - ler o arquivo em blocos de tamanho fixo, carregando o grupo parcial
+#    entre blocos (memória constante para capturas de vários GB)
+#  - decodificar em fluxo, gerando (posicao, token) com as mesmas posições
+#    do Passo 4 (original_lines_by_pos)
+#  - ler o arquivo via mmap por janelas de um memoryview (sem cópia por
+#    janela no mmap); no layout de campos fixos de encoded.txt (cada grupo
+#    alinhado à direita em um campo de 8 colunas, "%8s" + separador), as
+#    janelas são cortadas em múltiplos do campo e cada janela vira bytes com
+#    um translate por coluna de bit e uma soma de inteiros, sem objeto por
+#    grupo; fora desse layout, bytes.split() cria um bytes por grupo (sem
+#    str nem zfill(8), mas com o mesmo custo por grupo do caminho de texto)
+#  - ler formatos compactos (bytes brutos, hex, base64, bits contínuos sem
+#    separador com largura fixa ou inferida) direto para os valores dos bytes
+#
+# Não importa funcoes_decodificador: o codigo_NoMuque importa este módulo e
+# tem o seu próprio funcoes_decodificador.py, que teria precedência no import.
+# ================================================================
+
+import base64
+import binascii
+import mmap
+import re
+import string
+
+# Passo 1 de decrypt.py: sequências de caracteres printáveis (sem whitespace)
+PADRAO_GRUPOS_PRINTAVEIS = re.compile(f"[{re.escape(string.printable.strip())}]+")
+# decodificar_binario_para_ascii (NoMuque): qualquer sequência sem whitespace
+PADRAO_GRUPOS_SEM_ESPACO = re.compile(r"\S+")
+
+# separadores de linha reconhecidos por str.splitlines() (Passo 4 troca " " por "\n")
+_RE_SEPARADOR_TOKEN = re.compile("[ \n\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029]")
+
+TAMANHO_BLOCO_PADRAO = 1 << 20
+TAMANHO_JANELA_MMAP = 1 << 24
+
+# whitespace reconhecido por bytes.split() (todos também separam grupos no Passo 1)
+_ESPACOS_BYTES = (b" ", b"\n", b"\t", b"\r", b"\x0b", b"\x0c")
+_VALORES_ESPACO = frozenset(b"".join(_ESPACOS_BYTES))
+_PARA_ESPACO = bytes.maketrans(b"".join(_ESPACOS_BYTES), b" " * len(_ESPACOS_BYTES))
+_ESPACO_PARA_ZERO = bytes.maketrans(b" ", b"0")
+# amostra do início do arquivo usada para reconhecer o layout de campos fixos
+_AMOSTRA_CAMPOS = 1 << 12
+
+# formatos aceitos por ler_valores_formato ("bits" = grupos ASCII separados por whitespace)
+FORMATOS_ENTRADA = ("bits", "bruto", "hex", "base64", "bits_continuos")
+# larguras testadas por inferir_largura_grupo (a primeira vence em empate)
+LARGURAS_CANDIDATAS = (8, 7, 6, 5)
+_AMOSTRA_INFERENCIA = 1 << 16
+
+# grupo de 1..8 bits (bytes crus do arquivo) -> valor do byte; já valida o grupo
+_VALOR_GRUPO = {
+    format(valor, f"0{tamanho}b").encode("ascii"): valor
+    for tamanho in range(1, 9)
+    for valor in range(1 << tamanho)
+}
+
+
+def tabela_de_dicionario(caracteres_printaveis=None, unknown_char="?"):
+    """
+    Tabela de 256 posições (valor do byte -> caractere) equivalente a consultar
+    `caracteres_printaveis` com a chave de 8 bits do byte.
+    Sem dicionário, usa chr(valor) (mesmo resultado de chr(int(bits, 2))).
+    """
+    if caracteres_printaveis is None:
+        return [chr(i) for i in range(256)]
+    return [caracteres_printaveis.get(format(i, "08b"), unknown_char) for i in range(256)]
+
+
+def grupos_para_bytes(grupos):
+    """
+    Completa cada grupo com zeros à esquerda até múltiplo de 8 e converte o
+    fluxo inteiro para bytes em uma única chamada.
+    Retorna None se algum grupo tiver caractere diferente de '0'/'1'.
+    """
+    fluxo = "".join([g.rjust(len(g) + (-len(g) % 8), "0") for g in grupos])
+    if not fluxo:
+        return b""
+    if fluxo.count("0") + fluxo.count("1") != len(fluxo):
+        return None
+    return int(fluxo, 2).to_bytes(len(fluxo) // 8, "big")
+
+
+def grupos_em_fluxo(caminho, tamanho_bloco=TAMANHO_BLOCO_PADRAO, padrao=PADRAO_GRUPOS_PRINTAVEIS):
+    """
+    Lê `caminho` em blocos de `tamanho_bloco` caracteres e gera, para cada
+    bloco, a lista de grupos (matches de `padrao`) completos daquele bloco.
+    Um grupo cortado no fim do bloco é carregado e emendado no bloco seguinte.
+    """
+    if tamanho_bloco <= 0:
+        raise ValueError("tamanho_bloco deve ser positivo")
+
+    pendente = ""
+    with open(caminho, "r", encoding="utf-8") as f:
+        while True:
+            bloco = f.read(tamanho_bloco)
+            if not bloco:
+                break
+            texto = pendente + bloco
+            grupos = padrao.findall(texto)
+            pendente = ""
+            # se o último grupo termina exatamente no fim do bloco, ele pode continuar no próximo
+            if grupos and texto.endswith(grupos[-1]):
+                pendente = grupos.pop()
+            if grupos:
+                yield grupos
+    if pendente:
+        yield [pendente]
+
+
+def decodificar_grupos(grupos, tabela, unknown_char="?"):
+    """
+    Decodifica uma lista de grupos de bits em texto usando `tabela` (256 posições).
+    Grupos com caracteres não binários seguem a regra do Passo 3: fatias de
+    8 caracteres sem chave no dicionário viram `unknown_char`.
+    """
+    dados = grupos_para_bytes(grupos)
+    if dados is not None:
+        return dados.decode("latin-1").translate(tabela)
+
+    por_chave = {format(i, "08b"): ch for i, ch in enumerate(tabela)}
+    partes = []
+    for g in grupos:
+        g = g.rjust(len(g) + (-len(g) % 8), "0")
+        for i in range(0, len(g), 8):
+            partes.append(por_chave.get(g[i:i + 8], unknown_char))
+    return "".join(partes)
+
+
+def decodificar_em_fluxo(caminho, caracteres_printaveis=None, tamanho_bloco=TAMANHO_BLOCO_PADRAO,
+                         unknown_char="?"):
+    """
+    Versão em fluxo dos Passos 1-3 + separação de tokens do Passo 4.
+
+    Gera (posicao, token) na ordem do texto, sem manter o arquivo inteiro
+    em memória. As posições são as mesmas de `original_lines_by_pos`
+    (tokens vazios entre espaços consecutivos também são gerados), e o
+    token é a linha original antes da limpeza.
+    """
+    tabela = tabela_de_dicionario(caracteres_printaveis, unknown_char)
+    posicao = 0
+    parcial = ""
+    for grupos in grupos_em_fluxo(caminho, tamanho_bloco):
+        texto = decodificar_grupos(grupos, tabela, unknown_char).replace("\r", "")
+        partes = _RE_SEPARADOR_TOKEN.split(texto)
+        if len(partes) == 1:
+            parcial += partes[0]
+            continue
+        yield posicao, parcial + partes[0]
+        posicao += 1
+        for token in partes[1:-1]:
+            yield posicao, token
+            posicao += 1
+        parcial = partes[-1]
+    # splitlines() não gera linha vazia após o último separador
+    if parcial:
+        yield posicao, parcial
+
+
+def largura_campo_fixo(amostra):
+    """
+    Largura F do campo se `amostra` (início do arquivo) está no layout de
+    campos fixos: grupos alinhados à direita em campos de F colunas (espaços
+    à esquerda), cada campo seguido de um byte de whitespace ("%8s " em
+    encoded.txt -> 8). Retorna None fora desse layout ou com F > 8.
+    """
+    amostra = amostra.translate(_PARA_ESPACO)
+    fim_grupo = re.search(rb"[01][ ]", amostra)
+    if fim_grupo is None or fim_grupo.end() - 1 > 8:
+        return None
+    largura = fim_grupo.end() - 1
+    passo = largura + 1
+    campos = len(amostra) // passo
+    if campos < 2:
+        return None
+    amostra = amostra[:campos * passo]
+    if amostra[largura::passo] != b" " * campos or amostra[largura - 1::passo].translate(None, b"01"):
+        return None
+    return largura
+
+
+def _somar_colunas(fluxo, largura, passo):
+    """
+    Um byte por registro de `passo` bytes de `fluxo` (b"0"/b"1"), com os
+    `largura` primeiros como bits do valor: cada coluna de bits
+    (fluxo[j::passo]) vira um inteiro com o bit no lugar certo de cada byte,
+    e a soma das colunas é o resultado (bits disjuntos, sem vai-um).
+    """
+    quantidade = len(fluxo) // passo
+    total = 0
+    for j in range(largura):
+        peso = 1 << (largura - 1 - j)
+        coluna = fluxo[j::passo].translate(bytes.maketrans(b"01", bytes((0, peso))))
+        total += int.from_bytes(coluna, "big")
+    return total.to_bytes(quantidade, "big")
+
+
+def janelas_mmap(caminho, tamanho_janela=TAMANHO_JANELA_MMAP):
+    """
+    Mapeia `caminho` em memória e gera (janela, largura_campo): a janela é um
+    memoryview do mmap (sem cópia, válido até a próxima iteração) de
+    ~`tamanho_janela` bytes, e nenhum grupo de bits fica dividido entre duas
+    janelas. No layout de campos fixos (largura_campo_fixo) as janelas têm um
+    número inteiro de campos + separador; fora dele são cortadas em um byte de
+    whitespace e largura_campo é None.
+    """
+    if tamanho_janela <= 0:
+        raise ValueError("tamanho_janela deve ser positivo")
+
+    with open(caminho, "rb") as f:
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # arquivo vazio não pode ser mapeado
+            return
+    with mm:
+        visao = memoryview(mm)
+        try:
+            total = len(mm)
+            largura = largura_campo_fixo(mm[:_AMOSTRA_CAMPOS])
+            passo_janela = max(1, tamanho_janela // (largura + 1)) * (largura + 1) if largura else 0
+            inicio = 0
+            while inicio < total:
+                fim = min(total, inicio + (passo_janela or tamanho_janela))
+                # no layout de campos fixos o corte cai depois de um separador; se o arquivo
+                # sair do layout e o corte cair num grupo, volta ao corte em whitespace
+                if fim < total and not (passo_janela and mm[fim - 1] in _VALORES_ESPACO):
+                    corte = max(mm.rfind(ws, inicio, fim) for ws in _ESPACOS_BYTES)
+                    if corte <= inicio:
+                        # grupo maior que a janela: estende até o próximo whitespace
+                        proximos = [p for p in (mm.find(ws, fim) for ws in _ESPACOS_BYTES) if p != -1]
+                        corte = min(proximos) if proximos else total
+                    fim = corte
+                janela = visao[inicio:fim]
+                try:
+                    yield janela, largura
+                finally:
+                    janela.release()
+                inicio = fim
+        finally:
+            visao.release()
+
+
+def _valores_campos_fixos(dados, largura):
+    """
+    valores_de_janela no layout de campos fixos: confere o layout da janela
+    inteira com operações sobre a janela (translate, fatias com passo, count)
+    e soma as colunas de bits. Retorna None se a janela sair do layout.
+    """
+    passo = largura + 1
+    if len(dados) % passo:
+        # último campo do arquivo sem o separador final
+        dados += b" "
+        if len(dados) % passo:
+            return None
+    campos = len(dados) // passo
+    dados = dados.translate(_PARA_ESPACO)
+    if (dados[largura::passo] != b" " * campos            # separador depois de cada campo
+            or dados[largura - 1::passo].translate(None, b"01")  # nenhum campo vazio
+            or dados.translate(None, b"01 ")               # só 0/1/espaço
+            # alinhado à direita: dígito seguido de espaço só no fim de cada campo
+            or dados.count(b"0 ") + dados.count(b"1 ") != campos):
+        return None
+    return _somar_colunas(dados.translate(_ESPACO_PARA_ZERO), largura, passo)
+
+
+def valores_de_janela(janela, largura_campo=None):
+    """
+    Um byte por grupo da janela. Com `largura_campo` (janelas_mmap em layout
+    de campos fixos) os espaços à esquerda de cada campo valem 0 (= zfill) e
+    os valores saem por colunas, sem objeto por grupo; sem ela (ou se a
+    janela sair do layout), consulta `_VALOR_GRUPO` com os bytes crus de cada
+    grupo. Retorna None se algum grupo tiver mais de 8 bits ou caracteres
+    fora de 0/1 (o chamador decide o caminho de texto).
+    """
+    dados = bytes(janela)
+    if largura_campo:
+        valores = _valores_campos_fixos(dados, largura_campo)
+        if valores is not None:
+            return valores
+    try:
+        return bytes(map(_VALOR_GRUPO.__getitem__, dados.split()))
+    except KeyError:
+        return None
+
+
+def decodificar_mmap(caminho, caracteres_printaveis=None, unknown_char="?",
+                     tamanho_janela=TAMANHO_JANELA_MMAP):
+    """
+    Passos 1-3 via mmap: retorna o texto decodificado do arquivo inteiro,
+    idêntico a juntar as `decodificadas` do caminho de texto.
+    Janelas fora do caso comum (grupos > 8 bits, caracteres não binários)
+    caem na regex do Passo 1 + decodificar_grupos.
+    """
+    tabela = tabela_de_dicionario(caracteres_printaveis, unknown_char)
+    partes = []
+    for janela, largura_campo in janelas_mmap(caminho, tamanho_janela):
+        valores = valores_de_janela(janela, largura_campo)
+        if valores is None:
+            grupos = PADRAO_GRUPOS_PRINTAVEIS.findall(str(janela, "utf-8"))
+            partes.append(decodificar_grupos(grupos, tabela, unknown_char))
+        else:
+            partes.append(valores.decode("latin-1").translate(tabela))
+    return "".join(partes)
+
+
+def _valores_printaveis(caracteres_printaveis=None):
+    """Valores de byte considerados texto válido na inferência de largura."""
+    if caracteres_printaveis is None:
+        return frozenset(range(32, 127))
+    return frozenset(int(chave, 2) for chave in caracteres_printaveis if len(chave) == 8)
+
+
+def bits_continuos_para_bytes(fluxo, largura_grupo):
+    """
+    Converte um fluxo de b"0"/b"1" sem separadores em um byte por grupo de
+    `largura_grupo` bits (1..8), sem fatiar grupo a grupo (_somar_colunas).
+    """
+    if not 1 <= largura_grupo <= 8:
+        raise ValueError("largura_grupo deve estar entre 1 e 8")
+    if len(fluxo) % largura_grupo:
+        raise ValueError(
+            f"fluxo de {len(fluxo)} bits não é múltiplo da largura {largura_grupo}"
+        )
+    if fluxo.translate(None, b"01"):
+        raise ValueError("fluxo contém caracteres diferentes de 0/1")
+
+    return _somar_colunas(fluxo, largura_grupo, largura_grupo)
+
+
+def inferir_largura_grupo(fluxo, caracteres_printaveis=None, larguras=LARGURAS_CANDIDATAS):
+    """
+    Escolhe a largura de grupo de um fluxo de bits contínuo: entre as larguras
+    que dividem o fluxo, a que gera mais bytes printáveis em uma amostra do início.
+    """
+    validos = _valores_printaveis(caracteres_printaveis)
+    melhor, melhor_nota = None, -1.0
+    for largura in larguras:
+        if len(fluxo) % largura:
+            continue
+        amostra = fluxo[:_AMOSTRA_INFERENCIA - _AMOSTRA_INFERENCIA % largura]
+        valores = bits_continuos_para_bytes(amostra, largura)
+        nota = sum(1 for v in valores if v in validos) / max(1, len(valores))
+        if nota > melhor_nota:
+            melhor, melhor_nota = largura, nota
+    if melhor is None:
+        raise ValueError(f"nenhuma largura em {larguras} divide o fluxo de {len(fluxo)} bits")
+    return melhor
+
+
+def ler_valores_formato(caminho, formato, largura_grupo=None, caracteres_printaveis=None):
+    """
+    Lê um arquivo em formato compacto e retorna os valores dos bytes
+    (um por caractere cifrado), prontos para a tabela de 256 posições.
+      - "bruto": o próprio conteúdo do arquivo
+      - "hex": dígitos hexadecimais (whitespace ignorado)
+      - "base64": base64 padrão (quebras de linha ignoradas)
+      - "bits_continuos": 0/1 sem separador; `largura_grupo` None = inferida
+    O formato "bits" (grupos separados por whitespace) segue pelos leitores
+    texto/fluxo/mmap.
+    """
+    if formato not in FORMATOS_ENTRADA or formato == "bits":
+        raise ValueError(f"formato compacto inválido: {formato!r} (use um de {FORMATOS_ENTRADA[1:]})")
+
+    with open(caminho, "rb") as f:
+        conteudo = f.read()
+
+    if formato == "bruto":
+        return conteudo
+    if formato == "hex":
+        return bytes.fromhex(conteudo.decode("ascii"))
+    if formato == "base64":
+        try:
+            return base64.b64decode(b"".join(conteudo.split()), validate=True)
+        except binascii.Error as e:
+            raise ValueError(f"base64 inválido em {caminho}: {e}") from None
+
+    fluxo = b"".join(conteudo.split())
+    if largura_grupo is None:
+        largura_grupo = inferir_largura_grupo(fluxo, caracteres_printaveis)
+    return bits_continuos_para_bytes(fluxo, largura_grupo)
+
+
+def decodificar_formato(caminho, formato, caracteres_printaveis=None, largura_grupo=None,
+                        unknown_char="?"):
+    """Passos 1-3 para formatos compactos: texto decodificado pela tabela de 256 posições."""
+    valores = ler_valores_formato(caminho, formato, largura_grupo, caracteres_printaveis)
+    return valores.decode("latin-1").translate(tabela_de_dicionario(caracteres_printaveis, unknown_char))
+
+
+def converter_para_formato(caminho_bits, caminho_destino, formato, largura_grupo=8):
+    """
+    Converte um arquivo no formato "bits" (ex.: encoded.txt) para um formato
+    compacto. Grupos com mais de 8 bits ou não binários não cabem em um byte
+    e geram ValueError.
+    """
+    partes = []
+    for janela, largura_campo in janelas_mmap(caminho_bits):
+        valores = valores_de_janela(janela, largura_campo)
+        if valores is None:
+            raise ValueError(f"{caminho_bits} tem grupos que não cabem em 8 bits")
+        partes.append(valores)
+    valores = b"".join(partes)
+
+    if formato == "bruto":
+        saida = valores
+    elif formato == "hex":
+        saida = valores.hex().encode("ascii")
+    elif formato == "base64":
+        saida = base64.b64encode(valores)
+    elif formato == "bits_continuos":
+        if valores and max(valores) >> largura_grupo:
+            raise ValueError(f"valores não cabem em {largura_grupo} bits")
+        saida = "".join([format(v, f"0{largura_grupo}b") for v in valores]).encode("ascii")
+    else:
+        raise ValueError(f"formato compacto inválido: {formato!r} (use um de {FORMATOS_ENTRADA[1:]})")
+
+    with open(caminho_destino, "wb") as f:
+        f.write(saida)
+    return caminho_destino
@@ -3,18 +3,25 @@
 #
 # Contém funções para:
 #  - padronizar sequências para 8 bits
-#  - decodificar via dicionário binário->caractere
+#  - decodificar via dicionário binário->caractere (e caminho em lote)
 #  - associar palavras a posições (Passo 4) com tratamento de '--', '-', "'"
+#    (via tokenizador.py; também a partir de tokens em fluxo — ver entrada_binaria.py),
+#    guardando o resultado em um ArmazemTokens (armazem_tokens.py)
 #  - ordenar palavras em blocos intercalados (Passo 5)
+#  - dicionário ranqueado com visões por comprimento e cursores da
+#    "primeira candidata ainda não usada" (classe Dicionario)
 #  - gerar e aplicar mapeamentos (Passos 6..10)
-#  - cálculo de impacto e busca de candidatas compatíveis
+#  - cálculo de impacto e busca de candidatas compatíveis (opcionalmente pelo
+#    índice de padrões isomorfos — ver indice_isomorfos.py)
 #  - restauração por posição (Passo 11/13)
 #  - aplicar mapeamento a texto completo (Passo 14 helper)
 # ================================================================
 
 from collections import defaultdict
-import unicodedata
-import re
+
+from armazem_tokens import ArmazemTokens
+from entrada_binaria import tabela_de_dicionario
+from tokenizador import limpar_token
 
 # ---------------------------
 # Passo 2: padronização 8 bits
@@ -29,9 +36,8 @@ def padronizar_para_8bits(sequencias):
     for seq in sequencias:
         seq = seq.strip()
         seq = seq.replace(" ", "")
-        while len(seq) % 8 != 0:
-            seq = "0" + seq
-        sequencias_padronizadas.append(seq)
+        # rjust completa de uma vez (equivalente ao antigo while de "0" + seq)
+        sequencias_padronizadas.append(seq.rjust(len(seq) + (-len(seq) % 8), "0"))
     return sequencias_padronizadas
 
 
@@ -63,17 +69,68 @@ def buscar_e_substituir_por_dicionario(sequencias_padronizadas, caracteres_print
 
 
 # ---------------------------
-# Helpers de limpeza / normalização para Passo 4
+# Passo 2+3 em lote: fluxo de bits inteiro -> bytes -> texto
 # ---------------------------
-def _remover_acentos(s: str) -> str:
+def decodificar_em_lote(sequencias, caracteres_printaveis, unknown_char="?"):
     """
-    Normaliza string Unicode e remove marcas diacríticas (acentos).
-    Retorna string sem acentos.
+    Caminho em lote para os Passos 2 e 3: mesmo resultado de
+    buscar_e_substituir_por_dicionario(padronizar_para_8bits(sequencias), ...).
+
+    Em vez de fatiar cada byte e consultar o dicionário, junta todas as
+    sequências padronizadas em um único fluxo de bits, converte o fluxo inteiro
+    para `bytes` com int(..., 2).to_bytes (linear para base 2) e traduz cada
+    byte pela tabela de 256 posições. O texto resultante é fatiado de volta
+    em uma string por sequência de entrada.
+    Se houver caracteres diferentes de '0'/'1', cai no caminho original.
     """
-    nkfd = unicodedata.normalize('NFD', s)
-    return ''.join(ch for ch in nkfd if not unicodedata.combining(ch))
+    if not isinstance(caracteres_printaveis, dict):
+        raise TypeError("caracteres_printaveis deve ser um dict binario->caractere")
+
+    sequencias = list(sequencias)
+    tamanhos = set(map(len, sequencias))
+    # caso comum (Passo 1): cada sequência é um único grupo de 1..8 bits
+    um_byte_por_seq = bool(tamanhos) and min(tamanhos) > 0 and max(tamanhos) <= 8
+    if um_byte_por_seq:
+        padronizadas = None
+        fluxo = "".join([seq.rjust(8, "0") for seq in sequencias])
+    else:
+        padronizadas = padronizar_para_8bits(sequencias)
+        fluxo = "".join(padronizadas)
+    if not fluxo:
+        return ["" for _ in sequencias]
+    # espaços/whitespace ou caracteres não binários: caminho original (strip + dicionário)
+    if fluxo.count("0") + fluxo.count("1") != len(fluxo):
+        if padronizadas is None:
+            padronizadas = padronizar_para_8bits(sequencias)
+        return buscar_e_substituir_por_dicionario(padronizadas, caracteres_printaveis, unknown_char)
+
+    dados = int(fluxo, 2).to_bytes(len(fluxo) // 8, "big")
+    tabela = tabela_de_dicionario(caracteres_printaveis, unknown_char)
+    # valores com mais de 1 caractere quebram o alinhamento byte -> posição no texto
+    alinhado = all(len(ch) == 1 for ch in tabela)
+    if alinhado:
+        # latin-1 preserva o valor do byte em cada caractere (0..255) para o translate
+        texto = dados.decode("latin-1").translate(tabela)
+        if um_byte_por_seq:
+            return list(texto)
+    if um_byte_por_seq:
+        return [tabela[b] for b in dados]
+
+    resultados = []
+    inicio = 0
+    for seq in padronizadas:
+        fim = inicio + len(seq) // 8
+        if alinhado:
+            resultados.append(texto[inicio:fim])
+        else:
+            resultados.append(dados[inicio:fim].decode("latin-1").translate(tabela))
+        inicio = fim
+    return resultados
 
 
+# ---------------------------
+# Helpers de limpeza / normalização para Passo 4
+# ---------------------------
 def _limpar_token_por_regras(token: str) -> (str, str):
     """
     Aplica as regras solicitadas para limpar um token e retorna (token_limpo, suffix).
@@ -87,33 +144,9 @@ def _limpar_token_por_regras(token: str) -> (str, str):
       3) Mantém apenas letras A-Z (remove vírgulas, pontos, números, parênteses, etc).
       4) Retorna token_limpo (pode ser string vazia) e suffix (string com o símbolo+resto ou "").
     Observação: preserva capitalização original (não converte para lower/upper).
+    Implementação em tokenizador.limpar_token (regex pré-compilada + tabela de translate).
     """
-    if not token:
-        return "", ""
-
-    suffix = ""
-    # procurar primeiro ocorrência dentre '--' ou um dos símbolos (' \' \u2019 ` -')
-    # a regex prioriza '--' colocando-o primeiro
-    m = re.search(r"(--|[\'\u2019`-])", token)
-    if m:
-        pos = m.start()
-        sym = m.group(1)  # pode ser '--' ou um símbolo único
-        sym_len = len(sym)
-        # se símbolo for seguido de letra (aceitamos acentuadas), cortamos e guardamos o sufixo
-        if pos + sym_len < len(token) and re.match(r"[A-Za-z\u00C0-\u017F]", token[pos + sym_len]):
-            suffix = token[pos:]  # inclui o(s) símbolo(s) e o resto
-            token = token[:pos]
-        else:
-            # se não há letra depois, removemos apenas o(s) símbolo(s)
-            token = token[:pos] + token[pos+sym_len:]
-
-    # remover acentos
-    token_sem_acentos = _remover_acentos(token)
-
-    # manter apenas letras
-    token_limpo = re.sub(r'[^A-Za-z]', '', token_sem_acentos)
-
-    return token_limpo, suffix
+    return limpar_token(token)
 
 
 # ---------------------------
@@ -133,31 +166,33 @@ def associar_palavras_com_posicao(sequencias):
       - idx é incrementado para cada token (mesmo quando limpeza gera vazio — preserva posições)
     Retorna:
       - palavras_pos: lista de (posicao_original, palavra_limpa)
-      - original_lines_by_pos: dict posicao -> linha_original (string)
+      - original_lines_by_pos: Mapping posicao -> linha_original (string)
     """
-    texto_unido = "".join(seq.replace("\r", "") for seq in sequencias)
-    texto_formatado = texto_unido.replace(" ", "\n")
+    armazem = armazem_de_sequencias(sequencias)
+    return armazem.palavras_pos(), armazem.linhas_originais()
 
-    palavras_pos = []
-    original_lines_by_pos = {}
-    idx = 0
 
-    for linha in texto_formatado.splitlines():
-        linha_original = linha
-        linha = linha.strip()
-        original_lines_by_pos[idx] = linha_original
+def armazem_de_sequencias(sequencias):
+    """Passo 4 como ArmazemTokens (colunas + vocabulário internado)."""
+    texto_unido = "".join(seq.replace("\r", "") for seq in sequencias)
 
-        if not linha:
-            idx += 1
-            continue
+    # uma varredura do tokenizador (espaço e quebras de linha separam tokens)
+    return ArmazemTokens.de_texto(texto_unido)
 
-        token_limpo, suffix = _limpar_token_por_regras(linha)
 
-        if token_limpo:
-            palavras_pos.append((idx, token_limpo))
-        idx += 1
+def associar_palavras_de_fluxo(tokens_com_posicao):
+    """
+    Passo 4 a partir de um iterável de (posicao, linha_original), como o gerado
+    por entrada_binaria.decodificar_em_fluxo. Mesmo retorno de
+    associar_palavras_com_posicao, sem precisar do texto decodificado inteiro.
+    """
+    armazem = armazem_de_fluxo(tokens_com_posicao)
+    return armazem.palavras_pos(), armazem.linhas_originais()
+
 
-    return palavras_pos, original_lines_by_pos
+def armazem_de_fluxo(tokens_com_posicao):
+    """Passo 4 em fluxo como ArmazemTokens."""
+    return ArmazemTokens.de_linhas(tokens_com_posicao)
 
 
 # ---------------------------
@@ -189,6 +224,85 @@ def ordenar_palavras_por_tamanho_em_blocos(palavras_pos):
     return blocos, flat
 
 
+# ---------------------------
+# Dicionário ranqueado (top_words) com cursores por comprimento
+# ---------------------------
+class Dicionario:
+    """
+    top_words ordenado uma única vez por rank (mesma ordem de top_sorted),
+    com uma lista de palavras por comprimento e o conjunto `usadas`.
+
+    proxima_disponivel(tamanho) devolve a primeira palavra do comprimento
+    ainda não usada. Cada comprimento guarda um cursor que só avança: como
+    `usadas` só cresce (as palavras nunca são devolvidas), uma palavra
+    pulada uma vez nunca volta a ser a resposta, e o custo total de todas
+    as consultas de um comprimento é O(palavras daquele comprimento).
+    Se uma palavra sair de `usadas`, chame liberar(palavra).
+    """
+
+    def __init__(self, top_words, usadas=None):
+        # dict palavra->rank ou [(palavra, rank), ...] já na ordem de preferência
+        if isinstance(top_words, dict):
+            top_sorted = sorted(top_words.items(), key=lambda item: item[1])
+        else:
+            top_sorted = list(top_words)
+        self.top_sorted = top_sorted
+        self.por_tamanho = defaultdict(list)
+        for w, _rank in top_sorted:
+            self.por_tamanho[len(w)].append(w)
+        self.usadas = set() if usadas is None else usadas
+        self._cursores = {}
+
+    def com_usadas(self, usadas):
+        """
+        Mesmo dicionário (listas por comprimento compartilhadas) com outro
+        conjunto de usadas e cursores novos.
+        """
+        outro = object.__new__(Dicionario)
+        outro.top_sorted = self.top_sorted
+        outro.por_tamanho = self.por_tamanho
+        outro.usadas = usadas
+        outro._cursores = {}
+        return outro
+
+    def __len__(self):
+        return len(self.top_sorted)
+
+    def proxima_disponivel(self, tamanho):
+        """Primeira palavra (por rank) de comprimento `tamanho` fora de `usadas`, ou None."""
+        palavras = self.por_tamanho.get(tamanho)
+        if not palavras:
+            return None
+        i = self._cursores.get(tamanho, 0)
+        usadas = self.usadas
+        while i < len(palavras) and palavras[i] in usadas:
+            i += 1
+        self._cursores[tamanho] = i
+        return palavras[i] if i < len(palavras) else None
+
+    def marcar_usada(self, palavra):
+        self.usadas.add(palavra)
+
+    def liberar(self, palavra):
+        """Tira `palavra` de `usadas` e recua o cursor do comprimento dela."""
+        self.usadas.discard(palavra)
+        self._cursores.pop(len(palavra), None)
+
+
+def _como_dicionario(top_words, used_top_words):
+    """
+    Dicionario para os helpers abaixo: aceita dict palavra->rank, Dicionario
+    ou outro objeto com a mesma interface (ex.: dicionario_sqlite.DicionarioSQLite).
+    """
+    if hasattr(top_words, "proxima_disponivel"):
+        if used_top_words is None or used_top_words is top_words.usadas:
+            return top_words
+        return top_words.com_usadas(used_top_words)
+    if not isinstance(top_words, dict):
+        raise TypeError("top_words deve ser um dict palavra->rank")
+    return Dicionario(top_words, used_top_words)
+
+
 # ---------------------------
 # Aplicação de substituições por bloco (utilitária)
 # ---------------------------
@@ -196,34 +310,23 @@ def aplicar_substitucoes_por_bloco(blocos, flat, top_words, bloco_index=0, apply
     """
     Gera mapeamentos usando APENAS as palavras do bloco `bloco_index`
     e aplica as substituições conforme `apply_scope`.
+    `top_words` pode ser o dict palavra->rank ou um Dicionario já montado.
     Retorna (palavras_substituidas_pos, mapa)
     """
-    if not isinstance(top_words, dict):
-        raise TypeError("top_words deve ser um dict palavra->rank")
-
-    if used_top_words is None:
-        used_top_words = set()
+    dicionario = _como_dicionario(top_words, used_top_words)
 
     if bloco_index < 0 or bloco_index >= len(blocos):
         return flat.copy(), {}
 
-    top_sorted = sorted(top_words.items(), key=lambda item: item[1])
-
     mapa = {}
     letras_usadas = set()
 
-    def primeira_candidata_por_tamanho_disponivel(tamanho):
-        for w, _rank in top_sorted:
-            if len(w) == tamanho and w not in used_top_words:
-                return w
-        return None
-
     bloco = blocos[bloco_index]
     for pos, palavra in bloco:
         if palavra.islower():
             continue
 
-        candidata = primeira_candidata_por_tamanho_disponivel(len(palavra))
+        candidata = dicionario.proxima_disponivel(len(palavra))
         if not candidata:
             continue
 
@@ -237,7 +340,7 @@ def aplicar_substitucoes_por_bloco(blocos, flat, top_words, bloco_index=0, apply
                 continue
             mapa[c_cifrado] = c_claro_lower
             letras_usadas.add(c_claro_lower)
-        used_top_words.add(candidata)
+        dicionario.marcar_usada(candidata)
 
     pos_to_word = {pos: pw for pos, pw in flat}
     if apply_scope == 'block':
@@ -260,26 +363,15 @@ def aplicar_substitucoes_por_bloco(blocos, flat, top_words, bloco_index=0, apply
 # Funções step-by-step para aplicar 1 mapeamento de cada vez
 # ---------------------------
 def gerar_mapeamentos_por_bloco(bloco, top_words, used_top_words=None):
-    if not isinstance(top_words, dict):
-        raise TypeError("top_words deve ser um dict palavra->rank")
-    if used_top_words is None:
-        used_top_words = set()
-
-    top_sorted = sorted(top_words.items(), key=lambda item: item[1])
+    dicionario = _como_dicionario(top_words, used_top_words)
     mapa = {}
     letras_usadas = set()
     mapeamentos = []
 
-    def primeira_candidata_disponivel(tamanho):
-        for w, _rank in top_sorted:
-            if len(w) == tamanho and w not in used_top_words:
-                return w
-        return None
-
     for pos, palavra in bloco:
         if palavra.islower():
             continue
-        candidata = primeira_candidata_disponivel(len(palavra))
+        candidata = dicionario.proxima_disponivel(len(palavra))
         if not candidata:
             continue
         for c_cifrado, c_claro in zip(palavra, candidata):
@@ -296,16 +388,13 @@ def gerar_mapeamentos_por_bloco(bloco, top_words, used_top_words=None):
             mapa[c_cifrado] = c_claro_lower
             letras_usadas.add(c_claro_lower)
             mapeamentos.append((c_cifrado, c_claro_lower))
-        used_top_words.add(candidata)
+        dicionario.marcar_usada(candidata)
 
     return mapeamentos
 
 
 def gerar_mapeamentos_para_primeira_palavra(bloco, top_words, used_top_words=None):
-    if not isinstance(top_words, dict):
-        raise TypeError("top_words deve ser um dict palavra->rank")
-    if used_top_words is None:
-        used_top_words = set()
+    dicionario = _como_dicionario(top_words, used_top_words)
 
     primeira = None
     for pos, palavra in bloco:
@@ -316,15 +405,7 @@ def gerar_mapeamentos_para_primeira_palavra(bloco, top_words, used_top_words=Non
     if primeira is None:
         return [], None
 
-    top_sorted = sorted(top_words.items(), key=lambda item: item[1])
-
-    tamanho = len(primeira)
-    candidata = None
-    for w, _rank in top_sorted:
-        if len(w) == tamanho and w not in used_top_words:
-            candidata = w
-            break
-
+    candidata = dicionario.proxima_disponivel(len(primeira))
     if candidata is None:
         return [], None
 
@@ -340,33 +421,41 @@ def gerar_mapeamentos_para_primeira_palavra(bloco, top_words, used_top_words=Non
     return mapeamentos, candidata
 
 
-def aplicar_um_mapeamento_em_posicoes(flat, mapeamento, pos_targets):
-    c_cifrado, c_claro = mapeamento
-    partial_map = {c_cifrado: c_claro}
-    pos_to_word = {pos: pw for pos, pw in flat}
-    for pos in pos_targets:
-        palavra = pos_to_word.get(pos, "")
-        if not palavra:
+def _aplicar_tabela_em_posicoes(flat, tabela, pos_targets):
+    """
+    Traduz (str.translate) as palavras de `flat` cujas posições estão em
+    pos_targets, sem montar um dict posição -> palavra do flat inteiro.
+    Cada palavra distinta é traduzida uma vez; tuplas fora do alvo são reaproveitadas.
+    """
+    if not isinstance(pos_targets, (set, frozenset, dict)):
+        pos_targets = set(pos_targets)
+    traduzidas = {}
+    novo_flat = []
+    adicionar = novo_flat.append
+    for item in flat:
+        pos, palavra = item
+        if pos not in pos_targets or not palavra:
+            adicionar(item)
             continue
-        nova = "".join(partial_map.get(ch, ch) for ch in palavra)
-        pos_to_word[pos] = nova
-    novo_flat = [(pos, pos_to_word.get(pos, "")) for pos, _ in flat]
+        nova = traduzidas.get(palavra)
+        if nova is None:
+            nova = traduzidas[palavra] = palavra.translate(tabela)
+        adicionar((pos, nova))
     return novo_flat
 
 
+def _tabela_de_mapeamentos(mapeamentos):
+    return str.maketrans({c: v for c, v in mapeamentos if len(c) == 1})
+
+
+def aplicar_um_mapeamento_em_posicoes(flat, mapeamento, pos_targets):
+    return _aplicar_tabela_em_posicoes(flat, _tabela_de_mapeamentos([mapeamento]), pos_targets)
+
+
 def aplicar_mapeamentos_em_posicoes(flat, mapeamentos, pos_targets):
     if not mapeamentos:
         return flat.copy()
-    parcial = {c: v for c, v in mapeamentos}
-    pos_to_word = {pos: pw for pos, pw in flat}
-    for pos in pos_targets:
-        palavra = pos_to_word.get(pos, "")
-        if not palavra:
-            continue
-        nova = "".join(parcial.get(ch, ch) for ch in palavra)
-        pos_to_word[pos] = nova
-    novo_flat = [(pos, pos_to_word.get(pos, "")) for pos, _ in flat]
-    return novo_flat
+    return _aplicar_tabela_em_posicoes(flat, _tabela_de_mapeamentos(mapeamentos), pos_targets)
 
 
 # ---------------------------
@@ -378,8 +467,10 @@ def calcular_impacto_por_bloco(bloco, flat_before, flat_after, exclude_positions
     else:
         exclude_positions = set(exclude_positions)
 
-    before_map = {pos: pw for pos, pw in flat_before}
-    after_map = {pos: pw for pos, pw in flat_after}
+    # só as posições do bloco (não o flat inteiro)
+    posicoes_bloco = {pos for pos, _ in bloco}
+    before_map = {pos: pw for pos, pw in flat_before if pos in posicoes_bloco}
+    after_map = {pos: pw for pos, pw in flat_after if pos in posicoes_bloco}
 
     resultados = []
     for pos, _ in bloco:
@@ -412,7 +503,15 @@ def calcular_impacto_por_bloco(bloco, flat_before, flat_after, exclude_positions
     return resultados
 
 
-def encontrar_candidata_compatível(palavra_atual, top_sorted, mapa_existente, letras_usadas, used_top_words=None):
+def encontrar_candidata_compatível(palavra_atual, top_sorted, mapa_existente, letras_usadas, used_top_words=None,
+                                   indice=None):
+    """
+    Primeira candidata de top_sorted compatível com palavra_atual (e os novos
+    mapeamentos que ela gera). Com `indice` (IndiceIsomorfos montado sobre
+    top_sorted), só as candidatas do mesmo comprimento/padrão são percorridas;
+    com um dicionario_sqlite.DicionarioSQLite como `indice`, top_sorted pode ser
+    None (as candidatas vêm de consultas SQL paginadas).
+    """
     if palavra_atual.islower():
         return None, []
 
@@ -420,7 +519,8 @@ def encontrar_candidata_compatível(palavra_atual, top_sorted, mapa_existente, l
     if used_top_words is None:
         used_top_words = set()
 
-    for w, _rank in top_sorted:
+    candidatas = top_sorted if indice is None else indice.candidatas(palavra_atual)
+    for w, _rank in candidatas:
         if len(w) != tamanho:
             continue
         if w in used_top_words:
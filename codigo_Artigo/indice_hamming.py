@@ -0,0 +1,115 @@
+# ================================================================
+# indice_hamming.py — vizinhos de uma palavra com até k letras diferentes
+#
+# Contém funções para:
+#  - somar, sem percorrer as palavras, quantas posições de cada palavra
+#    do dicionário coincidem com o token: os bitsets (posição, letra) de
+#    indice_posicional.py entram num contador "fatiado" (um int por bit
+#    da contagem, somado com meio-somadores & / ^)
+#  - selecionar os ids com contagem >= m (ou == m) comparando as fatias
+#  - responder "palavras ranqueadas a no máximo k letras (distância de
+#    Hamming) deste token", por distância crescente ou por rank
+#  - restringir a comparação a algumas posições (ex.: só as letras já
+#    reveladas de uma palavra parcialmente decifrada), tolerando até k
+#    letras erradas por ruído/erro de digitação no texto cifrado
+#
+# O custo de uma consulta é ~ comprimento x log(comprimento) operações em
+# ints do tamanho do bucket (bits), em vez de comparar letra a letra com
+# todas as palavras do mesmo comprimento.
+# Letras são comparadas em minúsculas (como em indice_posicional.py).
+# ================================================================
+
+from indice_posicional import IndicePosicional, ids_do_bitset
+
+
+def somar_bitsets(bitsets):
+    """
+    Contador fatiado: fatias[i] tem ligado o bit de cada id cuja contagem
+    (em quantos de `bitsets` ele aparece) tem o bit i ligado.
+    """
+    fatias = []
+    for bits in bitsets:
+        transporte = bits
+        for i, fatia in enumerate(fatias):
+            if not transporte:
+                break
+            fatias[i] = fatia ^ transporte
+            transporte &= fatia
+        if transporte:
+            fatias.append(transporte)
+    return fatias
+
+
+def bitset_contagem(fatias, universo, minimo, exato=False):
+    """Ids de `universo` com contagem >= minimo (ou == minimo, com exato=True)."""
+    if minimo <= 0 and not exato:
+        return universo
+    maior = 0
+    igual = universo
+    for i in range(max(len(fatias), minimo.bit_length()) - 1, -1, -1):
+        fatia = fatias[i] if i < len(fatias) else 0
+        if (minimo >> i) & 1:
+            igual &= fatia
+        else:
+            maior |= igual & fatia
+            igual &= ~fatia
+    return igual if exato else (maior | igual)
+
+
+class IndiceHamming:
+    """
+    Palavras de `itens_ranqueados` ([(palavra, rank), ...] na ordem de
+    preferência) consultadas por distância de Hamming a um token do mesmo
+    comprimento.
+
+      vizinhos(token, k)          -> [(palavra, rank, distancia)] com distancia <= k, em ordem de rank
+      por_distancia(token, k)     -> idem, ordenado por (distancia, rank)
+      mais_proxima(token, k)      -> o primeiro de por_distancia ou None
+
+    Com `posicoes`, só essas posições do token entram na comparação (a
+    distância conta as diferenças nelas).
+    """
+
+    def __init__(self, itens_ranqueados):
+        self.posicional = IndicePosicional(itens_ranqueados)
+
+    def __len__(self):
+        return len(self.posicional)
+
+    def _fatias(self, token, posicoes):
+        tamanho = len(token)
+        letras = self.posicional.letras.get(tamanho, {})
+        if posicoes is None:
+            posicoes = range(tamanho)
+        posicoes = list(posicoes)
+        bitsets = [letras.get((p, token[p].lower()), 0) for p in posicoes]
+        return somar_bitsets(bitsets), len(posicoes)
+
+    def _ids_por_distancia(self, token, k, posicoes, distancia_minima):
+        """Gera (distancia, bitset de ids) para distancia_minima..k, sob demanda."""
+        universo = self.posicional.todos.get(len(token), 0)
+        if not universo:
+            return
+        fatias, comparadas = self._fatias(token, posicoes)
+        for d in range(distancia_minima, min(k, comparadas) + 1):
+            yield d, bitset_contagem(fatias, universo, comparadas - d, exato=True)
+
+    def vizinhos(self, token, k, posicoes=None, distancia_minima=0):
+        """Palavras a distância entre distancia_minima e k do token, em ordem de rank."""
+        itens = self.posicional.itens.get(len(token))
+        distancia_do_id = {}
+        for d, bits in self._ids_por_distancia(token, k, posicoes, distancia_minima):
+            for i in ids_do_bitset(bits):
+                distancia_do_id[i] = d
+        return [(*itens[i], distancia_do_id[i]) for i in sorted(distancia_do_id)]
+
+    def por_distancia(self, token, k, posicoes=None, distancia_minima=0):
+        """Gera (palavra, rank, distancia) por distância crescente e, em cada distância, por rank."""
+        itens = self.posicional.itens.get(len(token))
+        for d, bits in self._ids_por_distancia(token, k, posicoes, distancia_minima):
+            for i in ids_do_bitset(bits):
+                yield (*itens[i], d)
+
+    def mais_proxima(self, token, k, posicoes=None, distancia_minima=0):
+        """Menor distância (<= k) e, no empate, melhor rank; None se não houver."""
+        return next(self.por_distancia(token, k, posicoes, distancia_minima), None)
@@ -0,0 +1,77 @@
+# ================================================================
+# indice_isomorfos.py — índice de candidatas por padrão de repetição
+#
+# Contém funções para:
+#  - calcular o padrão isomorfo de uma palavra (repetição de letras):
+#      LIYL -> ABCA, THAT -> ABCA, tIYt -> ABCA
+#  - montar, uma vez por dicionário, o índice de candidatas por padrão
+#    (que já fixa o comprimento) ou só por comprimento, com as letras já
+#    reveladas filtradas pelos bitsets de indice_posicional.py
+#  - devolver, para a palavra atual, apenas as candidatas estruturalmente
+#    compatíveis, na mesma ordem do dicionário de entrada
+#
+# Usado por encontrar_candidata_compatível (decrypt.py) e pelas buscas de
+# melhor palavra do codigo_NoMuque, que antes varriam o dicionário inteiro.
+# ================================================================
+
+from string import ascii_uppercase
+
+from indice_posicional import IndicePosicional, letras_reveladas
+
+_LETRAS_PADRAO = ascii_uppercase
+
+
+def padrao_isomorfo(palavra, ignorar_caixa=False):
+    """
+    Padrão de repetição de `palavra`: cada símbolo novo recebe a próxima
+    letra (A, B, C, ...). Com ignorar_caixa, 'T' e 't' contam como o mesmo símbolo.
+    Na palavra parcialmente decifrada, minúsculas (já traduzidas) e maiúsculas
+    (ainda cifradas) são símbolos diferentes.
+    """
+    if ignorar_caixa:
+        palavra = palavra.upper()
+    vistos = {}
+    partes = []
+    for ch in palavra:
+        codigo = vistos.get(ch)
+        if codigo is None:
+            indice = len(vistos)
+            # mais de 26 símbolos distintos: continua com códigos numéricos
+            codigo = _LETRAS_PADRAO[indice] if indice < len(_LETRAS_PADRAO) else f"<{indice}>"
+            vistos[ch] = codigo
+        partes.append(codigo)
+    return "".join(partes)
+
+
+class IndiceIsomorfos:
+    """
+    Candidatas de `itens_ranqueados` ([(palavra, rank), ...] já na ordem de
+    preferência, ex.: top_sorted), consultadas pelos bitsets de
+    indice_posicional.IndicePosicional:
+
+      exigir_isomorfo=True  -> candidatas(palavra) só devolve palavras com o
+                               mesmo padrão de repetição da palavra atual
+      exigir_isomorfo=False -> só filtra por comprimento (mesmo resultado da
+                               varredura completa, sem tocar nos outros tamanhos)
+
+    Nos dois modos as letras já reveladas (minúsculas) da palavra atual
+    restringem as candidatas às que têm a mesma letra na mesma posição.
+    """
+
+    def __init__(self, itens_ranqueados, exigir_isomorfo=True):
+        self.exigir_isomorfo = exigir_isomorfo
+        self.posicional = IndicePosicional(
+            itens_ranqueados, padrao=lambda palavra: padrao_isomorfo(palavra, ignorar_caixa=True)
+        )
+
+    def __len__(self):
+        return len(self.posicional)
+
+    def candidatas(self, palavra_atual):
+        """Gera [(palavra, rank), ...] compatíveis com `palavra_atual`, em ordem de rank."""
+        padrao = padrao_isomorfo(palavra_atual) if self.exigir_isomorfo else None
+        return self.posicional.consultar(len(palavra_atual), letras_reveladas(palavra_atual), padrao)
+
+    def palavras(self, palavra_atual):
+        """Só as palavras de candidatas(palavra_atual) (gerador: os chamadores param na primeira compatível)."""
+        return (palavra for palavra, _ in self.candidatas(palavra_atual))
@@ -0,0 +1,100 @@
+# ================================================================
+# indice_posicional.py — bitsets (posição, letra) por comprimento
+#
+# Contém funções para:
+#  - numerar as palavras de cada comprimento na ordem de preferência do
+#    dicionário (id 0 = melhor rank)
+#  - guardar, por comprimento, um bitset (int do Python) de ids para cada
+#    (posição, letra) e para cada padrão isomorfo
+#  - responder "palavras de tamanho L com 'h' na posição 1 e 'e' na
+#    posição 2" com a interseção (&) de poucos bitsets, devolvendo as
+#    candidatas em ordem de rank
+#
+# Letras são comparadas em minúsculas (como c_cand.lower() em
+# encontrar_candidata_compatível).
+# ================================================================
+
+import struct
+
+
+def ids_do_bitset(bitset):
+    """
+    Gera os ids (bits ligados) de `bitset` em ordem crescente.
+    O int é convertido uma vez em palavras de 64 bits (to_bytes "little" +
+    struct "<Q", sem depender da ordem de bytes da máquina): cada bit ligado
+    custa operações num int de 64 bits, e não no bitset inteiro
+    (bitset & -bitset a cada bit é quadrático em bitsets densos).
+    """
+    if not bitset:
+        return
+    dados = bitset.to_bytes((bitset.bit_length() + 63) // 64 * 8, "little")
+    for indice, (palavra,) in enumerate(struct.iter_unpack("<Q", dados)):
+        if not palavra:
+            continue
+        base = indice << 6
+        while palavra:
+            menor = palavra & -palavra
+            yield base + menor.bit_length() - 1
+            palavra ^= menor
+
+
+def letras_reveladas(palavra):
+    """[(posicao, letra)] das letras já traduzidas (minúsculas) da palavra atual."""
+    return [(i, ch) for i, ch in enumerate(palavra) if ch.islower()]
+
+
+class IndicePosicional:
+    """
+    Para cada comprimento L:
+      itens[L]    -> [(palavra, rank), ...] na ordem de `itens_ranqueados`
+      letras[L]   -> {(posicao, letra_minuscula): bitset de ids}
+      padroes[L]  -> {padrao_isomorfo: bitset de ids} (se `padrao` for dado)
+      todos[L]    -> bitset com todos os ids de tamanho L
+    """
+
+    def __init__(self, itens_ranqueados, padrao=None):
+        self.itens = {}
+        self.letras = {}
+        self.padroes = {}
+        self.todos = {}
+        for palavra, rank in itens_ranqueados:
+            tamanho = len(palavra)
+            itens = self.itens.setdefault(tamanho, [])
+            bit = 1 << len(itens)
+            itens.append((palavra, rank))
+
+            letras = self.letras.setdefault(tamanho, {})
+            for posicao, ch in enumerate(palavra.lower()):
+                chave = (posicao, ch)
+                letras[chave] = letras.get(chave, 0) | bit
+            if padrao is not None:
+                padroes = self.padroes.setdefault(tamanho, {})
+                p = padrao(palavra)
+                padroes[p] = padroes.get(p, 0) | bit
+        for tamanho, itens in self.itens.items():
+            self.todos[tamanho] = (1 << len(itens)) - 1
+
+    def __len__(self):
+        return sum(len(itens) for itens in self.itens.values())
+
+    def bitset(self, tamanho, restricoes=(), padrao=None):
+        """Ids de tamanho `tamanho` que têm cada (posicao, letra) de `restricoes` (e o padrão, se dado)."""
+        bits = self.todos.get(tamanho, 0)
+        if not bits:
+            return 0
+        if padrao is not None:
+            bits &= self.padroes.get(tamanho, {}).get(padrao, 0)
+        letras = self.letras[tamanho]
+        for posicao, letra in restricoes:
+            if not bits:
+                break
+            bits &= letras.get((posicao, letra.lower()), 0)
+        return bits
+
+    def consultar(self, tamanho, restricoes=(), padrao=None):
+        """Gera [(palavra, rank)] compatíveis, em ordem de rank (avaliação preguiçosa)."""
+        itens = self.itens.get(tamanho)
+        if not itens:
+            return
+        for i in ids_do_bitset(self.bitset(tamanho, restricoes, padrao)):
+            yield itens[i]
@@ -0,0 +1,262 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+ingerir_corpus.py
+Monta tabelas ranqueadas de palavras e de n-gramas de letras a partir de
+arquivos de texto locais de qualquer tamanho, em vez das listas curadas à
+mão (TENTATIVA_FINAL/1word_counts.py, 2top_words.py, merge_two_dicts.py).
+
+Map-reduce em processos (ProcessPoolExecutor):
+  - os arquivos são divididos em pedaços de --tamanho-pedaco MB, sempre
+    terminados logo após um byte de espaço em branco (nenhuma palavra é cortada)
+  - map: cada processo lê o seu pedaço em blocos de 1 MB (memória constante,
+    o corpus nunca é carregado inteiro) e conta as palavras
+  - reduce: soma dos contadores de palavras
+  - n-gramas de letras: derivados das contagens de palavras, dentro de cada
+    palavra marcada com a fronteira "_" (THE -> _THE_: _T, TH, HE, E_, _TH, ...);
+    o resultado não depende de como o corpus foi dividido
+
+Palavra = sequência de letras A-Z depois de tirar acentos e passar para
+maiúsculas (mesma forma das chaves de top_words.py).
+
+Saídas:
+  <saida>.py|.txt|.dicc|.sqlite   palavras ranqueadas (--formato, --ordem, --variavel)
+  <saida>_ngramas_<n>.txt         "NGRAMA contagem" por linha, contagem decrescente
+                                  (lido por dicionario_compilado.ler_lista_texto)
+
+Uso:
+    python ingerir_corpus.py corpus/ -o top_words_corpus
+    python ingerir_corpus.py "livros/*.txt" -o top_words --max-palavras 50000 --processos 4
+    python ingerir_corpus.py wiki.txt -o banco --formato dicc --ordem score --ngramas 2,3,4
+
+--ordem rank  (padrão): valor = posição no ranking (THE = 1), como top_words.py
+--ordem score:          valor = contagem no corpus, como top_words_banco_de_palavras.py
+"""
+
+import argparse
+import codecs
+import keyword
+import os
+import re
+import sys
+import time
+import unicodedata
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from string import ascii_uppercase
+
+from decrypt_lote import listar_entradas
+from dicionario_compilado import ORDEM_RANK, ORDEM_SCORE, compilar_dicionario
+from dicionario_sqlite import compilar_dicionario_sqlite
+
+SEPARADOR = "_"
+TAMANHO_BLOCO = 1 << 20
+TAMANHO_PEDACO_MB = 64
+ORDENS_PADRAO = (1, 2, 3, 4)
+FORMATOS = ("py", "txt", "dicc", "sqlite")
+
+_PALAVRA = re.compile(r"[A-Z]+")
+_ESPACOS = b" \t\n\r\f\v"
+
+
+# ---------------------------
+# Pedaços
+# ---------------------------
+def _proximo_espaco(f, posicao, tamanho):
+    """Posição logo após o primeiro byte de espaço em branco a partir de `posicao` (ou o fim do arquivo)."""
+    f.seek(posicao)
+    while posicao < tamanho:
+        dados = f.read(1 << 16)
+        if not dados:
+            break
+        for i, byte in enumerate(dados):
+            if byte in _ESPACOS:
+                return posicao + i + 1
+        posicao += len(dados)
+    return tamanho
+
+
+def dividir_em_pedacos(caminhos, tamanho_pedaco=TAMANHO_PEDACO_MB << 20):
+    """
+    [(caminho, início, fim)] cobrindo os arquivos. Cada fim cai logo após um
+    espaço em branco ASCII (que em UTF-8 nunca está no meio de um caractere)
+    ou no fim do arquivo.
+    """
+    pedacos = []
+    for caminho in caminhos:
+        tamanho = os.path.getsize(caminho)
+        inicio = 0
+        with open(caminho, "rb") as f:
+            while inicio < tamanho:
+                fim = min(inicio + tamanho_pedaco, tamanho)
+                if fim < tamanho:
+                    fim = _proximo_espaco(f, fim, tamanho)
+                pedacos.append((caminho, inicio, fim))
+                inicio = fim
+    return pedacos
+
+
+# ---------------------------
+# Map / reduce
+# ---------------------------
+def normalizar_texto(texto):
+    """Sem acentos e em maiúsculas (só decompõe quando há caracteres não ASCII)."""
+    if not texto.isascii():
+        texto = unicodedata.normalize("NFD", texto)
+        texto = "".join(ch for ch in texto if not unicodedata.combining(ch))
+    return texto.upper()
+
+
+def contar_pedaco(pedaco, tamanho_bloco=TAMANHO_BLOCO):
+    """Counter de palavras de um pedaço (caminho, início, fim), lido em blocos."""
+    caminho, inicio, fim = pedaco
+    palavras = Counter()
+    decodificador = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    resto = ""  # letras do fim do bloco anterior: a palavra pode continuar no próximo
+    with open(caminho, "rb") as f:
+        f.seek(inicio)
+        restante = fim - inicio
+        while restante > 0:
+            dados = f.read(min(tamanho_bloco, restante))
+            if not dados:
+                break
+            restante -= len(dados)
+            texto = resto + normalizar_texto(decodificador.decode(dados))
+            completo = texto.rstrip(ascii_uppercase)
+            resto = texto[len(completo):]
+            palavras.update(_PALAVRA.findall(completo))
+    resto += normalizar_texto(decodificador.decode(b"", final=True))
+    palavras.update(_PALAVRA.findall(resto))
+    return palavras
+
+
+def contar_corpus(caminhos, processos=None, tamanho_pedaco=TAMANHO_PEDACO_MB << 20):
+    """Counter de palavras de todos os arquivos (map em processos, reduce aqui)."""
+    pedacos = dividir_em_pedacos(caminhos, tamanho_pedaco)
+    total = Counter()
+    if processos == 1 or len(pedacos) <= 1:
+        for pedaco in pedacos:
+            total.update(contar_pedaco(pedaco))
+        return total
+    with ProcessPoolExecutor(max_workers=processos) as executor:
+        for parcial in executor.map(contar_pedaco, pedacos):
+            total.update(parcial)
+    return total
+
+
+def contar_ngramas(palavras, ordens=ORDENS_PADRAO):
+    """{n: Counter} de n-gramas de letras de cada palavra marcada com SEPARADOR nas pontas."""
+    ngramas = {n: Counter() for n in ordens}
+    for palavra, contagem in palavras.items():
+        marcada = f"{SEPARADOR}{palavra}{SEPARADOR}"
+        for n, tabela in ngramas.items():
+            for i in range(len(marcada) - n + 1):
+                ngrama = marcada[i:i + n]
+                if ngrama != SEPARADOR:
+                    tabela[ngrama] += contagem
+    return ngramas
+
+
+def ranquear(contagens, min_contagem=1, maximo=None):
+    """[(chave, contagem)] por contagem decrescente (empate: ordem alfabética)."""
+    itens = sorted((item for item in contagens.items() if item[1] >= min_contagem),
+                   key=lambda item: (-item[1], item[0]))
+    return itens[:maximo] if maximo else itens
+
+
+# ---------------------------
+# Gravação
+# ---------------------------
+def _gravar_texto(caminho, linhas):
+    temporario = f"{caminho}.{os.getpid()}.tmp"
+    with open(temporario, "w", encoding="utf-8") as f:
+        f.writelines(linhas)
+    os.replace(temporario, caminho)
+
+
+def gravar_palavras(ranqueadas, caminho, formato="py", ordem=ORDEM_RANK, variavel="top_words"):
+    """
+    Grava [(palavra, contagem)] já ranqueadas: valor = posição (ORDEM_RANK) ou
+    contagem (ORDEM_SCORE). .py no formato de top_words.py / save_dict_to_file
+    de merge_two_dicts.py; .dicc/.sqlite por compilar_dicionario(_sqlite).
+    """
+    valores = {palavra: (posicao if ordem == ORDEM_RANK else contagem)
+               for posicao, (palavra, contagem) in enumerate(ranqueadas, start=1)}
+    if formato == "py":
+        _gravar_texto(caminho, [f"{variavel} = {{\n", *(f'    "{p}": {v},\n' for p, v in valores.items()), "}\n"])
+    elif formato == "txt":
+        _gravar_texto(caminho, (f"{p} {v}\n" for p, v in valores.items()))
+    elif formato == "dicc":
+        compilar_dicionario(valores, caminho, ordem)
+    elif formato == "sqlite":
+        compilar_dicionario_sqlite(valores, caminho, ordem)
+    else:
+        raise ValueError(f"Formato inválido: {formato!r} (use {', '.join(FORMATOS)})")
+
+
+def gravar_ngramas(ranqueados, caminho, n):
+    """'NGRAMA contagem' por linha, com o total de n-gramas no cabeçalho (comentário)."""
+    total = sum(contagem for _, contagem in ranqueados)
+    cabecalho = f"# {n}-gramas de letras (fronteira de palavra = '{SEPARADOR}'), total {total}\n"
+    _gravar_texto(caminho, [cabecalho, *(f"{g} {c}\n" for g, c in ranqueados)])
+
+
+def _ordens(texto):
+    if texto.strip() in ("", "0"):
+        return ()
+    return tuple(sorted({int(parte) for parte in texto.split(",")}))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Conta palavras e n-gramas de um corpus e grava tabelas ranqueadas")
+    parser.add_argument("origens", nargs="+", help="arquivos, pastas (não recursivo) ou padrões glob")
+    parser.add_argument("-o", "--saida", default="top_words_corpus", help="prefixo/arquivo de saída das palavras")
+    parser.add_argument("--formato", choices=FORMATOS, default="py", help="formato da tabela de palavras (padrão: py)")
+    parser.add_argument("--ordem", choices=(ORDEM_RANK, ORDEM_SCORE), default=ORDEM_RANK,
+                        help="valor gravado: posição no ranking ou contagem (padrão: rank)")
+    parser.add_argument("--variavel", default=None, help="nome do dict no .py (padrão: nome do arquivo de saída)")
+    parser.add_argument("--max-palavras", type=int, default=None, help="grava só as N palavras mais frequentes")
+    parser.add_argument("--min-contagem", type=int, default=1, help="descarta palavras com contagem menor")
+    parser.add_argument("--ngramas", default=",".join(map(str, ORDENS_PADRAO)),
+                        help="ordens dos n-gramas de letras, ex.: 1,2,3,4 (0 = nenhum)")
+    parser.add_argument("--processos", type=int, default=None, help="processos do map (padrão: nº de CPUs)")
+    parser.add_argument("--tamanho-pedaco", type=int, default=TAMANHO_PEDACO_MB, help="MB por pedaço do map")
+    args = parser.parse_args()
+
+    caminhos = sorted({c for origem in args.origens for c in listar_entradas(origem)})
+    if not caminhos:
+        print(f"[ERRO] Nenhum arquivo encontrado em {' '.join(args.origens)}")
+        sys.exit(1)
+    ordens = _ordens(args.ngramas)
+
+    base, extensao = os.path.splitext(args.saida)
+    if extensao.lstrip(".") != args.formato:
+        base = args.saida
+    caminho_palavras = f"{base}.{args.formato}"
+    variavel = args.variavel or os.path.basename(base)
+    if args.formato == "py" and (not variavel.isidentifier() or keyword.iskeyword(variavel)):
+        parser.error(f"'{variavel}' não é um nome de variável Python válido para o .py "
+                     "(use --variavel ou outro nome de saída)")
+    if os.path.dirname(base):
+        os.makedirs(os.path.dirname(base), exist_ok=True)
+
+    inicio = time.perf_counter()
+    palavras = contar_corpus(caminhos, args.processos, args.tamanho_pedaco << 20)
+    t_contagem = time.perf_counter() - inicio
+    megabytes = sum(os.path.getsize(c) for c in caminhos) / 1024 / 1024
+    print(f"[RESULT] {len(caminhos)} arquivos ({megabytes:.1f} MB): {sum(palavras.values())} palavras, "
+          f"{len(palavras)} distintas em {t_contagem:.2f}s ({megabytes / max(t_contagem, 1e-9):.1f} MB/s)")
+
+    ranqueadas = ranquear(palavras, args.min_contagem, args.max_palavras)
+    gravar_palavras(ranqueadas, caminho_palavras, args.formato, args.ordem, variavel)
+    print(f"[RESULT] {len(ranqueadas)} palavras -> {caminho_palavras} (ordem {args.ordem})")
+
+    for n, tabela in contar_ngramas(palavras, ordens).items():
+        caminho_ngramas = f"{base}_ngramas_{n}.txt"
+        ranqueados = ranquear(tabela)
+        gravar_ngramas(ranqueados, caminho_ngramas, n)
+        print(f"[RESULT] {len(ranqueados)} {n}-gramas -> {caminho_ngramas}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,338 @@
+# ================================================================
+# recozimento_simulado.py — Passo 10 como busca estocástica sobre a chave
+#
+# Contém funções para:
+#  - carregar um modelo de n-gramas de letras (padrão: quadrigramas) em
+#    log10 de probabilidade, a partir das tabelas "NGRAMA contagem" gravadas
+#    por ingerir_corpus.py (<saida>_ngramas_4.txt) ou derivado de contagens
+#    de palavras (ex.: o próprio dicionário), com a fronteira de palavra "_"
+#    igual à do ingerir_corpus (THE -> _THE_: _THE, THE_)
+#  - pontuar um texto claro pela soma do log10 dos seus n-gramas, sem
+#    depender de as palavras estarem no dicionário (palavras fora de
+#    top_words ainda contam pelas letras)
+#  - recozimento simulado (simulated annealing) sobre a chave: a cada passo
+#    troca as letras claras de duas letras cifradas (ou dá a uma letra
+#    cifrada uma letra clara ainda livre), aceita se a pontuação sobe ou,
+#    se cai, com probabilidade exp(delta / T); T cai linearmente até 0 em
+#    cada reinício e a melhor chave de todos os reinícios é a resposta
+#  - delta incremental: o texto vira a lista dos n-gramas cifrados
+#    distintos com a multiplicidade; cada n-grama guarda o índice do n-grama
+#    claro atual na tabela e, por letra cifrada, o peso posicional dela no
+#    índice. Uma troca só revisita os n-gramas que contêm as duas letras e
+#    calcula o índice novo com uma soma (índice + diferença x peso), sem
+#    decifrar o texto
+#
+# Símbolos do modelo: A-Z = 0..25 e "_" = 26; um n-grama ocupa a posição
+# s0*27^(n-1) + ... + s(n-1) de uma array('d') com 27^n valores (n-gramas
+# ausentes do corpus valem o piso log10(0.01 / total)).
+# ================================================================
+
+import math
+import random
+import time
+from array import array
+from collections import Counter
+
+from dicionario_compilado import ler_lista_texto
+from ingerir_corpus import SEPARADOR, contar_ngramas
+
+ORDEM_PADRAO = 4
+ITERACOES = 10_000
+REINICIOS = 8
+TEMPERATURA_INICIAL = 5.0
+# contagem atribuída à palavra de rank 1 quando o modelo vem do dicionário (de_ranking)
+ESCALA_ZIPF = 1000
+_SIMBOLOS = 27
+_FRONTEIRA = 26
+# letras claras na ordem de frequência do inglês: chave inicial sem mapa de partida
+_FREQUENCIA_INGLES = "etaoinshrdlcumwfgypbvkjxqz"
+
+
+def _simbolo(ch):
+    """0..25 para letras (qualquer caixa), 26 para a fronteira / qualquer outro caractere."""
+    codigo = ord(ch.upper()) - 65
+    return codigo if 0 <= codigo < 26 else _FRONTEIRA
+
+
+class ModeloNgramas:
+    """
+    Tabela log10(P(n-grama)) indexada pelos símbolos do n-grama.
+
+      ModeloNgramas(contagens)              -> {"THE_": 123, "_THE": 120, ...}
+      ModeloNgramas.de_arquivo(caminho)     -> tabela de ingerir_corpus.py
+      ModeloNgramas.de_palavras(palavras)   -> {palavra: peso}, n-gramas com fronteira "_"
+      ModeloNgramas.de_ranking(palavras)    -> palavras em ordem de rank, peso de Zipf (ESCALA_ZIPF // rank)
+    """
+
+    def __init__(self, contagens, n=None):
+        contagens = {g.upper(): int(c) for g, c in contagens.items() if int(c) > 0}
+        if not contagens:
+            raise ValueError("Modelo de n-gramas vazio")
+        if n is None:
+            n = len(next(iter(contagens)))
+        contagens = {g: c for g, c in contagens.items() if len(g) == n}
+        self.n = n
+        self.total = sum(contagens.values())
+        self.piso = math.log10(0.01 / self.total)
+        self.logprob = array("d", [self.piso]) * (_SIMBOLOS ** n)
+        for ngrama, contagem in contagens.items():
+            indice = 0
+            for ch in ngrama:
+                indice = indice * _SIMBOLOS + _simbolo(ch)
+            self.logprob[indice] = math.log10(contagem / self.total)
+        self.distintos = len(contagens)
+
+    @classmethod
+    def de_arquivo(cls, caminho):
+        """'NGRAMA contagem' por linha (cabeçalho '#' ignorado), como grava ingerir_corpus.gravar_ngramas."""
+        return cls(ler_lista_texto(caminho))
+
+    @classmethod
+    def de_palavras(cls, palavras, n=ORDEM_PADRAO):
+        return cls(contar_ngramas({p.upper(): c for p, c in palavras.items()}, (n,))[n], n)
+
+    @classmethod
+    def de_ranking(cls, palavras, n=ORDEM_PADRAO):
+        """Sem corpus: palavras do dicionário na ordem de rank viram contagens pela lei de Zipf (frequência ~ 1/rank)."""
+        return cls.de_palavras({p: max(1, ESCALA_ZIPF // rank) for rank, p in enumerate(palavras, start=1)}, n)
+
+    def pontuar(self, texto):
+        """log10 de probabilidade de um texto claro (n-gramas de cada palavra, com fronteira)."""
+        n, total = self.n, 0.0
+        for palavra in texto.split():
+            marcada = [_FRONTEIRA] + [_simbolo(ch) for ch in palavra] + [_FRONTEIRA]
+            for i in range(len(marcada) - n + 1):
+                indice = 0
+                for s in marcada[i:i + n]:
+                    indice = indice * _SIMBOLOS + s
+                total += self.logprob[indice]
+        return total
+
+
+class RecozimentoSimulado:
+    """
+    Recozimento simulado da chave sobre as palavras cifradas de palavras_pos.
+
+      modelo          -> ModeloNgramas
+      mapa_inicial    -> chave de partida {cifrada maiúscula: clara} (ex.: Passos 6-8);
+                         letras sem mapa recebem as letras livres por frequência
+      fixas           -> {cifrada: clara} que a busca não altera
+      iteracoes       -> trocas avaliadas por reinício
+      reinicios       -> o 1º parte de mapa_inicial; os outros, de uma chave embaralhada
+      semente         -> semente do random (reprodutível)
+
+    resolver() devolve o mapa {cifrada maiúscula: clara minúscula} da melhor
+    chave; estatisticas() traz avaliações, avaliações/s e a pontuação.
+    Letras minúsculas no texto já são claras e ficam fixas.
+    """
+
+    def __init__(self, palavras_pos, modelo, mapa_inicial=None, fixas=None,
+                 iteracoes=ITERACOES, reinicios=REINICIOS,
+                 temperatura_inicial=TEMPERATURA_INICIAL, semente=None):
+        self.modelo = modelo
+        self.iteracoes = iteracoes
+        self.reinicios = reinicios
+        self.temperatura_inicial = temperatura_inicial
+        self._rng = random.Random(semente)
+        fixas = {k.upper(): _simbolo(v) for k, v in (fixas or {}).items()}
+
+        ocorrencias = Counter(palavra for _pos, palavra in palavras_pos)
+        frequencia = Counter()
+        for palavra, vezes in ocorrencias.items():
+            for ch in palavra:
+                if "A" <= ch <= "Z" and ch not in fixas:
+                    frequencia[ch] += vezes
+        # variáveis: letras cifradas livres, da mais frequente para a menos
+        self.variaveis = [ch for ch, _ in frequencia.most_common()]
+        posicao = {ch: i for i, ch in enumerate(self.variaveis)}
+        usadas = set(fixas.values()) | {_simbolo(ch) for p in ocorrencias for ch in p if "a" <= ch <= "z"}
+        livres = [_simbolo(ch) for ch in _FREQUENCIA_INGLES if _simbolo(ch) not in usadas]
+        if len(livres) < len(self.variaveis):
+            raise ValueError("Mais letras cifradas livres do que letras claras disponíveis")
+        # casas extras (sem n-gramas) guardam as letras claras não usadas: trocar com uma
+        # delas = dar a letra livre à letra cifrada
+        self._casas = len(livres)
+        self._livres = livres
+
+        # n-gramas cifrados distintos: parte constante do índice + peso de cada variável
+        n = modelo.n
+        lugares = [_SIMBOLOS ** (n - 1 - k) for k in range(n)]
+        ngramas = Counter()
+        for palavra, vezes in ocorrencias.items():
+            marcada = [SEPARADOR] + list(palavra) + [SEPARADOR]
+            for i in range(len(marcada) - n + 1):
+                ngramas[tuple(marcada[i:i + n])] += vezes
+        self._multiplicidade = array("d")
+        self._constante = []
+        self._pesos = [[] for _ in range(self._casas)]  # casa -> [(id do n-grama, peso)]
+        for id_ngrama, (ngrama, vezes) in enumerate(ngramas.items()):
+            constante, pesos = 0, Counter()
+            for ch, lugar in zip(ngrama, lugares):
+                if ch in posicao:
+                    pesos[posicao[ch]] += lugar
+                else:
+                    constante += lugar * fixas.get(ch, _simbolo(ch))
+            self._multiplicidade.append(vezes)
+            self._constante.append(constante)
+            for casa, peso in pesos.items():
+                self._pesos[casa].append((id_ngrama, peso))
+        self.ngramas = len(ngramas)
+        self._fixas = fixas
+
+        chave = list(livres)
+        if mapa_inicial:
+            # letras do mapa de partida vão para as suas casas, as demais seguem a ordem de frequência
+            desejadas = {posicao[k.upper()]: _simbolo(v) for k, v in mapa_inicial.items() if k.upper() in posicao}
+            desejadas = {casa: s for casa, s in desejadas.items() if s in livres}
+            restantes = [s for s in livres if s not in set(desejadas.values())]
+            chave = [desejadas[casa] if casa in desejadas else restantes.pop(0) for casa in range(self._casas)]
+        self._chave_inicial = chave
+
+        self.avaliacoes = 0
+        self.aceitas = 0
+        self.segundos = 0.0
+        self.pontuacao = None
+        self.pontuacao_inicial = None
+        self._melhor_chave = list(chave)
+
+    # ---------------------------
+    # pontuação
+    # ---------------------------
+    def _indices(self, chave):
+        """Índice do n-grama claro de cada n-grama cifrado com a chave dada."""
+        indices = array("q", self._constante)
+        for casa, lista in enumerate(self._pesos):
+            letra = chave[casa]
+            for id_ngrama, peso in lista:
+                indices[id_ngrama] += peso * letra
+        return indices
+
+    def _pontuar(self, indices):
+        logprob = self.modelo.logprob
+        return sum(m * logprob[i] for m, i in zip(self._multiplicidade, indices))
+
+    def pontuar_mapa(self, mapa):
+        """Pontuação do texto com um mapa {cifrada: clara} (letras fora do mapa contam como fronteira)."""
+        chave = [_FRONTEIRA] * self._casas
+        for casa, ch in enumerate(self.variaveis):
+            if ch in mapa:
+                chave[casa] = _simbolo(mapa[ch])
+        return self._pontuar(self._indices(chave))
+
+    # ---------------------------
+    # busca
+    # ---------------------------
+    def _montar_pares(self):
+        """
+        pares[x][y] = ([(id, coeficiente)] dos n-gramas que aparecem 1 vez,
+                       [(id, coeficiente, multiplicidade)] dos repetidos)
+        dos n-gramas com a letra x ou y, coeficiente = peso de x - peso de y:
+        trocar as letras claras de x e y soma (clara de y - clara de x) x
+        coeficiente ao índice de cada um. Casas sem n-gramas (letras claras
+        livres) reaproveitam as listas de x.
+        """
+        variaveis = len(self.variaveis)
+        multiplicidade = self._multiplicidade
+
+        def separar(coeficientes):
+            unicos = [(i, c) for i, c in coeficientes if c and multiplicidade[i] == 1]
+            repetidos = [(i, c, multiplicidade[i]) for i, c in coeficientes if c and multiplicidade[i] != 1]
+            return unicos, repetidos
+
+        pares = []
+        for x in range(variaveis):
+            so_x = separar(self._pesos[x])
+            linha = []
+            for y in range(self._casas):
+                if y == x:
+                    linha.append(None)
+                elif y >= variaveis:
+                    linha.append(so_x)
+                elif y < x:
+                    unicos, repetidos = pares[y][x]
+                    linha.append(([(i, -c) for i, c in unicos], [(i, -c, m) for i, c, m in repetidos]))
+                else:
+                    coeficientes = dict(self._pesos[x])
+                    for id_ngrama, peso in self._pesos[y]:
+                        coeficientes[id_ngrama] = coeficientes.get(id_ngrama, 0) - peso
+                    linha.append(separar(coeficientes.items()))
+            pares.append(linha)
+        return pares
+
+    def _recozer(self, chave, pares, logprob):
+        """Um ciclo de T inicial a 0 a partir de `chave` (alterada no lugar); devolve (melhor pontuação, chave)."""
+        indices = self._indices(chave).tolist()
+        pontuacao = self._pontuar(indices)
+        melhor, melhor_chave = pontuacao, list(chave)
+        variaveis = len(self.variaveis)
+        casas = self._casas
+        aleatorio = self._rng.random
+        sortear = self._rng.randrange
+        exp = math.exp
+        t0 = self.temperatura_inicial
+        total = self.iteracoes
+        aceitas = 0
+        for passo in range(total):
+            x = sortear(variaveis)  # pelo menos uma das casas tem n-gramas
+            y = sortear(casas - 1)
+            if y >= x:
+                y += 1
+            d = chave[y] - chave[x]
+            unicos, repetidos = pares[x][y]
+            delta = 0.0
+            for id_ngrama, coeficiente in unicos:
+                antigo = indices[id_ngrama]
+                delta += logprob[antigo + d * coeficiente] - logprob[antigo]
+            for id_ngrama, coeficiente, vezes in repetidos:
+                antigo = indices[id_ngrama]
+                delta += vezes * (logprob[antigo + d * coeficiente] - logprob[antigo])
+            temperatura = t0 * (1.0 - passo / total)
+            if delta >= 0.0 or (temperatura > 0.0 and aleatorio() < exp(delta / temperatura)):
+                aceitas += 1
+                chave[x], chave[y] = chave[y], chave[x]
+                for id_ngrama, coeficiente in unicos:
+                    indices[id_ngrama] += d * coeficiente
+                for id_ngrama, coeficiente, _vezes in repetidos:
+                    indices[id_ngrama] += d * coeficiente
+                pontuacao += delta
+                if pontuacao > melhor:
+                    melhor, melhor_chave = pontuacao, list(chave)
+        self.avaliacoes += total
+        self.aceitas += aceitas
+        return melhor, melhor_chave
+
+    def resolver(self):
+        """Reinícios de recozimento; devolve o mapa {cifrada maiúscula: clara minúscula} da melhor chave."""
+        inicio = time.perf_counter()
+        self.pontuacao_inicial = self._pontuar(self._indices(self._chave_inicial))
+        self.pontuacao, self._melhor_chave = None, list(self._chave_inicial)
+        pares = self._montar_pares() if self.variaveis else None
+        logprob = self.modelo.logprob.tolist()  # lista: leitura sem criar um float novo a cada acesso
+        for reinicio in range(self.reinicios if pares else 0):
+            chave = list(self._chave_inicial)
+            if reinicio:
+                self._rng.shuffle(chave)
+            pontuacao, chave = self._recozer(chave, pares, logprob)
+            if self.pontuacao is None or pontuacao > self.pontuacao:
+                self.pontuacao, self._melhor_chave = pontuacao, chave
+        if self.pontuacao is None:
+            self.pontuacao = self.pontuacao_inicial
+        self.segundos = time.perf_counter() - inicio
+        return self.mapa()
+
+    def mapa(self):
+        mapa = {ch: chr(97 + self._melhor_chave[casa]) for casa, ch in enumerate(self.variaveis)}
+        mapa.update({ch: chr(97 + s) for ch, s in self._fixas.items()})
+        return mapa
+
+    def estatisticas(self):
+        return {
+            "variaveis": len(self.variaveis),
+            "ngramas": self.ngramas,
+            "avaliacoes": self.avaliacoes,
+            "aceitas": self.aceitas,
+            "segundos": self.segundos,
+            "avaliacoes_por_segundo": self.avaliacoes / self.segundos if self.segundos > 0 else 0.0,
+            "pontuacao": self.pontuacao,
+            "pontuacao_inicial": self.pontuacao_inicial,
+        }
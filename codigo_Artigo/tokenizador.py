@@ -0,0 +1,181 @@
+# ================================================================
+# tokenizador.py — tokenizador por spans compartilhado pelos pipelines
+#
+# Contém funções para:
+#  - varrer o texto decodificado uma única vez e devolver as colunas do
+#    Passo 4 de decrypt.py (início de cada linha, posições, palavras limpas,
+#    spans dos sufixos) com as regras de '--', apóstrofo, traço e acentos,
+#    limpando cada linha distinta uma vez (armazem_tokens.ArmazemTokens.de_texto)
+#  - a mesma varredura como registros Token(posicao, inicio, fim, palavra, sufixo)
+#  - limpar um token isolado com as mesmas regras (_limpar_token_por_regras e
+#    sufixos das palavras vindas do cache)
+#  - separar palavras e pontuação com as regras de tratamento_palavras
+#    (codigo_NoMuque), também em uma única varredura (findall)
+#
+# A remoção de acentos + filtro A-Za-z usa uma tabela de str.translate
+# (caractere -> letras ASCII de sua decomposição NFD), preenchida sob
+# demanda, em vez de unicodedata.normalize + re.sub por token.
+# ================================================================
+
+import re
+import string
+import unicodedata
+from array import array
+from bisect import bisect_left
+from collections import namedtuple
+from itertools import accumulate, compress
+
+# separadores de linha do Passo 4: " " (trocado por "\n") + os de str.splitlines(),
+# sem "\r" (removido antes da separação)
+SEPARADORES_TOKEN = " \n\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029"
+_SEP = re.escape(SEPARADORES_TOKEN)
+
+_RE_SEPARADOR = re.compile(f"[{_SEP}]")
+
+# linha não vazia = (cabeça sem símbolos)(resto a partir do primeiro '--', apóstrofo, crase ou traço)
+_RE_LINHA = re.compile(f"(?=[^{_SEP}])([^{_SEP}'\u2019`\\-]*)([^{_SEP}]*)")
+
+# letras aceitas logo após o símbolo para cortar o sufixo (mesma classe do Passo 4)
+_LETRAS_SUFIXO = frozenset(string.ascii_letters + "".join(chr(c) for c in range(0x00C0, 0x0180)))
+
+# tratamento_palavras (codigo_NoMuque): "--", pontuação isolada ou sequência sem espaço/pontuação
+PADRAO_PALAVRAS_PONTUACAO = re.compile(r'--|["\'&,\.\-`]|[^\s"\'&,\.\-`]+')
+
+Token = namedtuple("Token", "posicao inicio fim palavra sufixo")
+Token.__doc__ = """
+Registro do tokenizador:
+  posicao  -> índice da linha (mesmo de original_lines_by_pos)
+  inicio, fim -> span da linha original no texto
+  palavra  -> palavra limpa (só A-Za-z, sem acentos, não vazia)
+  sufixo   -> span (inicio, fim) do sufixo cortado ("'S", "-ING", "--Y") ou None
+"""
+
+Colunas = namedtuple("Colunas", "inicio_linha posicoes palavras sufixos")
+Colunas.__doc__ = """
+Resultado de varrer():
+  inicio_linha -> array('q') com o início de cada linha + sentinela final
+  posicoes     -> posições das linhas com palavra não vazia (range se forem todas)
+  palavras     -> palavra limpa de cada posição (linhas iguais compartilham a str)
+  sufixos      -> [(índice em posicoes, (inicio, fim))] dos sufixos cortados, em ordem
+"""
+
+
+class _TabelaLimpeza(dict):
+    """Código do caractere -> letras ASCII de sua decomposição NFD (None remove)."""
+
+    def __missing__(self, codigo):
+        letras = "".join(
+            c for c in unicodedata.normalize("NFD", chr(codigo))
+            if c in string.ascii_letters and not unicodedata.combining(c)
+        )
+        valor = letras or None
+        self[codigo] = valor
+        return valor
+
+
+_TABELA_LIMPEZA = _TabelaLimpeza()
+for _codigo in range(0x0180):
+    _TABELA_LIMPEZA[_codigo]
+
+
+def _cortar(cabeca, resto):
+    """
+    Aplica a regra do símbolo: retorna (texto_a_limpar, cortou_sufixo).
+    `resto` começa no primeiro símbolo ('--' tem prioridade sobre '-').
+    """
+    tam = 2 if resto.startswith("--") else 1
+    if len(resto) > tam and resto[tam] in _LETRAS_SUFIXO:
+        return cabeca, True
+    return cabeca + resto[tam:], False
+
+
+def limpar_token(token):
+    """
+    Mesmas regras de _limpar_token_por_regras (funcoes_decodificador):
+    retorna (token_limpo, suffix) para um token isolado.
+    """
+    if token.isalpha() and token.isascii():
+        return token, ""
+    token = token.strip()
+    if not token:
+        return "", ""
+    m = _RE_LINHA.match(token)
+    cabeca, resto = m.group(1, 2)
+    if not resto:
+        return cabeca.translate(_TABELA_LIMPEZA), ""
+    texto, cortou = _cortar(cabeca, resto)
+    return texto.translate(_TABELA_LIMPEZA), (resto if cortou else "")
+
+
+def _limpar_linha(linha):
+    """(palavra limpa, span do sufixo relativo à linha ou None) de uma linha sem separadores."""
+    if linha.isalpha() and linha.isascii():
+        return linha, None
+    m = _RE_LINHA.match(linha)
+    if m is None:
+        return "", None
+    cabeca, resto = m.group(1, 2)
+    sufixo = None
+    if resto:
+        cabeca, cortou = _cortar(cabeca, resto)
+        if cortou:
+            # o sufixo vai até o fim da linha sem o whitespace final (linha.strip())
+            sufixo = (m.start(2), m.start(2) + len(resto.rstrip()))
+    return cabeca.translate(_TABELA_LIMPEZA), sufixo
+
+
+def varrer(texto):
+    """
+    Passo 4 em colunas, com uma varredura de `texto` (sem "\r"):
+      - um split C pelos separadores; o início de cada linha sai da soma dos
+        comprimentos (um separador de um caractere entre linhas)
+      - cada linha distinta é limpa uma única vez (o texto cifrado repete
+        poucas palavras muitas vezes); as demais colunas saem de map/compress
+        sobre a tabela de linhas limpas, sem trabalho em Python por linha
+    Retorna Colunas(inicio_linha, posicoes, palavras, sufixos).
+    """
+    linhas = _RE_SEPARADOR.split(texto)
+    # splitlines() não gera linha vazia após o último separador
+    if linhas[-1] == "":
+        linhas.pop()
+    inicio_linha = array("q", accumulate(map((1).__add__, map(len, linhas)), initial=0))
+
+    limpas = {linha: _limpar_linha(linha) for linha in dict.fromkeys(linhas)}
+    palavra_de = {linha: palavra for linha, (palavra, _) in limpas.items()}
+    if all(palavra_de.values()):
+        posicoes = range(len(linhas))
+        palavras = list(map(palavra_de.__getitem__, linhas))
+    else:
+        com_palavra = list(map(bool, map(palavra_de.__getitem__, linhas)))
+        posicoes = list(compress(range(len(linhas)), com_palavra))
+        palavras = list(map(palavra_de.__getitem__, compress(linhas, com_palavra)))
+
+    sufixos = []
+    sufixo_de = {linha: sufixo for linha, (palavra, sufixo) in limpas.items() if palavra and sufixo}
+    if sufixo_de:
+        for posicao in compress(range(len(linhas)), map(sufixo_de.__contains__, linhas)):
+            ini, fim = sufixo_de[linhas[posicao]]
+            base = inicio_linha[posicao]
+            sufixos.append((bisect_left(posicoes, posicao), (base + ini, base + fim)))
+    return Colunas(inicio_linha, posicoes, palavras, sufixos)
+
+
+def tokenizar(texto):
+    """
+    Um Token por palavra não vazia de `texto` (sem "\r"), na ordem: visão por
+    registro das colunas de varrer(). Linhas sem palavra não geram registro,
+    mas contam na posição (como em associar_palavras_com_posicao).
+    """
+    colunas = varrer(texto)
+    inicio_linha = colunas.inicio_linha
+    sufixos = dict(colunas.sufixos)
+    for indice, (posicao, palavra) in enumerate(zip(colunas.posicoes, colunas.palavras)):
+        yield Token(posicao, inicio_linha[posicao], inicio_linha[posicao + 1] - 1, palavra, sufixos.get(indice))
+
+
+def palavras_pontuacao(texto):
+    """
+    Regras de tratamento_palavras (codigo_NoMuque): palavras e pontuação
+    ('--', '"', "'", '&', ',', '.', '-', '`') na ordem do texto (linhas do arquivo 3_).
+    """
+    return PADRAO_PALAVRAS_PONTUACAO.findall(texto)
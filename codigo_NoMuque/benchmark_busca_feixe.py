@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+benchmark_busca_feixe.py
+Ramos escritos à mão (map_1_letra A/I + map_2_letras AM/AN/AS/AT/IF/IN/IS/IT,
+cada um gravando mapeamentos/*_final_map.py e decifrados/*_decifrado.py, com
+analisar_texto_decifrado relendo cada cópia) contra a busca em feixe de
+busca_feixe.py, em memória, com larguras crescentes:
+  - tempo, arquivos gravados e letras na melhor chave
+  - % de tradução (medida de analisar_texto_decifrado) e % de letras em
+    palavras do banco na melhor chave
+  - tempo por nível da busca na largura padrão (níveis que ramificaram)
+
+Os ramos à mão rodam numa pasta temporária (nada é gravado nesta pasta).
+
+Uso:
+    python benchmark_busca_feixe.py                               -> mensagens/0_encoded.txt
+    python benchmark_busca_feixe.py encoded_EXIST.txt 1 5 20 100   (larguras)
+"""
+
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import time
+
+from busca_feixe import LARGURA_PADRAO, BuscaFeixe
+from funcoes_decodificador import analisar_texto_decifrado, gravar_matriz_ordenada, map_1_letra, map_2_letras
+from pipeline_nomuque import PipelineNoMuque
+
+LARGURAS_PADRAO = (1, 5, 20, 100)
+RAMOS = {"A": ("AM", "AN", "AS", "AT"), "I": ("IF", "IN", "IS", "IT")}
+NIVEIS_EXIBIDOS = 10
+
+
+def ramos_a_mao(matriz_ordenada):
+    """Executa os ramos de RAMOS como no fluxo manual; devolve (segundos, arquivos gravados, [(ramo, %)])."""
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as pasta:
+        fonte = os.path.join(pasta, "5_matriz.py")
+        gravar_matriz_ordenada(fonte, matriz_ordenada)
+        resultados = []
+        inicio = time.perf_counter()
+        try:
+            os.chdir(pasta)
+            with contextlib.redirect_stdout(io.StringIO()):
+                for letra, duplas in RAMOS.items():
+                    mapping, _map, decifrado = map_1_letra(fonte, letra)
+                    resultados.append((f"{letra}_", analisar_texto_decifrado(decifrado)))
+                    for dupla in duplas:
+                        _ext, _map, decifrado = map_2_letras(fonte, mapping, dupla, f"{letra}_")
+                        if decifrado is not None:
+                            resultados.append((f"{letra}_{dupla}", analisar_texto_decifrado(decifrado)))
+            tempo = time.perf_counter() - inicio
+            arquivos = sum(len(os.listdir(p)) for p in ("mapeamentos", "decifrados"))
+        finally:
+            os.chdir(cwd)
+    return tempo, arquivos, resultados
+
+
+def main():
+    arquivo = sys.argv[1] if len(sys.argv) > 1 else "mensagens/0_encoded.txt"
+    larguras = [int(n) for n in sys.argv[2:]] or list(LARGURAS_PADRAO)
+
+    matriz = PipelineNoMuque(arquivo).executar().matriz_ordenada
+
+    tempo, arquivos, resultados = ramos_a_mao(matriz)
+    ramo, pct = max(resultados, key=lambda item: item[1])
+    print(f"[RESULT] {arquivo}: {len(matriz)} palavras")
+    print(f"[RESULT] Ramos à mão: {len(resultados)} ramos em {tempo:.3f}s, {arquivos} arquivos gravados, "
+          f"melhor {ramo} com {pct:.1f}% de tradução (chaves de 1-2 letras)")
+
+    padrao = None
+    for largura in larguras:
+        busca = BuscaFeixe(matriz, largura=largura).executar()
+        melhor = busca.melhores(1)[0]
+        print(f"[RESULT] Feixe K={largura:4d}: {busca.segundos:6.3f}s, {len(busca.niveis)} níveis "
+              f"({len(busca.niveis_com_ramificacao())} ramificaram), {len(melhor.chave):2d} letras na chave, "
+              f"{busca.porcentagem_traducao(melhor):5.1f}% de tradução, "
+              f"{busca.porcentagem_acertos(melhor):5.1f}% em palavras do banco, 0 arquivos gravados")
+        if largura == LARGURA_PADRAO or padrao is None:
+            padrao = busca
+
+    niveis = sorted(padrao.niveis_com_ramificacao(), key=lambda n: -n.segundos)
+    print(f"[RESULT] Tempo por nível (K={padrao.largura}, {NIVEIS_EXIBIDOS} mais lentos dos que ramificaram):")
+    for nivel in niveis[:NIVEIS_EXIBIDOS]:
+        print(f"[RESULT]   nível {nivel.numero:3d} {nivel.palavra:>10s} (x{nivel.ocorrencias:2d}): "
+              f"{nivel.entrada:3d} -> {nivel.geradas:4d} chaves, {nivel.mantidas:3d} mantidas, "
+              f"{nivel.segundos * 1000:7.2f} ms")
+    restante = padrao.segundos - sum(n.segundos for n in niveis[:NIVEIS_EXIBIDOS])
+    print(f"[RESULT]   demais {len(padrao.niveis) - min(len(niveis), NIVEIS_EXIBIDOS)} níveis: {restante * 1000:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+benchmark_explorar_hipoteses.py
+Ramos do NoMuque (sementes de explorar_hipoteses.py) completados pela busca
+em feixe:
+  - um depois do outro, no processo atual (como no fluxo manual)
+  - em paralelo (explorar_hipoteses, um processo por ramo): tempo total
+    contra a soma dos ramos e o ramo mais lento
+  - em paralelo com --meta: quando o primeiro ramo atinge a cobertura, quantos
+    ramos foram cancelados e o tempo total
+O ganho do paralelo depende dos núcleos livres (impresso no início).
+
+Uso:
+    python benchmark_explorar_hipoteses.py                        -> mensagens/0_encoded.txt, meta 90
+    python benchmark_explorar_hipoteses.py encoded_EXIST.txt 85 4   (meta, processos)
+"""
+
+import contextlib
+import io
+import os
+import sys
+import time
+
+import explorar_hipoteses
+from explorar_hipoteses import explorar_hipoteses as explorar, explorar_ramo, sementes
+from pipeline_nomuque import PipelineNoMuque
+
+META_PADRAO = 90.0
+
+
+def main():
+    arquivo = sys.argv[1] if len(sys.argv) > 1 else "mensagens/0_encoded.txt"
+    meta = float(sys.argv[2]) if len(sys.argv) > 2 else META_PADRAO
+
+    matriz = PipelineNoMuque(arquivo).executar().matriz_ordenada
+    ramos = sementes(matriz)
+    processos = int(sys.argv[3]) if len(sys.argv) > 3 else len(ramos)
+    print(f"[RESULT] {arquivo}: {len(ramos)} ramos ({', '.join(ramos)}), "
+          f"{processos} processos, {os.cpu_count()} CPU(s)")
+
+    # sequencial: mesmo trabalho de cada processo do pool, no processo atual
+    explorar_hipoteses._iniciar_processo(matriz, None)
+    inicio = time.perf_counter()
+    sequencial = [explorar_ramo(ramo, semente) for ramo, semente in ramos.items()]
+    t_seq = time.perf_counter() - inicio
+    melhor = max(sequencial, key=lambda r: (r["palavras_banco_pct"], r["cobertura_pct"]))
+    print(f"[RESULT] Sequencial: {t_seq:.2f}s (ramo mais lento {max(r['tempo_s'] for r in sequencial):.2f}s), "
+          f"melhor {melhor['ramo']} com {melhor['cobertura_pct']:.2f}% de cobertura")
+
+    for rotulo, meta_rodada in (("sem meta", None), (f"meta {meta:g}%", meta)):
+        inicio = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            resumos = explorar(matriz, ramos, processos=processos, meta=meta_rodada)
+        t_par = time.perf_counter() - inicio
+        completos = [r for r in resumos if r["status"] == "ok"]
+        print(f"[RESULT] Paralelo {rotulo:>10s}: {t_par:.2f}s, {len(completos)} ramos completos, "
+              f"{len(resumos) - len(completos)} interrompidos, {len(ramos) - len(resumos)} cancelados antes de começar "
+              f"(soma dos ramos {sum(r['tempo_s'] for r in resumos):.2f}s, "
+              f"mais lento {max(r['tempo_s'] for r in resumos):.2f}s), "
+              f"melhor {resumos[0]['ramo']} com {resumos[0]['cobertura_pct']:.2f}%")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,232 @@
+"""
+busca_feixe.py
+Busca em feixe (beam search) sobre hipóteses de chave, no lugar dos ramos
+escritos à mão com map_1_letra / map_2_letras (A_, A_AM, ..., I_IT).
+
+Cada nível é uma palavra cifrada distinta, na ordem de ordenar_matriz (mais
+curtas primeiro; no mesmo comprimento, mais ocorrências primeiro). Cada chave
+parcial do feixe é expandida pelas palavras do banco compatíveis com ela
+(mesmo padrão isomorfo, letras já reveladas iguais, letra clara nova ainda
+livre) e pela opção de deixar a palavra fora do dicionário. Das chaves
+geradas ficam as `largura` melhores; as outras são descartadas em memória,
+sem gravar mapeamentos/ nem decifrados/.
+
+Pontuação (as medidas de analisar_texto_decifrado, calculadas sobre as
+contagens das palavras em vez de reler o texto decifrado):
+  acertos    -> letras do texto em palavras totalmente decifradas que estão
+                no banco (ocorrências x comprimento)
+  traduzidas -> letras do texto já decifradas (minúsculas)
+  perdidas   -> letras do texto em palavras que tinham candidata no banco e,
+                com esta chave, não têm mais (decifrada fora do banco ou sem
+                candidata compatível com as letras já fixadas)
+Ordem: maior acertos - PESO_PERDIDAS x perdidas, depois mais letras
+traduzidas. Só acertos favorece a chave que fixa mais letras agora, mesmo
+que estrague palavras longas adiante; perdidas antecipa esse custo. Ao
+estender uma chave só as palavras que contêm as letras cifradas novas são
+reavaliadas.
+
+Uso:
+    pipeline = PipelineNoMuque("mensagens/0_encoded.txt").executar()
+    busca = BuscaFeixe(pipeline.matriz_ordenada, largura=20).executar()
+    busca.melhores(3)              # [Hipotese(chave, acertos, ...), ...]
+    busca.niveis                   # tempo e tamanho do feixe por nível
+    busca.salvar_melhor("mapeamentos/feixe_final_map.py")
+"""
+
+import time
+from collections import Counter, defaultdict, namedtuple
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+from funcoes_decodificador import (
+    _load_top_words_indexado,
+    _write_map_file,
+    indice_top_words,
+)
+from top_words_banco_de_palavras import top_words_banco_de_palavras
+
+PONTUACOES = {'"', "'", '&', ',', '.', '-', '--', '`'}
+LARGURA_PADRAO = 20
+# peso das letras perdidas contra as reconhecidas: com 1 a chave vazia ganha (qualquer letra
+# fixada tira candidatas casuais de palavras longas do banco pequeno); com 1/4 o feixe
+# chega à melhor chave de 0_encoded.txt já com largura 1 (ver benchmark_busca_feixe.py)
+PESO_PERDIDAS = 0.25
+
+# chave: {letra cifrada: letra clara}, ambas maiúsculas (formato de final_map)
+# perdidas: letras do texto em palavras que tinham candidata e, com esta chave, não têm mais
+# (mortas: índices dessas palavras em self.palavras)
+Hipotese = namedtuple("Hipotese", "chave acertos perdidas traduzidas palavras_reconhecidas mortas")
+Nivel = namedtuple("Nivel", "numero palavra ocorrencias entrada geradas mantidas segundos melhor_acertos")
+
+
+class BuscaFeixe:
+    """
+    matriz          -> [[palavra, posicao], ...] (matriz_ordenada do PipelineNoMuque
+                       ou a variável `matriz` do arquivo 5_)
+    largura         -> chaves mantidas por nível (K)
+    top_words_path  -> banco alternativo (.py/.dicc/.sqlite, ver _load_top_words_indexado);
+                       None usa top_words_banco_de_palavras
+    mapa_inicial    -> chave de partida (ex.: {'Y': 'A'} para repetir o ramo A_)
+    peso_perdidas   -> quanto cada letra perdida desconta da pontuação
+    """
+
+    def __init__(self, matriz: List[list], largura: int = LARGURA_PADRAO,
+                 top_words_path: Optional[str] = None,
+                 mapa_inicial: Optional[Dict[str, str]] = None,
+                 peso_perdidas: float = PESO_PERDIDAS):
+        if largura < 1:
+            raise ValueError("largura deve ser >= 1")
+        self.largura = largura
+        self.peso_perdidas = peso_perdidas
+        if top_words_path is None:
+            top_words = {k.upper(): int(v) for k, v in top_words_banco_de_palavras.items()}
+            self._indice = indice_top_words(top_words)
+        else:
+            top_words, self._indice = _load_top_words_indexado(top_words_path)
+        # com .sqlite não há dicionário em memória: o `in` consulta o próprio índice
+        self._banco = top_words if top_words is not None else self._indice
+
+        contagem = Counter(str(item[0]) for item in matriz
+                           if item[0] is not None and str(item[0]) not in PONTUACOES)
+        self.palavras = [p for p in contagem if p.isalpha() and p.isupper()]  # ordem da matriz
+        self.ocorrencias = [contagem[p] for p in self.palavras]
+        self.total_letras = sum(len(p) * n for p, n in zip(self.palavras, self.ocorrencias))
+        self._freq_letra = Counter()
+        self._por_letra = defaultdict(list)  # letra cifrada -> índices das palavras que a contêm
+        for i, (palavra, n) in enumerate(zip(self.palavras, self.ocorrencias)):
+            for ch in palavra:
+                self._freq_letra[ch] += n
+            for ch in set(palavra):
+                self._por_letra[ch].append(i)
+
+        # palavras sem candidata nem com a chave vazia não contam como perdidas
+        self._sem_candidatas = {i for i, p in enumerate(self.palavras)
+                                if next(self._compativeis({}, (), p), None) is None}
+        chave = {k.upper(): v.upper() for k, v in (mapa_inicial or {}).items()}
+        self._inicial = self._estender(Hipotese({}, 0, 0, 0, 0, frozenset()), chave)
+        self.niveis: List[Nivel] = []
+        self.feixe: List[Hipotese] = [self._inicial]
+        self.segundos = 0.0
+        self.interrompida = False
+
+    # ---------------------------
+    # Pontuação incremental
+    # ---------------------------
+    def _compativeis(self, chave: Dict[str, str], reservadas, palavra: str):
+        """Gera {letra cifrada nova: letra clara} de cada palavra do banco compatível com `chave`, em ordem de score."""
+        exibicao = "".join(chave[ch].lower() if ch in chave else ch for ch in palavra)
+        conhecidas = {i: ch.upper() for i, ch in enumerate(exibicao) if ch.islower()}
+        for cand in self._indice.palavras(exibicao):
+            if not all(cand[i] == val for i, val in conhecidas.items()):
+                continue
+            novas = {}
+            for ch, alvo in zip(palavra, cand):
+                if ch not in chave:
+                    novas[ch] = alvo
+            # padrão isomorfo já garante letras claras novas distintas entre si
+            if not any(alvo in reservadas for alvo in novas.values()):
+                yield novas
+
+    def _estender(self, hipotese: Hipotese, novas: Dict[str, str]) -> Hipotese:
+        """Hipótese com as letras `novas` somadas à chave; só as palavras que as contêm são reavaliadas."""
+        chave = dict(hipotese.chave)
+        chave.update(novas)
+        reservadas = set(chave.values())
+        acertos, perdidas = hipotese.acertos, hipotese.perdidas
+        reconhecidas, mortas = hipotese.palavras_reconhecidas, hipotese.mortas
+        traduzidas = hipotese.traduzidas + sum(self._freq_letra[c] for c in novas)
+        afetadas = {i for c in novas for i in self._por_letra.get(c, ())}
+        for i in afetadas:
+            if i in mortas or i in self._sem_candidatas:
+                continue
+            palavra = self.palavras[i]
+            letras = self.ocorrencias[i] * len(palavra)
+            # a palavra tem letra nova: antes não estava completa, então não contava
+            if all(ch in chave for ch in palavra):
+                if "".join(chave[ch] for ch in palavra) in self._banco:
+                    acertos += letras
+                    reconhecidas += self.ocorrencias[i]
+                    continue
+            elif next(self._compativeis(chave, reservadas, palavra), None) is not None:
+                continue
+            perdidas += letras
+            mortas = mortas | {i}
+        return Hipotese(chave, acertos, perdidas, traduzidas, reconhecidas, mortas)
+
+    def _filhas(self, hipotese: Hipotese, palavra: str) -> List[Hipotese]:
+        """Expansões de `hipotese` pela palavra cifrada do nível (a 1ª é a própria, palavra fora do banco)."""
+        chave = hipotese.chave
+        if all(ch in chave for ch in palavra):
+            return [hipotese]
+        reservadas = set(chave.values())
+        return [hipotese] + [self._estender(hipotese, novas)
+                             for novas in self._compativeis(chave, reservadas, palavra)]
+
+    def _ordem(self, hipotese: Hipotese):
+        return (self.peso_perdidas * hipotese.perdidas - hipotese.acertos, -hipotese.traduzidas)
+
+    # ---------------------------
+    # Busca
+    # ---------------------------
+    def executar(self, parar: Optional[Callable[[], bool]] = None) -> "BuscaFeixe":
+        """
+        Percorre todos os níveis; o feixe final fica em self.feixe (melhor primeiro).
+        `parar` é consultado antes de cada nível (cancelamento cooperativo): se
+        devolver True a busca para ali, com self.interrompida = True e o feixe
+        do último nível concluído.
+        """
+        inicio_total = time.perf_counter()
+        feixe = [self._inicial]
+        self.niveis = []
+        self.interrompida = False
+        for numero, (palavra, ocorrencias) in enumerate(zip(self.palavras, self.ocorrencias), start=1):
+            if parar is not None and parar():
+                self.interrompida = True
+                break
+            inicio = time.perf_counter()
+            entrada = len(feixe)
+            vistas = set()
+            geradas = []
+            for hipotese in feixe:
+                for filha in self._filhas(hipotese, palavra):
+                    # a pontuação só depende da chave: chaves repetidas (caminhos diferentes) são a mesma hipótese
+                    assinatura = frozenset(filha.chave.items())
+                    if assinatura not in vistas:
+                        vistas.add(assinatura)
+                        geradas.append(filha)
+            geradas.sort(key=self._ordem)  # estável: empate fica com a ordem do banco
+            feixe = geradas[:self.largura]
+            self.niveis.append(Nivel(numero, palavra, ocorrencias, entrada, len(geradas), len(feixe),
+                                     time.perf_counter() - inicio, feixe[0].acertos))
+        self.feixe = feixe
+        self.segundos = time.perf_counter() - inicio_total
+        return self
+
+    # ---------------------------
+    # Resultados
+    # ---------------------------
+    def melhores(self, n: int = 1) -> List[Hipotese]:
+        """As n melhores chaves completas (após o último nível)."""
+        return self.feixe[:n]
+
+    def porcentagem_traducao(self, hipotese: Hipotese) -> float:
+        """Mesma medida que analisar_texto_decifrado devolve (letras minúsculas / letras)."""
+        return hipotese.traduzidas / self.total_letras * 100 if self.total_letras else 0.0
+
+    def porcentagem_acertos(self, hipotese: Hipotese) -> float:
+        return hipotese.acertos / self.total_letras * 100 if self.total_letras else 0.0
+
+    def decifrar(self, palavra: str, hipotese: Optional[Hipotese] = None) -> str:
+        """Palavra cifrada com a chave aplicada (letras decifradas em minúsculas)."""
+        chave = (hipotese or self.feixe[0]).chave
+        return "".join(chave[ch].lower() if ch in chave else ch for ch in palavra)
+
+    def niveis_com_ramificacao(self) -> List[Nivel]:
+        """Níveis em que o feixe gerou mais de uma chave (os demais só repassam as chaves)."""
+        return [nivel for nivel in self.niveis if nivel.geradas > nivel.entrada]
+
+    def salvar_melhor(self, caminho="mapeamentos/feixe_final_map.py") -> Path:
+        """Grava só a melhor chave, no formato de mapeamentos/*_final_map.py."""
+        caminho = Path(caminho)
+        _write_map_file(dict(sorted(self.feixe[0].chave.items())), caminho)
+        return caminho
@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+explorar_hipoteses.py
+Explora em paralelo os ramos do fluxo NoMuque (A_, A_AM, A_AN, ..., I_IT):
+cada ramo é uma chave semente (a palavra de 1 letra como A ou I e, nos ramos
+de 2 letras, a 2ª letra da primeira palavra de 2 letras que começa por ela,
+como em map_1_letra / map_2_letras) entregue a um processo do pool
+(ProcessPoolExecutor). O processo completa a chave com a busca em feixe
+(busca_feixe.BuscaFeixe com mapa_inicial = semente) e devolve a chave e a
+cobertura, sem gravar mapeamentos/ nem decifrados/.
+
+Cancelamento cooperativo: quando um ramo termina com cobertura (% de letras
+traduzidas, a medida de analisar_texto_decifrado) >= --meta, o processo
+principal marca um multiprocessing.Event compartilhado com o pool e cancela
+os ramos que ainda não começaram; os que estão rodando consultam o evento
+antes de cada nível do feixe e param ali (status "cancelado", chave parcial).
+Sem --meta todos os ramos vão até o fim.
+
+Com um processo por ramo, o tempo total fica perto do tempo do ramo mais lento.
+
+Uso:
+    python explorar_hipoteses.py                                   -> mensagens/0_encoded.txt
+    python explorar_hipoteses.py encoded_EXIST.txt --processos 4 --largura 20 --meta 95
+    python explorar_hipoteses.py mensagens/0_encoded.txt --salvar mapeamentos/hipoteses_final_map.py
+"""
+
+import argparse
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Dict, List, Optional
+
+from busca_feixe import LARGURA_PADRAO, PONTUACOES, BuscaFeixe
+from funcoes_decodificador import _write_map_file
+from pipeline_nomuque import PipelineNoMuque
+
+# ramos do fluxo manual: letra da palavra de 1 letra -> palavras de 2 letras testadas
+RAMOS = {"A": ("AM", "AN", "AS", "AT"), "I": ("IF", "IN", "IS", "IT")}
+
+# estado de cada processo do pool (preenchido por _iniciar_processo)
+_MATRIZ = None
+_PARAR = None
+
+
+def sementes(matriz: List[list], ramos: Dict[str, tuple] = RAMOS) -> Dict[str, Dict[str, str]]:
+    """
+    Chaves semente dos ramos, na ordem de `ramos`: {"A_": {'Y': 'A'}, "A_AM": {'Y': 'A', 'L': 'M'}, ...}.
+    Mesmas escolhas de map_1_letra / map_2_letras sobre a matriz ordenada: a
+    primeira palavra de 1 letra e a primeira de 2 letras que começa por ela.
+    Ramos sem essas palavras (ou com a 2ª letra repetindo a 1ª) ficam de fora.
+    """
+    palavras = [str(item[0]) for item in matriz if item[0] is not None and str(item[0]) not in PONTUACOES]
+    primeira = next((p for p in palavras if len(p) == 1 and p.isalpha()), None)
+    if primeira is None:
+        return {}
+    dupla = next((p for p in palavras if len(p) == 2 and p[0] == primeira and p[1] != primeira), None)
+
+    resultado = {}
+    for letra, duplas in ramos.items():
+        resultado[f"{letra}_"] = {primeira: letra}
+        if dupla is None:
+            continue
+        for alvo in duplas:
+            if alvo[1] != letra:
+                resultado[f"{letra}_{alvo}"] = {primeira: letra, dupla[1]: alvo[1]}
+    return resultado
+
+
+def _iniciar_processo(matriz, parar):
+    global _MATRIZ, _PARAR
+    _MATRIZ = matriz
+    _PARAR = parar
+
+
+def explorar_ramo(ramo: str, semente: Dict[str, str], largura: int = LARGURA_PADRAO) -> dict:
+    """Completa a chave semente com a busca em feixe (no processo do pool); devolve o resumo do ramo."""
+    inicio = time.perf_counter()
+    busca = BuscaFeixe(_MATRIZ, largura=largura, mapa_inicial=semente)
+    busca.executar(parar=_PARAR.is_set if _PARAR is not None else None)
+    melhor = busca.melhores(1)[0]
+    return {
+        "ramo": ramo,
+        "status": "cancelado" if busca.interrompida else "ok",
+        "semente": semente,
+        "chave": dict(sorted(melhor.chave.items())),
+        "cobertura_pct": round(busca.porcentagem_traducao(melhor), 2),
+        "palavras_banco_pct": round(busca.porcentagem_acertos(melhor), 2),
+        "niveis": len(busca.niveis),
+        "tempo_s": round(time.perf_counter() - inicio, 3),
+    }
+
+
+def explorar_hipoteses(matriz: List[list], ramos: Optional[Dict[str, Dict[str, str]]] = None,
+                       processos: Optional[int] = None, largura: int = LARGURA_PADRAO,
+                       meta: Optional[float] = None) -> List[dict]:
+    """
+    Roda os ramos (padrão: sementes(matriz)) em paralelo e devolve os resumos
+    dos ramos que rodaram, do melhor para o pior (letras em palavras do banco,
+    depois cobertura). Ramos cancelados antes de começar não aparecem.
+    """
+    if ramos is None:
+        ramos = sementes(matriz)
+    parar = multiprocessing.Event()
+    resumos = []
+    with ProcessPoolExecutor(max_workers=processos, initializer=_iniciar_processo,
+                             initargs=(matriz, parar)) as executor:
+        futuros = [executor.submit(explorar_ramo, ramo, semente, largura) for ramo, semente in ramos.items()]
+        for futuro in as_completed(futuros):
+            if futuro.cancelled():
+                continue
+            r = futuro.result()
+            resumos.append(r)
+            print(f"[HIPOTESES] {r['ramo']}: {r['status']} em {r['tempo_s']:.2f}s, "
+                  f"cobertura {r['cobertura_pct']:.2f}%")
+            if meta is not None and r["status"] == "ok" and r["cobertura_pct"] >= meta and not parar.is_set():
+                parar.set()
+                for pendente in futuros:
+                    pendente.cancel()
+    resumos.sort(key=lambda r: (r["status"] != "ok", -r["palavras_banco_pct"], -r["cobertura_pct"]))
+    return resumos
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Explora os ramos A_/I_ do NoMuque em paralelo")
+    parser.add_argument("arquivo", nargs="?", default="mensagens/0_encoded.txt", help="arquivo cifrado")
+    parser.add_argument("--processos", type=int, default=None, help="processos paralelos (padrão: nº de CPUs)")
+    parser.add_argument("--largura", type=int, default=LARGURA_PADRAO, help="chaves mantidas por nível do feixe")
+    parser.add_argument("--meta", type=float, default=None,
+                        help="cobertura (%% de letras traduzidas) que encerra a exploração (padrão: todos os ramos)")
+    parser.add_argument("--salvar", default=None, help="grava a melhor chave neste arquivo (formato final_map)")
+    args = parser.parse_args()
+
+    matriz = PipelineNoMuque(args.arquivo).executar().matriz_ordenada
+    ramos = sementes(matriz)
+    if not ramos:
+        print(f"[HIPOTESES] Nenhuma palavra de 1 letra em {args.arquivo}: sem ramos para explorar")
+        return
+
+    inicio = time.perf_counter()
+    resumos = explorar_hipoteses(matriz, ramos, args.processos, args.largura, args.meta)
+    tempo_total = time.perf_counter() - inicio
+
+    print(f"\n[RESULT] {len(resumos)}/{len(ramos)} ramos em {tempo_total:.2f}s "
+          f"(soma dos ramos: {sum(r['tempo_s'] for r in resumos):.2f}s, "
+          f"mais lento: {max(r['tempo_s'] for r in resumos):.2f}s)")
+    for r in resumos:
+        print(f"[RESULT] {r['ramo']:5s} {r['status']:9s}: {len(r['chave']):2d} letras, "
+              f"cobertura {r['cobertura_pct']:6.2f}%, palavras do banco {r['palavras_banco_pct']:6.2f}%, "
+              f"{r['tempo_s']:.2f}s")
+    if args.salvar:
+        _write_map_file(resumos[0]["chave"], args.salvar)
+        print(f"[RESULT] Melhor chave ({resumos[0]['ramo']}) salva em {args.salvar}")
+
+
+if __name__ == "__main__":
+    main()
@@ -17,6 +17,7 @@ from top_words_banco_de_palavras import top_words_banco_de_palavras  # Importa o
 
 
 
+import sys
 from pathlib import Path
 from importlib.machinery import SourceFileLoader
 
@@ -25,6 +26,27 @@ import importlib.util
 from collections import Counter, defaultdict
 from typing import Dict, Tuple, List, Optional
 
+# módulos compartilhados com o pipeline do artigo (../codigo_Artigo)
+_PASTA_ARTIGO = str(Path(__file__).resolve().parent.parent / "codigo_Artigo")
+if _PASTA_ARTIGO not in sys.path:
+    sys.path.append(_PASTA_ARTIGO)
+
+from entrada_binaria import (
+    grupos_em_fluxo,
+    janelas_mmap,
+    valores_de_janela,
+    ler_valores_formato,
+    PADRAO_GRUPOS_SEM_ESPACO,
+)
+from tokenizador import palavras_pontuacao
+from indice_isomorfos import IndiceIsomorfos
+from dicionario_compilado import EXTENSAO as EXTENSAO_DICIONARIO, ORDEM_SCORE, DicionarioCompilado
+from dicionario_sqlite import EXTENSAO as EXTENSAO_SQLITE, DicionarioSQLite
+
+# busca de melhor palavra só entre palavras com o mesmo padrão de repetição (LIYL ~ THAT)
+EXIGIR_PADRAO_ISOMORFO = True
+_INDICES_TOP_WORDS = {}
+
 
 
 
@@ -62,9 +84,47 @@ def _load_top_words(path: str) -> Dict[str,int]:
         raise ValueError("O arquivo top_words_banco_de_palavras.py não contém um dicionário válido chamado 'top_words_banco_de_palavras'.")
     return {k.upper(): int(v) for k, v in tbl.items()}
 
-def _best_candidate_for_token_strict_local(token_display: str, top_words: Dict[str,int]) -> Optional[str]:
+def indice_top_words(top_words: Dict[str,int]) -> IndiceIsomorfos:
+    """
+    Índice por padrão isomorfo com as palavras em ordem de score decrescente
+    (empates na ordem do dicionário, como no sort das buscas).
+    """
+    ranqueadas = sorted(top_words.items(), key=lambda item: -item[1])
+    return IndiceIsomorfos(ranqueadas, exigir_isomorfo=EXIGIR_PADRAO_ISOMORFO)
+
+def _load_top_words_indexado(path: str) -> Tuple[Optional[Dict[str,int]], IndiceIsomorfos]:
+    """
+    _load_top_words + índice, montados uma vez por arquivo (refeitos se o arquivo mudar).
+    Um .sqlite (compilar_dicionario.py --formato sqlite --ordem score) ou um .dicc
+    (compilar_dicionario.py --ordem score, aberto com mmap) não é carregado: o
+    próprio DicionarioSQLite/DicionarioCompilado faz o papel do índice e top_words é None;
+    um arquivo compilado na ordem rank é recusado (ValueError).
+    """
+    p = Path(path).resolve()
+    chave = (str(p), p.stat().st_mtime_ns) if p.exists() else None
+    if chave not in _INDICES_TOP_WORDS:
+        if p.suffix == EXTENSAO_SQLITE:
+            indice = DicionarioSQLite(p, exigir_isomorfo=EXIGIR_PADRAO_ISOMORFO, maiusculas=True, ordem=ORDEM_SCORE)
+            _INDICES_TOP_WORDS[chave] = (None, indice)
+        elif p.suffix == EXTENSAO_DICIONARIO:
+            indice = DicionarioCompilado(p, exigir_isomorfo=EXIGIR_PADRAO_ISOMORFO, maiusculas=True, ordem=ORDEM_SCORE)
+            _INDICES_TOP_WORDS[chave] = (None, indice)
+        else:
+            top_words = _load_top_words(path)
+            _INDICES_TOP_WORDS[chave] = (top_words, indice_top_words(top_words))
+    return _INDICES_TOP_WORDS[chave]
+
+def _best_candidate_for_token_strict_local(token_display: str, top_words: Optional[Dict[str,int]],
+                                           indice: Optional[IndiceIsomorfos] = None) -> Optional[str]:
+    # `indice`: IndiceIsomorfos, DicionarioSQLite ou DicionarioCompilado (com eles, top_words pode ser None)
     L = len(token_display)
     known = {i: ch.upper() for i, ch in enumerate(token_display) if ch.islower()}
+    if indice is not None:
+        # candidatas já em ordem de score: a primeira compatível é a melhor
+        for cand in indice.palavras(token_display):
+            if all(cand[i] == val for i, val in known.items()):
+                return cand
+        return None
     candidates = [w for w in top_words.keys() if len(w) == L]
     if not candidates:
         return None
@@ -98,19 +158,8 @@ def subloop_action_find_best_word(mapping_ext: Dict[str,str],
     Retorna lista de tuples (token_display, length, mapped_count, total, pct, best_or_None)
     e imprime linhas compactas.
     """
-    # carrega dicionário
-    p = Path(top_words_path)
-    if not p.exists():
-        raise FileNotFoundError(f"Arquivo de top words não encontrado: {top_words_path}")
-
-    spec = importlib.util.spec_from_file_location("top_words_mod", str(p))
-    mod = importlib.util.module_from_spec(spec)
-    spec.loader.exec_module(mod)
-
-    top_words = getattr(mod, "top_words_banco_de_palavras", None)
-    if not isinstance(top_words, dict):
-        raise ValueError("O arquivo top_words_banco_de_palavras.py não contém um dicionário válido chamado 'top_words_banco_de_palavras'.")
-    top_words = {k.upper(): int(v) for k, v in top_words.items()}
+    # carrega dicionário (e o índice por padrão, montado uma vez por arquivo)
+    top_words, indice = _load_top_words_indexado(top_words_path)
 
     # obter resultados sem prints extras (todas as ocorrências)
     results = analyze_by_decreasing_lengths(fonte, mapping_ext, min_len=1, print_report=False)
@@ -128,29 +177,14 @@ def subloop_action_find_best_word(mapping_ext: Dict[str,str],
         if pct == 0.0:
             return None
 
-        L = len(token_display)
         known = {i: ch.upper() for i, ch in enumerate(token_display) if ch.islower()}
-        candidates = [w for w in top_words.keys() if len(w) == L]
-        if not candidates:
-            return None
-
-        compat = []
-        for cand in candidates:
+        # candidatas do índice já em ordem de score: a primeira compatível é a melhor
+        for cand in indice.palavras(token_display):
             if cand in used_words:
                 continue
-            ok = True
-            for i, val in known.items():
-                if cand[i] != val:
-                    ok = False
-                    break
-            if ok:
-                compat.append(cand)
-
-        if not compat:
-            return None
-
-        compat.sort(key=lambda w: -top_words.get(w, 0))
-        return compat[0]
+            if all(cand[i] == val for i, val in known.items()):
+                return cand
+        return None
 
     output = []
     # itera nas ocorrências já ordenadas (cada ocorrência independente)
@@ -705,6 +739,16 @@ def _to_int_safe(v):
     except Exception:
         return float('inf')
 
+def gravar_matriz_ordenada(caminho_saida, ordenada) -> None:
+    """Grava a matriz ordenada no formato do arquivo 5_."""
+    with open(caminho_saida, "w", encoding="utf-8") as f:
+        f.write("matriz = [\n")
+        for item in ordenada:
+            palavra, numero = item
+            f.write(f'    ["{palavra}", {numero}],\n')
+        f.write("]\n")
+
+
 def ordenar_matriz(matriz_ou_arquivo):
     """
     Ordena e salva automaticamente com prefixo '5_'.
@@ -797,12 +841,7 @@ def ordenar_matriz(matriz_ou_arquivo):
     if isinstance(matriz_ou_arquivo, (str, Path)):
         nome_arquivo = Path(matriz_ou_arquivo)
         novo_nome = nome_arquivo.parent / f"5_{nome_arquivo.name}"
-        with open(novo_nome, "w", encoding="utf-8") as f:
-            f.write("matriz = [\n")
-            for item in ordenada:
-                palavra, numero = item
-                f.write(f'    ["{palavra}", {numero}],\n')
-            f.write("]\n")
+        gravar_matriz_ordenada(novo_nome, ordenada)
        # print(f"✅ Matriz ordenada salva em: {novo_nome}")
 
     return ordenada
@@ -831,6 +870,24 @@ def ordenar_matriz(matriz_ou_arquivo):
 
 
 
+
+
+def matriz_palavras_posicoes(linhas: List[str]) -> List[list]:
+    """Núcleo de criar_listas_palavras_posicoes: [[palavra, posicao], ...] com posição a partir de 1."""
+    return [[palavra, idx] for idx, palavra in enumerate(linhas, start=1)]
+
+
+def gravar_matriz_palavras_posicoes(caminho_saida: str, matriz: List[list]) -> None:
+    """Grava a matriz no formato do arquivo 4_ (aspas duplas escapadas)."""
+    # Gera o conteúdo com matriz ["palavra", posicao]
+    partes = ["matriz = [\n"]
+    for palavra, idx in matriz:
+        palavra_escapada = palavra.replace('"', '\\"')
+        partes.append(f'    ["{palavra_escapada}", {idx}],\n')
+    partes.append("]\n")
+
+    with open(caminho_saida, "w", encoding="utf-8") as f:
+        f.write("".join(partes))
 
 
 def criar_listas_palavras_posicoes(caminho_arquivo: str) -> str:
@@ -860,16 +917,8 @@ def criar_listas_palavras_posicoes(caminho_arquivo: str) -> str:
     with open(caminho_arquivo, "r", encoding="utf-8") as f:
         linhas = [linha.strip() for linha in f if linha.strip()]
 
-    # Gera o conteúdo com matriz ["palavra", posicao]
-    conteudo = "matriz = [\n"
-    for idx, palavra in enumerate(linhas, start=1):
-        palavra_escapada = palavra.replace('"', '\\"')
-        conteudo += f'    ["{palavra_escapada}", {idx}],\n'
-    conteudo += "]\n"
-
     # Salva o arquivo gerado
-    with open(caminho_saida, "w", encoding="utf-8") as f:
-        f.write(conteudo)
+    gravar_matriz_palavras_posicoes(caminho_saida, matriz_palavras_posicoes(linhas))
 
     if DEBUG:
         print(f"Arquivo gerado: {caminho_saida}")
@@ -885,26 +934,66 @@ def criar_listas_palavras_posicoes(caminho_arquivo: str) -> str:
 
 
 
-def decodificar_binario_para_ascii(caminho_arquivo: str, compress_whitespace: bool = True) -> tuple[str, str]:
-    """
-    Processa um arquivo binário e gera dois arquivos numerados sequencialmente:
-      1_<arquivo>_em_linhas.txt → linhas de 8 bits
-      2_1_<arquivo>_em_linhas.txt → texto ASCII (com espaços trocados por quebras de linha)
+def _binarios_para_ascii(linhas_processadas: List[str]) -> str:
+    """Converte linhas de 8 bits em caracteres (chr(int(b, 2))), ignorando linhas inválidas."""
+    ascii_chars = []
+    for binario in linhas_processadas:
+        try:
+            ascii_chars.append(chr(int(binario, 2)))
+        except ValueError:
+            if DEBUG:
+                print(f"Linha inválida ignorada: {binario}")
+    return "".join(ascii_chars)
 
-    Parâmetros:
-        caminho_arquivo (str): caminho do arquivo de entrada (ex: "mensagens/0_encoded.txt")
-        compress_whitespace (bool): se True, converte múltiplos espaços/tabs em uma única quebra de linha.
 
-    Retorna:
-        (arquivo_em_linhas, arquivo_ascii): caminhos completos dos arquivos gerados.
+# valor do byte -> linha de 8 bits (mesmo resultado de zfill(8) em um grupo binário de até 8 bits)
+_LINHAS_8BITS = [format(i, "08b") for i in range(256)]
+
+
+def _grupos_mmap_em_linhas(caminho_arquivo: str):
     """
-    # Extrai pasta e nome base
-    pasta, nome_arquivo = os.path.split(caminho_arquivo)
-    base, ext = os.path.splitext(nome_arquivo)
+    Gera (linhas_processadas, ascii) por janela do arquivo mapeado com mmap.
+    Janelas só com grupos de até 8 bits usam os bytes crus direto; as demais
+    seguem a regra de texto (\S+, zfill(8), linhas inválidas ignoradas).
+    """
+    for janela, largura_campo in janelas_mmap(caminho_arquivo):
+        valores = valores_de_janela(janela, largura_campo)
+        if valores is None:
+            grupos = PADRAO_GRUPOS_SEM_ESPACO.findall(str(janela, "utf-8"))
+            linhas_processadas = [b.zfill(8) if len(b) < 8 else b for b in grupos]
+            yield linhas_processadas, _binarios_para_ascii(linhas_processadas)
+        else:
+            yield list(map(_LINHAS_8BITS.__getitem__, valores)), valores.decode("latin-1")
 
-    # Nomes de saída
-    arquivo_em_linhas = os.path.join(pasta, f"1_{base}_em_linhas{ext}")
-    arquivo_ascii = os.path.join(pasta, f"2_1_{base}_em_linhas{ext}")
+
+def partes_binario_para_ascii(caminho_arquivo: str, compress_whitespace: bool = True,
+                              tamanho_bloco: Optional[int] = None, usar_mmap: bool = False,
+                              formato: str = "bits", largura_grupo: Optional[int] = None):
+    """
+    Núcleo de decodificar_binario_para_ascii sem gravar arquivos: gera partes
+    (linhas_processadas, ascii) — linhas de 8 bits e o texto ASCII correspondente
+    (ainda com espaços). O leitor "texto" gera uma única parte; os demais, uma por bloco.
+    Mesmos parâmetros de decodificar_binario_para_ascii.
+    """
+    if (formato != "bits" or tamanho_bloco or usar_mmap) and not compress_whitespace:
+        raise ValueError("Leitura em fluxo/formato compacto requer compress_whitespace=True")
+    return _gerar_partes_binario_para_ascii(caminho_arquivo, compress_whitespace, tamanho_bloco,
+                                            usar_mmap, formato, largura_grupo)
+
+
+def _gerar_partes_binario_para_ascii(caminho_arquivo, compress_whitespace, tamanho_bloco,
+                                     usar_mmap, formato, largura_grupo):
+    if formato != "bits" or tamanho_bloco or usar_mmap:
+        if formato != "bits":
+            valores = ler_valores_formato(caminho_arquivo, formato, largura_grupo)
+            yield list(map(_LINHAS_8BITS.__getitem__, valores)), valores.decode("latin-1")
+        elif usar_mmap:
+            yield from _grupos_mmap_em_linhas(caminho_arquivo)
+        else:
+            for grupos in grupos_em_fluxo(caminho_arquivo, tamanho_bloco, PADRAO_GRUPOS_SEM_ESPACO):
+                linhas_processadas = [b.zfill(8) if len(b) < 8 else b for b in grupos]
+                yield linhas_processadas, _binarios_para_ascii(linhas_processadas)
+        return
 
     # Lê o conteúdo original
     with open(caminho_arquivo, "r", encoding="utf-8") as f:
@@ -916,7 +1005,7 @@ def decodificar_binario_para_ascii(caminho_arquivo: str, compress_whitespace: bo
     else:
         data_linhas = data.replace(" ", "\n")
 
-    # === 1ª ETAPA: gerar arquivo com bytes (8 bits por linha) ===
+    # === 1ª ETAPA: bytes (8 bits por linha) ===
     linhas_processadas = []
     for linha in data_linhas.splitlines():
         binario = linha.strip()
@@ -926,25 +1015,57 @@ def decodificar_binario_para_ascii(caminho_arquivo: str, compress_whitespace: bo
             binario = binario.zfill(8)
         linhas_processadas.append(binario)
 
-    # Grava o arquivo 1_..._em_linhas.txt
-    with open(arquivo_em_linhas, "w", encoding="utf-8") as f:
-        f.write("\n".join(linhas_processadas))
-
     # === 2ª ETAPA: converter para ASCII ===
-    ascii_chars = []
-    for binario in linhas_processadas:
-        try:
-            ascii_chars.append(chr(int(binario, 2)))
-        except ValueError:
-            if DEBUG:
-                print(f"Linha inválida ignorada: {binario}")
+    yield linhas_processadas, _binarios_para_ascii(linhas_processadas)
+
+
+def decodificar_binario_para_ascii(caminho_arquivo: str, compress_whitespace: bool = True,
+                                   tamanho_bloco: Optional[int] = None,
+                                   usar_mmap: bool = False, formato: str = "bits",
+                                   largura_grupo: Optional[int] = None) -> tuple[str, str]:
+    """
+    Processa um arquivo binário e gera dois arquivos numerados sequencialmente:
+      1_<arquivo>_em_linhas.txt → linhas de 8 bits
+      2_1_<arquivo>_em_linhas.txt → texto ASCII (com espaços trocados por quebras de linha)
+
+    Parâmetros:
+        caminho_arquivo (str): caminho do arquivo de entrada (ex: "mensagens/0_encoded.txt")
+        compress_whitespace (bool): se True, converte múltiplos espaços/tabs em uma única quebra de linha.
+        tamanho_bloco (int | None): se informado, lê o arquivo em blocos desse tamanho
+            (entrada_binaria.grupos_em_fluxo) e grava as saídas incrementalmente, sem
+            manter o arquivo nem a cópia `data_linhas` em memória. Requer compress_whitespace=True.
+        usar_mmap (bool): se True, mapeia o arquivo com mmap e converte os bytes crus
+            0/1 por janelas (entrada_binaria.janelas_mmap), sem criar uma str por grupo.
+            Também grava incrementalmente e requer compress_whitespace=True.
+        formato (str): "bits" (grupos separados por whitespace) ou um formato compacto de
+            entrada_binaria.ler_valores_formato: "bruto", "hex", "base64", "bits_continuos".
+        largura_grupo (int | None): bits por caractere em "bits_continuos" (None = inferida).
+
+    Retorna:
+        (arquivo_em_linhas, arquivo_ascii): caminhos completos dos arquivos gerados.
+    """
+    # Extrai pasta e nome base
+    pasta, nome_arquivo = os.path.split(caminho_arquivo)
+    base, ext = os.path.splitext(nome_arquivo)
 
-    # Junta os caracteres ASCII e substitui espaços por quebras de linha
-    ascii_texto = "".join(ascii_chars).replace(" ", "\n")
+    # Nomes de saída
+    arquivo_em_linhas = os.path.join(pasta, f"1_{base}_em_linhas{ext}")
+    arquivo_ascii = os.path.join(pasta, f"2_1_{base}_em_linhas{ext}")
+
+    partes = partes_binario_para_ascii(caminho_arquivo, compress_whitespace, tamanho_bloco,
+                                       usar_mmap, formato, largura_grupo)
 
-    # Grava o arquivo 2_1_..._em_linhas.txt
-    with open(arquivo_ascii, "w", encoding="utf-8") as f:
-        f.write(ascii_texto)
+    # grava 1_..._em_linhas (8 bits por linha) e 2_1_..._em_linhas (ASCII, espaços -> quebras de linha)
+    # parte a parte, sem manter o arquivo inteiro em memória nos leitores em fluxo
+    with open(arquivo_em_linhas, "w", encoding="utf-8") as f_linhas, \
+            open(arquivo_ascii, "w", encoding="utf-8") as f_ascii:
+        separador = ""
+        for linhas_processadas, ascii_parcial in partes:
+            if not linhas_processadas:
+                continue
+            f_linhas.write(separador + "\n".join(linhas_processadas))
+            separador = "\n"
+            f_ascii.write(ascii_parcial.replace(" ", "\n"))
 
     if DEBUG:
         print(f"Arquivo gerado: {arquivo_em_linhas}")
@@ -956,6 +1077,18 @@ def decodificar_binario_para_ascii(caminho_arquivo: str, compress_whitespace: bo
 
 
 
+def tokens_tratados(texto: str) -> List[str]:
+    """
+    Núcleo de tratamento_palavras: lista de tokens (um por linha no arquivo 3_).
+    Usa o tokenizador compartilhado (tokenizador.palavras_pontuacao):
+      - primeiro captura "--"
+      - depois captura qualquer um dos símbolos simples (inclui aspas duplas)
+      - ou captura sequências de caracteres que não sejam whitespace nem esses símbolos
+    Nenhum token gerado é vazio ou só whitespace.
+    """
+    return palavras_pontuacao(texto)
+
+
 def tratamento_palavras(caminho_arquivo: str) -> str:
     """
     Lê um arquivo de texto e normaliza os tokens, deixando cada palavra/token
@@ -981,17 +1114,7 @@ def tratamento_palavras(caminho_arquivo: str) -> str:
     with open(caminho_arquivo, "r", encoding="utf-8") as f:
         texto = f.read()
 
-    # Expressão regular:
-    # - primeiro captura "--"
-    # - depois captura qualquer um dos símbolos simples (inclui aspas duplas agora)
-    # - ou captura sequências de caracteres que não sejam whitespace nem esses símbolos
-    token_pattern = re.compile(r'--|["\'&,\.\-`]|[^\s"\'&,\.\-`]+')
-
-    # encontra todos os tokens na ordem
-    tokens = token_pattern.findall(texto)
-
-    # filtra tokens vazios e monta linhas
-    linhas = [t for t in tokens if t and t.strip()]
+    linhas = tokens_tratados(texto)
 
     # grava arquivo de saída (cada token em sua própria linha)
     with open(caminho_saida, "w", encoding="utf-8") as f:
@@ -0,0 +1,155 @@
+"""
+pipeline_nomuque.py
+Encadeia em memória as etapas do fluxo NoMuque:
+  decodificar_binario_para_ascii -> tratamento_palavras ->
+  criar_listas_palavras_posicoes -> ordenar_matriz
+
+Cada etapa recebe o resultado estruturado da anterior (listas/matriz), sem
+gravar e reler os arquivos 1_..5_ nem importar os .py gerados. Os artefatos
+só são gravados quando salvar_artefatos() é chamado, com os mesmos nomes e
+formatos das funções baseadas em arquivo.
+
+Uso:
+    pipeline = PipelineNoMuque("mensagens/0_encoded.txt").executar()
+    pipeline.matriz_ordenada           # mesma lista que ordenar_matriz("mensagens/4_...py")
+    pipeline.salvar_artefatos()        # opcional: grava 1_, 2_1_, 3_, 4_, 5_
+"""
+
+import os
+from typing import Dict, List, Optional
+
+from funcoes_decodificador import (
+    partes_binario_para_ascii,
+    tokens_tratados,
+    matriz_palavras_posicoes,
+    gravar_matriz_palavras_posicoes,
+    ordenar_matriz,
+    gravar_matriz_ordenada,
+)
+
+# etapas na ordem do fluxo (chaves de salvar_artefatos)
+ETAPAS = ("1", "2", "3", "4", "5")
+
+
+class PipelineNoMuque:
+    """
+    Resultado de cada etapa fica em um atributo:
+      linhas_binarias  -> conteúdo de 1_<arquivo>_em_linhas (linhas de 8 bits)
+      texto_ascii      -> conteúdo de 2_1_<arquivo>_em_linhas
+      tokens           -> linhas de 3_2_1_<arquivo>_em_linhas
+      matriz           -> variável `matriz` de 4_3_2_1_<arquivo>_em_linhas.py
+      matriz_ordenada  -> variável `matriz` de 5_4_3_2_1_<arquivo>_em_linhas.py
+    Os parâmetros de leitura são os de decodificar_binario_para_ascii.
+    """
+
+    def __init__(self, caminho_arquivo: str, compress_whitespace: bool = True,
+                 tamanho_bloco: Optional[int] = None, usar_mmap: bool = False,
+                 formato: str = "bits", largura_grupo: Optional[int] = None):
+        self.caminho_arquivo = caminho_arquivo
+        self.compress_whitespace = compress_whitespace
+        self.tamanho_bloco = tamanho_bloco
+        self.usar_mmap = usar_mmap
+        self.formato = formato
+        self.largura_grupo = largura_grupo
+
+        self.linhas_binarias: Optional[List[str]] = None
+        self.texto_ascii: Optional[str] = None
+        self.tokens: Optional[List[str]] = None
+        self.matriz: Optional[List[list]] = None
+        self.matriz_ordenada: Optional[List[list]] = None
+
+    # ---------------------------
+    # Etapas
+    # ---------------------------
+    def decodificar(self) -> "PipelineNoMuque":
+        """Etapas 1 e 2: linhas de 8 bits e texto ASCII (espaços -> quebras de linha)."""
+        linhas, textos = [], []
+        for linhas_processadas, ascii_parcial in partes_binario_para_ascii(
+                self.caminho_arquivo, self.compress_whitespace, self.tamanho_bloco,
+                self.usar_mmap, self.formato, self.largura_grupo):
+            linhas.extend(linhas_processadas)
+            textos.append(ascii_parcial.replace(" ", "\n"))
+        self.linhas_binarias = linhas
+        self.texto_ascii = "".join(textos)
+        return self
+
+    def tratar_palavras(self) -> "PipelineNoMuque":
+        """Etapa 3: um token (palavra ou pontuação) por item."""
+        if self.texto_ascii is None:
+            self.decodificar()
+        self.tokens = tokens_tratados(self.texto_ascii)
+        return self
+
+    def criar_matriz(self) -> "PipelineNoMuque":
+        """Etapa 4: [[palavra, posicao], ...]."""
+        if self.tokens is None:
+            self.tratar_palavras()
+        self.matriz = matriz_palavras_posicoes(self.tokens)
+        return self
+
+    def ordenar(self) -> "PipelineNoMuque":
+        """Etapa 5: matriz ordenada por ordenar_matriz (sem gravar arquivo)."""
+        if self.matriz is None:
+            self.criar_matriz()
+        self.matriz_ordenada = ordenar_matriz(self.matriz)
+        return self
+
+    def executar(self) -> "PipelineNoMuque":
+        """Roda todas as etapas em memória."""
+        return self.decodificar().tratar_palavras().criar_matriz().ordenar()
+
+    # ---------------------------
+    # Artefatos (somente sob demanda)
+    # ---------------------------
+    def caminhos_artefatos(self) -> Dict[str, str]:
+        """Nomes que a cadeia baseada em arquivos geraria para cada etapa."""
+        pasta, nome_arquivo = os.path.split(self.caminho_arquivo)
+        base, ext = os.path.splitext(nome_arquivo)
+        nome_1 = f"1_{base}_em_linhas{ext}"
+        nome_2 = f"2_{nome_1}"
+        nome_3 = f"3_{nome_2}"
+        nome_4 = f"4_{os.path.splitext(nome_3)[0]}.py"
+        nome_5 = f"5_{nome_4}"
+        return {
+            etapa: os.path.join(pasta, nome)
+            for etapa, nome in zip(ETAPAS, (nome_1, nome_2, nome_3, nome_4, nome_5))
+        }
+
+    def salvar_artefatos(self, etapas=ETAPAS) -> Dict[str, str]:
+        """
+        Grava os arquivos das etapas pedidas (padrão: todas), rodando as etapas
+        que ainda faltam. Retorna {etapa: caminho}.
+        """
+        caminhos = self.caminhos_artefatos()
+        gravados = {}
+        for etapa in etapas:
+            if etapa not in caminhos:
+                raise ValueError(f"Etapa inválida: {etapa!r} (use uma de {ETAPAS})")
+            caminho = caminhos[etapa]
+
+            if etapa == "1":
+                if self.linhas_binarias is None:
+                    self.decodificar()
+                with open(caminho, "w", encoding="utf-8") as f:
+                    f.write("\n".join(self.linhas_binarias))
+            elif etapa == "2":
+                if self.texto_ascii is None:
+                    self.decodificar()
+                with open(caminho, "w", encoding="utf-8") as f:
+                    f.write(self.texto_ascii)
+            elif etapa == "3":
+                if self.tokens is None:
+                    self.tratar_palavras()
+                with open(caminho, "w", encoding="utf-8") as f:
+                    f.write("\n".join(self.tokens))
+            elif etapa == "4":
+                if self.matriz is None:
+                    self.criar_matriz()
+                gravar_matriz_palavras_posicoes(caminho, self.matriz)
+            else:
+                if self.matriz_ordenada is None:
+                    self.ordenar()
+                gravar_matriz_ordenada(caminho, self.matriz_ordenada)
+
+            gravados[etapa] = caminho
+        return gravados